@@ -1,36 +1,56 @@
 """Performance optimization - Get faster at repeated tasks."""
 
+import math
+from dataclasses import dataclass
 from typing import Any
 
 
+@dataclass(slots=True)
+class TaskStats:
+    """Running totals of a task's execution times."""
+
+    count: int = 0
+    total_time: float = 0.0
+    best_time: float = math.inf
+
+    def add(self, duration: float) -> None:
+        """Fold one execution time into the totals."""
+        self.count += 1
+        self.total_time += duration
+        if duration < self.best_time:
+            self.best_time = duration
+
+
 class PerformanceOptimizer:
     """Get faster at repeated tasks."""
 
     def __init__(self) -> None:
-        self.task_times: dict[str, list[float]] = {}
+        # O(1) memory per task however long the robot runs
+        self.task_stats: dict[str, TaskStats] = {}
         self.optimizations: dict[str, list[str]] = {}
 
     def record_execution(self, task: str, duration: float) -> None:
         """Record task execution time."""
-        if task not in self.task_times:
-            self.task_times[task] = []
-        self.task_times[task].append(duration)
+        stats = self.task_stats.get(task)
+        if stats is None:
+            stats = self.task_stats[task] = TaskStats()
+        stats.add(duration)
 
     def identify_optimization(self, task: str) -> dict[str, Any]:
         """Identify optimization opportunities."""
-        if task not in self.task_times or len(self.task_times[task]) < 3:
+        stats = self.task_stats.get(task)
+        if stats is None or stats.count < 3:
             return {"task": task, "optimizations": [], "potential_speedup": 0.0}
 
-        times = self.task_times[task]
-        avg_time = sum(times) / len(times)
-        best_time = min(times)
+        avg_time = stats.total_time / stats.count
+        best_time = stats.best_time
 
         potential_speedup = (avg_time - best_time) / avg_time if avg_time > 0 else 0
 
         optimizations = []
         if potential_speedup > 0.2:
             optimizations.append("cache_intermediate_results")
-        if len(times) > 10:
+        if stats.count > 10:
             optimizations.append("learn_shortcuts")
 
         return {
@@ -2,6 +2,36 @@
 
 from typing import Any
 
+_WEIGHTS = {"goal": 0.4, "context": 0.3, "constraints": 0.3}
+
+
+def _overlap(problem_items: set[Any], case_items: set[Any]) -> float:
+    """Fraction of shared items, relative to the larger set."""
+    return len(problem_items & case_items) / max(len(problem_items), len(case_items), 1)
+
+
+def _similarity(
+    goal: Any,
+    problem_context: set[Any],
+    problem_constraints: set[Any],
+    case: dict[str, Any],
+) -> float:
+    """Weighted goal, context and constraint match against one case."""
+    score = 0.0
+
+    if goal == case.get("goal"):
+        score += _WEIGHTS["goal"]
+
+    case_context = set(case.get("context", []))
+    if problem_context & case_context:
+        score += _WEIGHTS["context"] * _overlap(problem_context, case_context)
+
+    case_constraints = set(case.get("constraints", []))
+    if problem_constraints & case_constraints:
+        score += _WEIGHTS["constraints"] * _overlap(problem_constraints, case_constraints)
+
+    return score
+
 
 class AnalogicalReasoning:
     """Find similar past problems and adapt solutions to new contexts."""
@@ -12,13 +42,12 @@ class AnalogicalReasoning:
 
     def solve_novel_problem(self, problem: dict[str, Any]) -> dict[str, Any]:
         """Solve new problem using analogical reasoning."""
-        similar_case = self.find_most_similar(problem)
+        similar_case, confidence = self._best_match(problem)
 
         if not similar_case:
             return {"success": False, "reason": "no_similar_case"}
 
         adapted = self.adapt_solution(similar_case, problem)
-        confidence = self.calculate_similarity(problem, similar_case)
 
         return {
             "success": True,
@@ -30,44 +59,39 @@ class AnalogicalReasoning:
 
     def find_most_similar(self, problem: dict[str, Any]) -> dict[str, Any] | None:
         """Find most similar case from library."""
+        return self._best_match(problem)[0]
+
+    def _best_match(
+        self, problem: dict[str, Any]
+    ) -> tuple[dict[str, Any] | None, float]:
+        """Find most similar case and its score, building problem sets once."""
+        goal = problem.get("goal")
+        problem_context = set(problem.get("context", []))
+        problem_constraints = set(problem.get("constraints", []))
+
         best_match = None
         best_score = 0.0
 
         for case in self.case_library:
-            score = self.calculate_similarity(problem, case)
+            score = _similarity(goal, problem_context, problem_constraints, case)
             if score > best_score:
                 best_score = score
                 best_match = case
 
-        return best_match if best_score > 0.3 else None
+        if best_score > 0.3:
+            return best_match, best_score
+        return None, 0.0
 
     def calculate_similarity(
         self, problem: dict[str, Any], case: dict[str, Any]
     ) -> float:
         """Calculate similarity between problem and case."""
-        score = 0.0
-        weights = {"goal": 0.4, "context": 0.3, "constraints": 0.3}
-
-        if problem.get("goal") == case.get("goal"):
-            score += weights["goal"]
-
-        problem_context = set(problem.get("context", []))
-        case_context = set(case.get("context", []))
-        if problem_context & case_context:
-            overlap = len(problem_context & case_context) / max(
-                len(problem_context), len(case_context), 1
-            )
-            score += weights["context"] * overlap
-
-        problem_constraints = set(problem.get("constraints", []))
-        case_constraints = set(case.get("constraints", []))
-        if problem_constraints & case_constraints:
-            overlap = len(problem_constraints & case_constraints) / max(
-                len(problem_constraints), len(case_constraints), 1
-            )
-            score += weights["constraints"] * overlap
-
-        return score
+        return _similarity(
+            problem.get("goal"),
+            set(problem.get("context", [])),
+            set(problem.get("constraints", [])),
+            case,
+        )
 
     def adapt_solution(
         self, source_case: dict[str, Any], target_problem: dict[str, Any]
@@ -2,12 +2,18 @@
 
 from typing import Any
 
+_SEVERITY_RANK = {"low": 1, "medium": 2, "high": 3, "critical": 4}
+
 
 class CausalReasoningCreative:
     """Build causal models to predict action outcomes."""
 
     def __init__(self) -> None:
         self.causal_rules = self._build_causal_rules()
+        # Rules grouped by action type, so a prediction only checks its own rules
+        self._rules_by_action: dict[str, list[dict[str, Any]]] = {}
+        for rule in self.causal_rules:
+            self._rules_by_action.setdefault(rule["action"], []).append(rule)
 
     def predict_outcome(
         self, action: dict[str, Any], context: dict[str, Any]
@@ -34,7 +40,7 @@ class CausalReasoningCreative:
         action_type = action.get("type", "")
 
         # Apply causal rules
-        for rule in self.causal_rules:
+        for rule in self._rules_by_action.get(action_type, ()):
             if self._rule_applies(rule, action_type, context):
                 effect = rule["effect"].copy()
                 effect["probability"] = self._calculate_probability(rule, context)
@@ -132,12 +138,7 @@ class CausalReasoningCreative:
             return "low"
 
         max_severity = max(
-            (
-                {"low": 1, "medium": 2, "high": 3, "critical": 4}.get(
-                    r["severity"], 2
-                )
-                for r in risks
-            ),
+            (_SEVERITY_RANK.get(r["severity"], 2) for r in risks),
             default=1,
         )
 
@@ -3,11 +3,25 @@
 from typing import Any
 
 
+def _unique_features(
+    features_a: frozenset[str], features_b: frozenset[str], name_a: str, name_b: str
+) -> list[dict[str, Any]]:
+    """Features found in only one concept, tagged with their source."""
+    combined = [{"feature": feat, "source": name_a} for feat in features_a - features_b]
+    combined.extend({"feature": feat, "source": name_b} for feat in features_b - features_a)
+    return combined
+
+
 class ConceptualBlending:
     """Blend concepts to generate novel solutions."""
 
     def __init__(self) -> None:
         self.concept_library = self._build_concept_library()
+        # Feature sets are fixed once the library is built, so blends reuse them
+        self._feature_sets: dict[str, frozenset[str]] = {
+            name: frozenset(data.get("features", []))
+            for name, data in self.concept_library.items()
+        }
 
     def blend_concepts(
         self, concept_a: str, concept_b: str
@@ -22,8 +36,10 @@ class ConceptualBlending:
                 "message": "One or both concepts not found",
             }
 
-        shared = self.find_commonalities(data_a, data_b)
-        novel = self.combine_unique_features(data_a, data_b)
+        features_a = self._feature_sets[concept_a]
+        features_b = self._feature_sets[concept_b]
+        shared = list(features_a & features_b)
+        novel = _unique_features(features_a, features_b, data_a["name"], data_b["name"])
         new_concept = self.synthesize_new_concept(shared, novel, concept_a, concept_b)
 
         return {
@@ -47,19 +63,12 @@ class ConceptualBlending:
         self, concept_a: dict[str, Any], concept_b: dict[str, Any]
     ) -> list[dict[str, Any]]:
         """Combine unique features from both concepts."""
-        features_a = set(concept_a.get("features", []))
-        features_b = set(concept_b.get("features", []))
-
-        unique_a = features_a - features_b
-        unique_b = features_b - features_a
-
-        combined = []
-        for feat in unique_a:
-            combined.append({"feature": feat, "source": concept_a["name"]})
-        for feat in unique_b:
-            combined.append({"feature": feat, "source": concept_b["name"]})
-
-        return combined
+        return _unique_features(
+            frozenset(concept_a.get("features", [])),
+            frozenset(concept_b.get("features", [])),
+            concept_a["name"],
+            concept_b["name"],
+        )
 
     def synthesize_new_concept(
         self,
@@ -2,6 +2,35 @@
 
 from typing import Any
 
+# Hypotheses per situation type, in priority order
+_HYPOTHESES_BY_TYPE: dict[str, tuple[str, ...]] = {
+    "object_not_found": (
+        "Object is in usual location",
+        "Object was moved by human",
+        "Object is in storage",
+    ),
+    "unexpected_obstacle": (
+        "Obstacle is temporary",
+        "Obstacle is movable",
+        "Alternative path exists",
+    ),
+    "sensor_anomaly": (
+        "Sensor is malfunctioning",
+        "Environment changed",
+        "Calibration needed",
+    ),
+}
+
+# Simulated (confirms, confidence, outcome) per experiment action
+_SIMULATED_OUTCOMES: dict[str, tuple[bool, float, str]] = {
+    "navigate_and_scan": (True, 0.7, "object_found"),
+    "ask_human": (True, 0.9, "confirmation"),
+    "search_area": (True, 0.6, "object_found"),
+    "wait_and_rescan": (False, 0.3, "still_blocked"),
+    "attempt_move": (True, 0.8, "obstacle_moved"),
+    "scan_for_paths": (True, 0.85, "path_found"),
+}
+
 
 class HypothesisTesting:
     """Generate and test hypotheses for unknown situations."""
@@ -57,73 +86,11 @@ class HypothesisTesting:
         self, situation: dict[str, Any]
     ) -> list[dict[str, Any]]:
         """Generate plausible hypotheses about situation."""
-        hypotheses = []
-        situation_type = situation.get("type", "unknown")
-
-        if situation_type == "object_not_found":
-            hypotheses.extend(
-                [
-                    {
-                        "hypothesis": "Object is in usual location",
-                        "testable": True,
-                        "priority": 1,
-                    },
-                    {
-                        "hypothesis": "Object was moved by human",
-                        "testable": True,
-                        "priority": 2,
-                    },
-                    {
-                        "hypothesis": "Object is in storage",
-                        "testable": True,
-                        "priority": 3,
-                    },
-                ]
-            )
-
-        elif situation_type == "unexpected_obstacle":
-            hypotheses.extend(
-                [
-                    {
-                        "hypothesis": "Obstacle is temporary",
-                        "testable": True,
-                        "priority": 1,
-                    },
-                    {
-                        "hypothesis": "Obstacle is movable",
-                        "testable": True,
-                        "priority": 2,
-                    },
-                    {
-                        "hypothesis": "Alternative path exists",
-                        "testable": True,
-                        "priority": 3,
-                    },
-                ]
-            )
-
-        elif situation_type == "sensor_anomaly":
-            hypotheses.extend(
-                [
-                    {
-                        "hypothesis": "Sensor is malfunctioning",
-                        "testable": True,
-                        "priority": 1,
-                    },
-                    {
-                        "hypothesis": "Environment changed",
-                        "testable": True,
-                        "priority": 2,
-                    },
-                    {
-                        "hypothesis": "Calibration needed",
-                        "testable": True,
-                        "priority": 3,
-                    },
-                ]
-            )
-
-        return sorted(hypotheses, key=lambda h: h["priority"])
+        hypotheses = _HYPOTHESES_BY_TYPE.get(situation.get("type", "unknown"), ())
+        return [
+            {"hypothesis": text, "testable": True, "priority": priority}
+            for priority, text in enumerate(hypotheses, 1)
+        ]
 
     def design_test(
         self, hypothesis: dict[str, Any], situation: dict[str, Any]
@@ -177,28 +144,10 @@ class HypothesisTesting:
 
     def simulate_test(self, experiment: dict[str, Any]) -> dict[str, Any]:
         """Simulate test execution (in real system, would execute)."""
-        action = experiment["action"]
-
-        # Simulate different outcomes based on action
-        if action == "navigate_and_scan":
-            return {"confirms": True, "confidence": 0.7, "outcome": "object_found"}
-
-        if action == "ask_human":
-            return {"confirms": True, "confidence": 0.9, "outcome": "confirmation"}
-
-        if action == "search_area":
-            return {"confirms": True, "confidence": 0.6, "outcome": "object_found"}
-
-        if action == "wait_and_rescan":
-            return {"confirms": False, "confidence": 0.3, "outcome": "still_blocked"}
-
-        if action == "attempt_move":
-            return {"confirms": True, "confidence": 0.8, "outcome": "obstacle_moved"}
-
-        if action == "scan_for_paths":
-            return {"confirms": True, "confidence": 0.85, "outcome": "path_found"}
-
-        return {"confirms": False, "confidence": 0.5, "outcome": "inconclusive"}
+        confirms, confidence, outcome = _SIMULATED_OUTCOMES.get(
+            experiment["action"], (False, 0.5, "inconclusive")
+        )
+        return {"confirms": confirms, "confidence": confidence, "outcome": outcome}
 
     def get_learning(self) -> list[dict[str, Any]]:
         """Extract learning from tested hypotheses."""
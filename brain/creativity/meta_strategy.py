@@ -1,15 +1,55 @@
 """Meta-strategy selection - choose the right thinking approach for each problem."""
 
+import re
 from collections.abc import Callable
 from typing import Any
 
+_STRATEGY_MAP = {
+    "routine": "cached_solution",
+    "novel": "analogical_reasoning",
+    "impossible": "constraint_relaxation",
+    "ambiguous": "information_gathering",
+    "complex": "hierarchical_decomposition",
+    "uncertain": "probabilistic_reasoning",
+    "creative": "conceptual_blending",
+}
+
+_EXPLANATIONS = {
+    "routine": "Problem is familiar, using cached solution for efficiency",
+    "novel": "Problem is new, using analogical reasoning from similar cases",
+    "impossible": "Problem seems impossible, trying constraint relaxation",
+    "ambiguous": "Problem is unclear, gathering more information first",
+    "complex": "Problem is complex, breaking into smaller sub-problems",
+    "uncertain": "Problem has uncertainty, using probabilistic reasoning",
+    "creative": "Problem needs creativity, using conceptual blending",
+}
+
+
+def _keyword_pattern(keywords: list[str]) -> re.Pattern[str] | None:
+    """Compile keywords into one substring alternation (None if there are none)."""
+    if not keywords:
+        return None
+    return re.compile("|".join(map(re.escape, keywords)))
+
 
 class MetaStrategy:
     """Select appropriate reasoning strategy based on problem type."""
 
+    # Classifications kept before the cache is reset
+    max_cached_classes = 1024
+
     def __init__(self) -> None:
         self.strategies: dict[str, Callable[[dict[str, Any]], dict[str, Any]]] = {}
         self.problem_classifiers: list[dict[str, Any]] = self._build_classifiers()
+        # One alternation per classifier, so its keywords are found in a
+        # single scan of the description
+        self._keyword_patterns = [
+            _keyword_pattern(classifier.get("keywords", []))
+            for classifier in self.problem_classifiers
+        ]
+        self._class_cache: dict[tuple, str] = {}
+        self._cache_hits = 0
+        self._cache_misses = 0
 
     def select_strategy(self, problem: dict[str, Any]) -> dict[str, Any]:
         """Select best strategy for problem type."""
@@ -27,20 +67,51 @@ class MetaStrategy:
         problem_text = problem.get("description", "").lower()
         problem_context = problem.get("context", {})
 
-        # Check each classifier
-        for classifier in self.problem_classifiers:
-            if self._matches_classifier(classifier, problem_text, problem_context):
+        # Classification is pure in (description, context), so repeated
+        # problem shapes are answered from the cache
+        try:
+            key = (problem_text, tuple(sorted(problem_context.items())))
+            cached = self._class_cache.get(key)
+        except TypeError:  # unhashable or unorderable context values
+            return self._classify(problem_text, problem_context)
+
+        if cached is not None:
+            self._cache_hits += 1
+            return cached
+
+        self._cache_misses += 1
+        if len(self._class_cache) >= self.max_cached_classes:
+            self._class_cache.clear()
+        cached = self._class_cache[key] = self._classify(problem_text, problem_context)
+        return cached
+
+    def stats(self) -> dict[str, int]:
+        """Classification cache statistics."""
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "size": len(self._class_cache),
+            "max_size": self.max_cached_classes,
+        }
+
+    def _classify(self, text: str, context: dict[str, Any]) -> str:
+        """Run the classifiers over lowercased text and context."""
+        for classifier, pattern in zip(self.problem_classifiers, self._keyword_patterns):
+            if self._matches_classifier(classifier, pattern, text, context):
                 return str(classifier["class"])
 
         return "novel"  # Default for unrecognized problems
 
     def _matches_classifier(
-        self, classifier: dict[str, Any], text: str, context: dict[str, Any]
+        self,
+        classifier: dict[str, Any],
+        pattern: re.Pattern[str] | None,
+        text: str,
+        context: dict[str, Any],
     ) -> bool:
         """Check if problem matches classifier."""
         # Check keywords
-        keywords = classifier.get("keywords", [])
-        if keywords and any(kw in text for kw in keywords):
+        if pattern is not None and pattern.search(text):
             return True
 
         # Check context conditions
@@ -54,29 +125,11 @@ class MetaStrategy:
 
     def _get_strategy_for_class(self, problem_class: str) -> str:
         """Get strategy name for problem class."""
-        strategy_map = {
-            "routine": "cached_solution",
-            "novel": "analogical_reasoning",
-            "impossible": "constraint_relaxation",
-            "ambiguous": "information_gathering",
-            "complex": "hierarchical_decomposition",
-            "uncertain": "probabilistic_reasoning",
-            "creative": "conceptual_blending",
-        }
-        return strategy_map.get(problem_class, "general_planning")
+        return _STRATEGY_MAP.get(problem_class, "general_planning")
 
     def _explain_selection(self, problem_class: str, strategy: str) -> str:
         """Explain why strategy was selected."""
-        explanations = {
-            "routine": "Problem is familiar, using cached solution for efficiency",
-            "novel": "Problem is new, using analogical reasoning from similar cases",
-            "impossible": "Problem seems impossible, trying constraint relaxation",
-            "ambiguous": "Problem is unclear, gathering more information first",
-            "complex": "Problem is complex, breaking into smaller sub-problems",
-            "uncertain": "Problem has uncertainty, using probabilistic reasoning",
-            "creative": "Problem needs creativity, using conceptual blending",
-        }
-        return explanations.get(
+        return _EXPLANATIONS.get(
             problem_class, "Using general planning for unclassified problem"
         )
 
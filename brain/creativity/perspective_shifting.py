@@ -3,6 +3,11 @@
 from typing import Any
 
 
+def _solution_score(solution: dict[str, Any]) -> float:
+    """Weighted balance of novelty and practicality."""
+    return float((solution["novelty"] * 0.3) + (solution["practicality"] * 0.7))
+
+
 class PerspectiveShifting:
     """Solve problems by viewing from different perspectives."""
 
@@ -109,14 +114,8 @@ class PerspectiveShifting:
         self, solutions: list[dict[str, Any]]
     ) -> dict[str, Any]:
         """Synthesize best solution from multiple perspectives."""
-        # Score each solution
-        scored = []
-        for sol in solutions:
-            score = (sol["novelty"] * 0.3) + (sol["practicality"] * 0.7)
-            scored.append({"solution": sol, "score": score})
-
         # Get best
-        best = max(scored, key=lambda x: x["score"])
+        best = max(solutions, key=_solution_score)
 
         # Combine insights from multiple perspectives
         combined_actions = []
@@ -125,11 +124,11 @@ class PerspectiveShifting:
                 combined_actions.extend(sol["solution"]["actions"])
 
         return {
-            "primary_perspective": best["solution"]["perspective"],
-            "approach": best["solution"]["solution"]["approach"],
+            "primary_perspective": best["perspective"],
+            "approach": best["solution"]["approach"],
             "combined_actions": list(set(combined_actions)),
-            "overall_score": best["score"],
-            "reasoning": f"Best balance of novelty and practicality from {best['solution']['perspective']} view",
+            "overall_score": _solution_score(best),
+            "reasoning": f"Best balance of novelty and practicality from {best['perspective']} view",
         }
 
     def _build_perspectives(self) -> dict[str, Any]:
@@ -8,6 +8,20 @@ class SerendipityEngine:
 
     def __init__(self) -> None:
         self.opportunity_patterns = self._build_opportunity_patterns()
+        # Patterns grouped by required state, so an object only checks the
+        # patterns its state can satisfy; stateless patterns join every group
+        self._stateless_patterns = [
+            p for p in self.opportunity_patterns if not p.get("required_state")
+        ]
+        self._patterns_by_state: dict[str, list[dict[str, Any]]] = {}
+        for pattern in self.opportunity_patterns:
+            state = pattern.get("required_state")
+            if state and state not in self._patterns_by_state:
+                self._patterns_by_state[state] = [
+                    p
+                    for p in self.opportunity_patterns
+                    if not p.get("required_state") or p["required_state"] == state
+                ]
 
     def detect_opportunities(
         self, current_state: dict[str, Any]
@@ -37,7 +51,8 @@ class SerendipityEngine:
         obj_name = obj.get("name", "")
         obj_state = obj.get("state", "")
 
-        for pattern in self.opportunity_patterns:
+        patterns = self._patterns_by_state.get(obj_state, self._stateless_patterns)
+        for pattern in patterns:
             if self._matches_pattern(pattern, obj_name, obj_state, location):
                 return self.create_optional_goal(pattern, obj, location)
 
@@ -8,26 +8,36 @@ class ToolImprovisation:
 
     def __init__(self) -> None:
         self.function_mappings = self._build_function_mappings()
+        # Each required property gets one bit, so property matching is a
+        # single AND of integer masks; other properties can never match
+        self._property_bits: dict[str, int] = {}
+        self._required_masks: dict[str, int] = {}
+        self._standard_tools: dict[str, frozenset[str]] = {}
+        for function, data in self.function_mappings.items():
+            mask = 0
+            for prop in data.get("required_properties", []):
+                bit = self._property_bits.setdefault(prop, 1 << len(self._property_bits))
+                mask |= bit
+            self._required_masks[function] = mask
+            self._standard_tools[function] = frozenset(data.get("standard_tools", []))
 
     def find_alternative_tool(
         self, needed_function: str, available_objects: list[dict[str, Any]]
     ) -> dict[str, Any]:
         """Find object that can perform needed function."""
         candidates = []
+        required = self._required_masks.get(needed_function, 0)
+        standard_tools = self._standard_tools.get(needed_function, frozenset())
 
         for obj in available_objects:
-            if self.can_perform_function(obj, needed_function):
-                method = self.how_to_use(obj, needed_function)
-                confidence = self.calculate_confidence(obj, needed_function)
+            mask = self._property_mask(obj)
+            if mask & required:
                 candidates.append(
                     {
                         "object": obj["name"],
-                        "method": method,
-                        "confidence": confidence,
-                        "improvised": obj["name"]
-                        not in self.function_mappings.get(needed_function, {}).get(
-                            "standard_tools", []
-                        ),
+                        "method": self.how_to_use(obj, needed_function),
+                        "confidence": self._confidence(obj["name"], mask, needed_function),
+                        "improvised": obj["name"] not in standard_tools,
                     }
                 )
 
@@ -44,12 +54,15 @@ class ToolImprovisation:
         self, obj: dict[str, Any], function: str
     ) -> bool:
         """Check if object can perform function."""
-        obj_properties = set(obj.get("properties", []))
-        required_properties = set(
-            self.function_mappings.get(function, {}).get("required_properties", [])
-        )
+        return bool(self._property_mask(obj) & self._required_masks.get(function, 0))
 
-        return bool(required_properties & obj_properties)
+    def _property_mask(self, obj: dict[str, Any]) -> int:
+        """Bitmask of the object's properties that some function requires."""
+        bits = self._property_bits
+        mask = 0
+        for prop in obj.get("properties", []):
+            mask |= bits.get(prop, 0)
+        return mask
 
     def how_to_use(self, obj: dict[str, Any], function: str) -> str:
         """Generate instructions for using object."""
@@ -80,17 +93,17 @@ class ToolImprovisation:
 
     def calculate_confidence(self, obj: dict[str, Any], function: str) -> float:
         """Calculate confidence in improvised tool."""
-        obj_name = obj["name"]
-        function_data = self.function_mappings.get(function, {})
+        return self._confidence(obj["name"], self._property_mask(obj), function)
 
+    def _confidence(self, obj_name: str, mask: int, function: str) -> float:
+        """Confidence from a precomputed property mask."""
         # Standard tool = high confidence
-        if obj_name in function_data.get("standard_tools", []):
+        if obj_name in self._standard_tools.get(function, ()):
             return 0.95
 
         # Check property match
-        obj_properties = set(obj.get("properties", []))
-        required = set(function_data.get("required_properties", []))
-        match_ratio = len(obj_properties & required) / max(len(required), 1)
+        required = self._required_masks.get(function, 0)
+        match_ratio = (mask & required).bit_count() / max(required.bit_count(), 1)
 
         # Improvised tool = lower confidence
         return 0.4 + (match_ratio * 0.4)
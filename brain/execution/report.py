@@ -1,5 +1,6 @@
 """Execution reporting structures"""
 
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -13,7 +14,7 @@ class ExecutionStatus(Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionResult:
     """Result of a single action execution"""
 
@@ -37,3 +38,9 @@ class ExecutionReport:
         """Add action result to report"""
         self.results.append(result)
         self.total_duration += result.duration
+
+    def extend_results(self, results: Iterable[ActionResult]) -> None:
+        """Add several action results to report at once"""
+        start = len(self.results)
+        self.results.extend(results)
+        self.total_duration += sum(result.duration for result in self.results[start:])
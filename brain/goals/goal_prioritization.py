@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Goal:
     """A goal with priority attributes."""
 
@@ -18,13 +18,8 @@ class GoalPrioritizer:
 
     def prioritize(self, goals: list[Goal]) -> list[Goal]:
         """Prioritize goals using Eisenhower matrix."""
-        scored_goals = []
-        for goal in goals:
-            score = self._calculate_priority_score(goal)
-            scored_goals.append((goal, score))
-
-        scored_goals.sort(key=lambda x: x[1], reverse=True)
-        return [g for g, _ in scored_goals]
+        # sorted computes each key once and is stable, so ties keep input order
+        return sorted(goals, key=self._calculate_priority_score, reverse=True)
 
     def _calculate_priority_score(self, goal: Goal) -> float:
         """Calculate priority score."""
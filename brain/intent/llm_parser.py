@@ -1,11 +1,36 @@
 """LLM-powered intent parser using open-source models"""
 
+import re
+
 from brain.intent.schema import Goal
 
+_OLLAMA_GENERATE_URL = "http://localhost:11434/api/generate"
+
+_ACTION_CHOICES = "bring/greet/entertain/emotional_support/explore/navigate/grasp"
+
+# Keyword in the LLM's reply -> goal action
+_ACTION_MAP = {
+    "bring": "bring",
+    "greet": "greet",
+    "entertain": "entertain",
+    "emotional": "emotional_support",
+    "explore": "explore",
+    "navigate": "navigate",
+    "grasp": "grasp",
+    "help": "collaborate",
+    "question": "answer_question"
+}
+
+# "3. bring" / "3) bring" / "3: bring" lines of a batched reply
+_NUMBERED_LINE = re.compile(r"^\s*(\d+)\s*[.):]\s*(.*)$")
+
 
 class LLMIntentParser:
     """Parse intents using open-source LLM (Ollama/Llama)"""
 
+    # Inputs per batched request, keeping each reply within _generate's timeout
+    max_batch_size = 8
+
     def __init__(self, use_llm: bool = True):
         self.use_llm = use_llm
         self.llm_available = False
@@ -27,24 +52,69 @@ class LLMIntentParser:
         else:
             return self._parse_rule_based(human_input)
 
+    def parse_batch(self, human_inputs: list[str]) -> list[Goal]:
+        """Parse several inputs, asking the LLM about up to max_batch_size per request
+
+        Inputs the reply doesn't cover fall back to the rule-based parser.
+        """
+        if not self.llm_available:
+            return [self._parse_rule_based(text) for text in human_inputs]
+
+        goals = []
+        for start in range(0, len(human_inputs), self.max_batch_size):
+            goals.extend(self._parse_chunk(human_inputs[start:start + self.max_batch_size]))
+        return goals
+
+    def _parse_chunk(self, human_inputs: list[str]) -> list[Goal]:
+        """Parse one batch of inputs with a single LLM request"""
+        commands = "\n".join(f"{i}. {text}" for i, text in enumerate(human_inputs, 1))
+        prompt = f"""Commands:
+{commands}
+For each command write one line '<number>. <action>' with action from ({_ACTION_CHOICES}):
+"""
+        llm_output = self._generate(prompt, num_predict=12 * len(human_inputs))
+
+        replies: dict[int, str] = {}
+        for line in (llm_output or "").splitlines():
+            match = _NUMBERED_LINE.match(line)
+            if match:
+                replies.setdefault(int(match.group(1)), match.group(2).strip().lower())
+
+        goals = []
+        for i, text in enumerate(human_inputs, 1):
+            goal = self._goal_from_llm_output(text, replies.get(i, ""))
+            goals.append(goal or self._parse_rule_based(text))
+        return goals
+
     def _parse_with_llm(self, text: str) -> Goal:
         """Use Ollama/Llama to understand intent"""
-        import requests  # type: ignore
-
         # Ultra-minimal prompt for speed
         prompt = f"""Command: {text}
-Action (bring/greet/entertain/emotional_support/explore/navigate/grasp): """
+Action ({_ACTION_CHOICES}): """
 
+        llm_output = self._generate(prompt, num_predict=10)  # Very short output
+        if llm_output is not None:
+            goal = self._goal_from_llm_output(text, llm_output.strip().lower())
+            if goal is not None:
+                return goal
+
+        # Fallback
+        return self._parse_rule_based(text)
+
+    def _generate(self, prompt: str, num_predict: int) -> str | None:
+        """Run prompt through Ollama; None if the request fails"""
         try:
+            import requests  # type: ignore
+
             response = requests.post(
-                "http://localhost:11434/api/generate",
+                _OLLAMA_GENERATE_URL,
                 json={
                     "model": "phi3:mini",  # Faster model
                     "prompt": prompt,
                     "stream": False,
                     "options": {
                         "temperature": 0.0,
-                        "num_predict": 10,  # Very short output
+                        "num_predict": num_predict,
                         "top_k": 1  # Greedy decoding for speed
                     }
                 },
@@ -52,43 +122,32 @@ Action (bring/greet/entertain/emotional_support/explore/navigate/grasp): """
             )
 
             if response.status_code == 200:
-                result = response.json()
-                llm_output = result.get("response", "").strip().lower()
-
-                # Parse simple action word from LLM
-                action_map = {
-                    "bring": "bring",
-                    "greet": "greet",
-                    "entertain": "entertain",
-                    "emotional": "emotional_support",
-                    "explore": "explore",
-                    "navigate": "navigate",
-                    "grasp": "grasp",
-                    "help": "collaborate",
-                    "question": "answer_question"
-                }
-
-                # Find matching action
-                for key, action in action_map.items():
-                    if key in llm_output:
-                        # Infer target based on action
-                        target = None
-                        if action == "bring":
-                            if "thirst" in text.lower() or "water" in text.lower():
-                                target = "water"
-                            elif "hungry" in text.lower() or "food" in text.lower():
-                                target = "food"
-                        elif action == "entertain":
-                            target = "joke"
-                        elif action == "greet":
-                            target = "human"
-
-                        return Goal(action=action, target=target, location=None)
+                return str(response.json().get("response", ""))
         except Exception:
             pass  # Silent fallback to rules
 
-        # Fallback
-        return self._parse_rule_based(text)
+        return None
+
+    def _goal_from_llm_output(self, text: str, llm_output: str) -> Goal | None:
+        """Map the LLM's (lowercased) action reply for text to a goal"""
+        # Find matching action
+        for key, action in _ACTION_MAP.items():
+            if key in llm_output:
+                # Infer target based on action
+                target = None
+                if action == "bring":
+                    if "thirst" in text.lower() or "water" in text.lower():
+                        target = "water"
+                    elif "hungry" in text.lower() or "food" in text.lower():
+                        target = "food"
+                elif action == "entertain":
+                    target = "joke"
+                elif action == "greet":
+                    target = "human"
+
+                return Goal(action=action, target=target, location=None)
+
+        return None
 
     def _parse_rule_based(self, text: str) -> Goal:
         """Fallback to rule-based parsing"""
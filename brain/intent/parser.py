@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from brain.intent.schema import Goal
 
 
@@ -6,7 +8,12 @@ class IntentParser:
 
     def parse(self, human_input: str) -> Goal:
         """Extract goal from natural language input"""
-        text = human_input.lower().strip()
+        return self._parse_normalized(human_input.lower().strip())
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _parse_normalized(text: str) -> Goal:
+        """Match normalized text against intent rules (memoized per text)"""
 
         # Greetings & Social
         if text in ["hi", "hello", "hey", "good morning", "good afternoon", "good evening"]:
@@ -23,7 +30,7 @@ class IntentParser:
             return Goal(action="answer_question", target=text)
 
         if "explain" in text or "tell me about" in text:
-            return Goal(action="explain", target=self._extract_object(text))
+            return Goal(action="explain", target=IntentParser._extract_object(text))
 
         # Greetings variations
         if any(word in text for word in ["whats up", "what's up", "sup", "wassup", "howdy", "yo"]):
@@ -50,7 +57,7 @@ class IntentParser:
 
         # Exploration & Curiosity
         if "explore" in text or "discover" in text or "find" in text:
-            location = self._extract_location(text)
+            location = IntentParser._extract_location(text)
             return Goal(action="explore", location=location)
 
         # Prediction & Planning
@@ -72,11 +79,11 @@ class IntentParser:
             return Goal(action="make_coffee", target="coffee")
 
         if "deliver" in text and "package" in text:
-            location = self._extract_location(text)
+            location = IntentParser._extract_location(text)
             return Goal(action="deliver_package", location=location)
 
         if "monitor" in text:
-            location = self._extract_location(text)
+            location = IntentParser._extract_location(text)
             return Goal(action="monitor_area", location=location)
 
         if "charge" in text or "battery" in text:
@@ -94,7 +101,7 @@ class IntentParser:
 
         # Basic tasks
         if "bring" in text or "can i have" in text or "please" in text and ("water" in text or "food" in text):
-            target = self._extract_object(text)
+            target = IntentParser._extract_object(text)
             if not target or target == "unknown":
                 # Try to infer from context
                 if "water" in text:
@@ -107,15 +114,15 @@ class IntentParser:
             return Goal(action="clean", target="room")
 
         if "navigate" in text or "go to" in text:
-            location = self._extract_location(text)
+            location = IntentParser._extract_location(text)
             return Goal(action="navigate", location=location)
 
         if "grasp" in text or "pick" in text or "grab" in text:
-            target = self._extract_object(text)
+            target = IntentParser._extract_object(text)
             return Goal(action="grasp", target=target)
 
         if "release" in text or "drop" in text or "put down" in text:
-            target = self._extract_object(text)
+            target = IntentParser._extract_object(text)
             return Goal(action="release", target=target)
 
         if "wait" in text or "pause" in text:
@@ -136,7 +143,8 @@ class IntentParser:
         # Smart fallback - ALWAYS respond
         return Goal(action="respond", target=text)
 
-    def _extract_location(self, text: str) -> str:
+    @staticmethod
+    def _extract_location(text: str) -> str:
         locations = [
             "kitchen", "bedroom", "living room", "bathroom",
             "warehouse", "charging_station", "storage", "office",
@@ -152,7 +160,8 @@ class IntentParser:
             return f"room_{match.group(1)}"
         return "unknown"
 
-    def _extract_object(self, text: str) -> str:
+    @staticmethod
+    def _extract_object(text: str) -> str:
         objects = [
             "cup", "water", "bottle", "book", "phone",
             "coffee", "package", "keys", "medicine", "table",
@@ -1,9 +1,9 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Goal:
-    """Structured representation of human intent"""
+    """Structured representation of human intent (immutable, safe to cache)"""
     action: str
     target: str | None = None
     location: str | None = None
@@ -1,6 +1,8 @@
+from collections.abc import Iterable
 from typing import Any
 
 from brain.intent.parser import IntentParser
+from brain.intent.schema import Goal
 from brain.memory.memory import Memory
 from brain.planner.actions import Action
 from brain.planner.planner import Planner
@@ -29,9 +31,59 @@ class RobotBrainKernel:
         Intent → Planning → Safety → Memory → Actions
         """
 
-        goal = self.intent_parser.parse(human_input)
-        plan = self.planner.plan(goal, world_state)
+        return self.process_prepared(world_state, human_input=human_input)
 
+    def process_prepared(
+        self,
+        world_state: WorldState,
+        goal: Goal | None = None,
+        plan: list[Action] | None = None,
+        human_input: str | None = None,
+    ) -> list[Action]:
+        """
+        Run the pipeline, skipping the stages the caller already ran.
+
+        Pass a goal to skip intent parsing and a plan to skip planning; the
+        safety and capability checks always run. Without a goal, human_input
+        is parsed as in process().
+        """
+        if goal is None:
+            if human_input is None:
+                raise ValueError("process_prepared() needs a goal or human_input")
+            goal = self._parse(human_input)
+        if plan is None:
+            plan = self._plan(goal, world_state)
+
+        self._validate(plan)
+        self._log(goal, plan)
+        return plan
+
+    def process_many(
+        self, requests: Iterable[tuple[str, WorldState]]
+    ) -> list[list[Action]]:
+        """
+        Run the process() pipeline over a batch of (human_input, world_state) pairs.
+
+        Each distinct input is parsed once and its goal reused for the rest
+        of the batch. Returns one plan per pair, in order.
+        """
+        goals: dict[str, Goal] = {}
+        plans = []
+        for human_input, world_state in requests:
+            goal = goals.get(human_input)
+            if goal is None:
+                goal = goals[human_input] = self._parse(human_input)
+            plans.append(self.process_prepared(world_state, goal=goal))
+        return plans
+
+    def _parse(self, human_input: str) -> Goal:
+        return self.intent_parser.parse(human_input)
+
+    def _plan(self, goal: Goal, world_state: WorldState) -> list[Action]:
+        return self.planner.plan(goal, world_state)
+
+    def _validate(self, plan: list[Action]) -> None:
+        """Raise ValueError if plan is unsafe or unsupported by the adapter"""
         is_safe, reason = self.safety.validate(plan)
         if not is_safe:
             raise ValueError(f"Safety check failed: {reason}")
@@ -40,11 +92,10 @@ class RobotBrainKernel:
         if self.adapter is not None:
             self._check_capabilities(plan)
 
+    def _log(self, goal: Goal, plan: list[Action]) -> None:
         plan_str = [str(action) for action in plan]
         self.memory.store(goal=str(goal), plan=plan_str)
 
-        return plan
-
     def _check_capabilities(self, plan: list[Action]) -> None:
         """Check if adapter supports all actions in plan"""
         if self.adapter is None or not hasattr(self.adapter, "capabilities"):
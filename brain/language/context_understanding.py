@@ -2,15 +2,45 @@
 
 from typing import Any
 
+# Context entries a resolution can depend on
+_REFERENCE_KEYS = ("last_object", "current_location", "last_location")
+
 
 class ContextUnderstanding:
     """'bring it here' (what is 'it'? where is 'here'?)."""
 
+    # Resolutions kept before the cache is reset
+    max_cached_resolutions = 1024
+
     def __init__(self) -> None:
         self.context: dict[str, Any] = {}
+        self._resolution_cache: dict[tuple, tuple[str, tuple[tuple[str, Any], ...]]] = {}
 
     def resolve_command(self, command: str) -> dict[str, Any]:
         """Resolve ambiguous references in command."""
+        # Keyed on the referenced context values rather than a version
+        # counter, so direct edits to self.context can't serve stale results
+        key = (command, *(self.context.get(k) for k in _REFERENCE_KEYS))
+        try:
+            cached = self._resolution_cache.get(key)
+        except TypeError:  # unhashable context values
+            cached = self._resolve(command)
+        else:
+            if cached is None:
+                if len(self._resolution_cache) >= self.max_cached_resolutions:
+                    self._resolution_cache.clear()
+                cached = self._resolution_cache[key] = self._resolve(command)
+
+        resolved, references = cached
+        return {
+            "original": command,
+            "resolved": resolved,
+            "references": list(references),
+            "fully_resolved": "unknown" not in resolved,
+        }
+
+    def _resolve(self, command: str) -> tuple[str, tuple[tuple[str, Any], ...]]:
+        """Substitute context values for pronouns in command."""
         resolved = command
         references = []
 
@@ -30,12 +60,7 @@ class ContextUnderstanding:
             resolved = resolved.replace("there", loc).replace("There", loc)
             references.append(("there", loc))
 
-        return {
-            "original": command,
-            "resolved": resolved,
-            "references": references,
-            "fully_resolved": "unknown" not in resolved,
-        }
+        return resolved, tuple(references)
 
     def update_context(self, key: str, value: Any) -> None:
         """Update context."""
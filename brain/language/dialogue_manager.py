@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class DialogueTurn:
     """A single turn in dialogue."""
 
@@ -27,7 +27,7 @@ class DialogueManager:
         self.history.append(turn)
 
         if len(self.history) > self.max_history:
-            self.history = self.history[-self.max_history:]
+            del self.history[:-self.max_history]  # trim in place, no new list
 
     def get_context(self) -> list[str]:
         """Get recent conversation context."""
@@ -5,7 +5,7 @@ from typing import Any
 from brain.planner.actions import Action
 
 
-@dataclass
+@dataclass(slots=True)
 class Threat:
     threat_type: str
     description: str
@@ -14,7 +14,7 @@ class Threat:
     affected_actions: list[int]
 
 
-@dataclass
+@dataclass(slots=True)
 class Countermeasure:
     threat: str
     strategy: str
@@ -1,7 +1,9 @@
 """Biological Neural Integration - Interface with biological neurons."""
 import random
+from collections.abc import Sequence
 from dataclasses import dataclass
 from enum import Enum
+from itertools import islice
 from typing import Any
 
 
@@ -11,7 +13,7 @@ class NeuronType(Enum):
     INTERNEURON = "interneuron"
 
 
-@dataclass
+@dataclass(slots=True)
 class BiologicalNeuron:
     neuron_id: str
     neuron_type: NeuronType
@@ -20,7 +22,7 @@ class BiologicalNeuron:
     plasticity: float
 
 
-@dataclass
+@dataclass(slots=True)
 class NeuralSignal:
     source: str
     target: str
@@ -38,8 +40,9 @@ class BioNeuralNetwork:
 
     def _grow_neurons(self, count: int):
         """Simulate growing biological neurons in lab."""
+        neuron_types = list(NeuronType)
         for i in range(count):
-            neuron_type = random.choice(list(NeuronType))
+            neuron_type = random.choice(neuron_types)
             neuron = BiologicalNeuron(
                 neuron_id=f"neuron_{i}",
                 neuron_type=neuron_type,
@@ -53,9 +56,11 @@ class BioNeuralNetwork:
         """Interface biological neurons with robot brain."""
         # Establish connections
         connection_count = 0
-        for neuron_id, neuron in list(self.neurons.items())[:100]:
+        neuron_ids = list(self.neurons)
+        sample_size = min(10, len(neuron_ids))
+        for neuron in islice(self.neurons.values(), 100):
             # Create synaptic connections
-            targets = random.sample(list(self.neurons.keys()), min(10, len(self.neurons)))
+            targets = random.sample(neuron_ids, sample_size)
             neuron.connections = targets
             connection_count += len(targets)
 
@@ -69,7 +74,7 @@ class BioNeuralNetwork:
             "neural_plasticity": "active"
         }
 
-    def stimulate(self, input_pattern: list[float]) -> list[float]:
+    def stimulate(self, input_pattern: Sequence[float]) -> list[float]:
         """Send electrical stimulation to neurons and read response."""
         output = []
 
@@ -94,23 +99,23 @@ class BioNeuralNetwork:
 
         return output
 
-    def train_neurons(self, input_patterns: list[list[float]],
-                     target_outputs: list[list[float]]) -> dict[str, float]:
-        """Train biological neurons using Hebbian learning."""
+    def train_neurons(self, input_patterns: Sequence[Sequence[float]],
+                     target_outputs: Sequence[Sequence[float]]) -> dict[str, float]:
+        """Train biological neurons using Hebbian learning (patterns are only read)."""
         learning_rate = 0.01
         total_error = 0.0
 
         for input_pat, target in zip(input_patterns, target_outputs):
             output = self.stimulate(input_pat)
-            error = sum((o - t) ** 2 for o, t in zip(output, target[:len(output)]))
+            error = sum((o - t) ** 2 for o, t in zip(output, target))
             total_error += error
 
             # Adjust plasticity (Hebbian learning)
-            for neuron in list(self.neurons.values())[:len(output)]:
+            for neuron in islice(self.neurons.values(), len(output)):
                 neuron.plasticity += learning_rate * (1.0 - error / 10.0)
                 neuron.plasticity = max(0.1, min(1.0, neuron.plasticity))
 
-        avg_error = total_error / len(input_patterns) if input_patterns else 0.0
+        avg_error = total_error / len(input_patterns) if len(input_patterns) else 0.0
 
         return {
             "training_error": avg_error,
@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class GlobalKnowledge:
     knowledge_id: str
     topic: str
@@ -16,7 +16,7 @@ class GlobalKnowledge:
     last_updated: datetime
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RobotExperience:
     robot_id: str
     task: str
@@ -5,7 +5,7 @@ from typing import Any
 from brain.planner.actions import Action
 
 
-@dataclass
+@dataclass(slots=True)
 class CounterfactualOutcome:
     action_taken: Action
     actual_outcome: str
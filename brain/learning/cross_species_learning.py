@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from brain.planner.actions import Action
 
 
-@dataclass
+@dataclass(slots=True)
 class AnimalBehavior:
     species: str
     behavior: str
@@ -110,3 +110,7 @@ class CrossSpeciesLearning:
         if species in self.behaviors:
             return list(self.behaviors[species].keys())
         return []
+
+    def total_behavior_count(self) -> int:
+        """Count behaviors across all species without building per-species lists."""
+        return sum(map(len, self.behaviors.values()))
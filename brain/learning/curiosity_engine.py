@@ -4,8 +4,24 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
+# Areas the robot may decide to explore
+_POSSIBLE_AREAS = ("kitchen", "living_room", "bedroom", "bathroom", "garage", "office")
 
-@dataclass
+# Objects that can turn up in each area (simulated)
+_POSSIBLE_DISCOVERIES: dict[str, tuple[str, ...]] = {
+    "kitchen": ("coffee_machine", "microwave", "toaster", "blender", "dishwasher"),
+    "living_room": ("bookshelf", "lamp", "plant", "picture_frame"),
+    "bedroom": ("bed", "closet", "desk", "mirror"),
+    "bathroom": ("shower", "toilet", "sink", "mirror"),
+    "garage": ("tools", "car", "bicycle", "storage_boxes"),
+    "office": ("computer", "printer", "desk", "chair"),
+}
+
+# Changes that can be noticed when re-exploring a known area
+_CHANGES = ("new_coffee_machine", "rearranged_furniture", "new_plant", "different_lighting")
+
+
+@dataclass(slots=True)
 class Discovery:
     location: str
     object_found: str
@@ -14,7 +30,7 @@ class Discovery:
     description: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ExplorationGoal:
     target_area: str
     motivation: str
@@ -32,6 +48,8 @@ class CuriosityEngine:
         self.discoveries: list[Discovery] = []
         self.exploration_count = 0
         self.curiosity_level = 0.8
+        # Object count and average novelty; reset whenever the world model changes
+        self._model_totals: tuple[int, float] | None = None
 
     def explore_unknown_areas(self, time_available: int = 300) -> list[Discovery]:
         """Explore environment when idle to learn new things."""
@@ -55,8 +73,7 @@ class CuriosityEngine:
     def _generate_exploration_goal(self) -> ExplorationGoal:
         """Generate curiosity-driven exploration goal."""
         # Explore unknown areas
-        possible_areas = ["kitchen", "living_room", "bedroom", "bathroom", "garage", "office"]
-        unknown_areas = [a for a in possible_areas if a not in self.known_areas]
+        unknown_areas = [a for a in _POSSIBLE_AREAS if a not in self.known_areas]
 
         if unknown_areas and random.random() < 0.6:
             target = random.choice(unknown_areas)
@@ -86,19 +103,9 @@ class CuriosityEngine:
         """Explore specific area and make discoveries."""
         area = goal.target_area
 
-        # Simulate discovery
-        possible_discoveries = {
-            "kitchen": ["coffee_machine", "microwave", "toaster", "blender", "dishwasher"],
-            "living_room": ["bookshelf", "lamp", "plant", "picture_frame"],
-            "bedroom": ["bed", "closet", "desk", "mirror"],
-            "bathroom": ["shower", "toilet", "sink", "mirror"],
-            "garage": ["tools", "car", "bicycle", "storage_boxes"],
-            "office": ["computer", "printer", "desk", "chair"]
-        }
-
         # Check if area has undiscovered objects
-        known_in_area = self.known_objects.get(area, [])
-        possible_in_area = possible_discoveries.get(area, [])
+        known_in_area = set(self.known_objects.get(area, ()))
+        possible_in_area = _POSSIBLE_DISCOVERIES.get(area, ())
         undiscovered = [obj for obj in possible_in_area if obj not in known_in_area]
 
         if undiscovered:
@@ -115,8 +122,7 @@ class CuriosityEngine:
 
         # Discover changes in known areas
         if area in self.known_areas and random.random() < 0.3:
-            changes = ["new_coffee_machine", "rearranged_furniture", "new_plant", "different_lighting"]
-            change = random.choice(changes)
+            change = random.choice(_CHANGES)
 
             return Discovery(
                 location=area,
@@ -142,6 +148,7 @@ class CuriosityEngine:
 
         # Store discovery
         self.discoveries.append(discovery)
+        self._model_totals = None
 
     def should_explore(self, idle_time: int, battery_level: float) -> bool:
         """Decide if robot should explore based on conditions."""
@@ -156,13 +163,20 @@ class CuriosityEngine:
 
     def get_exploration_stats(self) -> dict[str, Any]:
         """Get statistics on exploration."""
+        if self._model_totals is None:
+            self._model_totals = (
+                sum(len(objs) for objs in self.known_objects.values()),
+                sum(d.novelty_score for d in self.discoveries) / max(1, len(self.discoveries)),
+            )
+        total_objects, avg_novelty = self._model_totals
+
         return {
             "explorations_performed": self.exploration_count,
             "areas_discovered": len(self.known_areas),
-            "total_objects_known": sum(len(objs) for objs in self.known_objects.values()),
+            "total_objects_known": total_objects,
             "discoveries_made": len(self.discoveries),
             "curiosity_level": self.curiosity_level,
-            "avg_novelty": sum(d.novelty_score for d in self.discoveries) / max(1, len(self.discoveries))
+            "avg_novelty": avg_novelty
         }
 
     def get_recent_discoveries(self, count: int = 5) -> list[Discovery]:
@@ -9,7 +9,7 @@ from brain.planner.actions import Action
 from brain.world.state import WorldState
 
 
-@dataclass
+@dataclass(slots=True)
 class DreamScenario:
     """Simulated scenario for dream learning"""
     goal: Goal
@@ -19,7 +19,7 @@ class DreamScenario:
     constraints: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class DreamOutcome:
     """Result of dream simulation"""
     scenario: DreamScenario
@@ -1,4 +1,5 @@
 """Emotional Intelligence Layer - Adapt behavior based on human emotions"""
+from collections.abc import Sequence
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any
@@ -29,7 +30,7 @@ class BehaviorMode(Enum):
     CAUTIOUS = "cautious"      # Extra careful
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EmotionalContext:
     """Context about human emotional state"""
     primary_emotion: Emotion
@@ -39,10 +40,10 @@ class EmotionalContext:
     preferences: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class AdaptedPlan:
     """Plan adapted to emotional context"""
-    original_plan: list[Action]
+    original_plan: Sequence[Action]
     adapted_plan: list[Action]
     behavior_mode: BehaviorMode
     modifications: list[str]
@@ -141,11 +142,11 @@ class EmotionalIntelligence:
 
     def adapt_plan(
         self,
-        plan: list[Action],
+        plan: Sequence[Action],
         emotional_context: EmotionalContext,
         state: WorldState
     ) -> AdaptedPlan:
-        """Adapt plan based on emotional context"""
+        """Adapt plan based on emotional context (the input plan is left untouched)"""
 
         # Determine behavior mode
         mode = self.emotion_to_mode.get(
@@ -175,7 +176,7 @@ class EmotionalIntelligence:
 
     def _apply_mode(
         self,
-        plan: list[Action],
+        plan: Sequence[Action],
         mode: BehaviorMode,
         state: WorldState
     ) -> list[Action]:
@@ -229,7 +230,7 @@ class EmotionalIntelligence:
 
     def _get_modifications(
         self,
-        original: list[Action],
+        original: Sequence[Action],
         adapted: list[Action],
         mode: BehaviorMode
     ) -> list[str]:
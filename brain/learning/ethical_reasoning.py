@@ -12,7 +12,7 @@ class EthicalPrinciple(Enum):
     ACCOUNTABILITY = "accountability"
 
 
-@dataclass
+@dataclass(slots=True)
 class EthicalOption:
     action: str
     description: str
@@ -22,7 +22,7 @@ class EthicalOption:
     autonomy_score: float  # 0-10, higher is better
 
 
-@dataclass
+@dataclass(slots=True)
 class EthicalDecision:
     chosen_action: str
     reasoning: str
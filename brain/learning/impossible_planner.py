@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class ImpossibleTask:
     goal: str
     why_impossible: list[str]
@@ -11,7 +11,7 @@ class ImpossibleTask:
     feasibility_score: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ImpossiblePlan:
     original_goal: str
     is_truly_impossible: bool
@@ -3,8 +3,19 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
-
-@dataclass
+# Actions to take before being asked, per predicted intent
+_PROACTIVE_ACTIONS: dict[str, tuple[str, ...]] = {
+    "want_coffee": ("navigate_to_kitchen", "start_coffee_maker", "prepare_cup"),
+    "want_water": ("navigate_to_kitchen", "get_water_bottle", "bring_to_human"),
+    "want_to_sit": ("clear_chair", "adjust_cushion", "move_closer"),
+    "need_help": ("approach_human", "ask_if_help_needed", "standby"),
+    "want_entertainment": ("turn_on_tv", "suggest_activities", "prepare_games"),
+    "want_food": ("check_fridge", "suggest_meal_options", "prepare_ingredients")
+}
+_DEFAULT_PROACTIVE_ACTIONS = ("observe", "standby")
+
+
+@dataclass(frozen=True, slots=True)
 class HumanContext:
     location: str
     time_of_day: datetime
@@ -13,7 +24,7 @@ class HumanContext:
     gaze_direction: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PredictedIntent:
     intent: str
     confidence: float
@@ -111,17 +122,14 @@ class IntentionPredictor:
         self.prediction_history.append(predicted)
         return predicted
 
+    def predict_batch(self, contexts: list[HumanContext]) -> list[PredictedIntent]:
+        """Predict intentions for several contexts, in order."""
+        predict = self.predict_human_intention
+        return [predict(context) for context in contexts]
+
     def _generate_proactive_actions(self, intent: str) -> list[str]:
         """Generate actions to take before being asked."""
-        actions_map = {
-            "want_coffee": ["navigate_to_kitchen", "start_coffee_maker", "prepare_cup"],
-            "want_water": ["navigate_to_kitchen", "get_water_bottle", "bring_to_human"],
-            "want_to_sit": ["clear_chair", "adjust_cushion", "move_closer"],
-            "need_help": ["approach_human", "ask_if_help_needed", "standby"],
-            "want_entertainment": ["turn_on_tv", "suggest_activities", "prepare_games"],
-            "want_food": ["check_fridge", "suggest_meal_options", "prepare_ingredients"]
-        }
-        return actions_map.get(intent, ["observe", "standby"])
+        return list(_PROACTIVE_ACTIONS.get(intent, _DEFAULT_PROACTIVE_ACTIONS))
 
     def get_prediction_accuracy(self) -> dict[str, Any]:
         """Calculate how accurate predictions have been."""
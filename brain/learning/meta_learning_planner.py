@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceMetric:
     planning_time: float
     plan_quality: float
@@ -11,7 +11,7 @@ class PerformanceMetric:
     avg_plan_length: float
 
 
-@dataclass
+@dataclass(slots=True)
 class CodeOptimization:
     optimization_type: str
     code_change: str
@@ -37,6 +37,20 @@ class MetaLearningPlanner:
         )
         self.performance_history.append(metric)
 
+    def record_performance_batch(self, count: int, planning_time: float, plan_quality: float,
+                                 success_rate: float, plan_length: int):
+        """Record the same performance metrics for `count` planning sessions."""
+        avg_plan_length = float(plan_length)
+        self.performance_history.extend(
+            PerformanceMetric(
+                planning_time=planning_time,
+                plan_quality=plan_quality,
+                success_rate=success_rate,
+                avg_plan_length=avg_plan_length
+            )
+            for _ in range(count)
+        )
+
     def analyze_performance(self) -> dict[str, Any]:
         """Analyze performance trends."""
         if len(self.performance_history) < 10:
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Constraint:
     type: str
     description: str
@@ -11,7 +11,7 @@ class Constraint:
     negotiable: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class Proposal:
     description: str
     robot_satisfaction: float
@@ -19,7 +19,7 @@ class Proposal:
     compromise_level: float
 
 
-@dataclass
+@dataclass(slots=True)
 class NegotiationResult:
     agreed: bool
     final_proposal: str
@@ -32,6 +32,8 @@ class NegotiationEngine:
     def __init__(self):
         self.negotiation_history: list[NegotiationResult] = []
         self.negotiation_count = 0
+        # Last computed stats; reset whenever a negotiation is recorded
+        self._stats_cache: dict[str, Any] | None = None
 
     def negotiate_with_human(self, human_request: str,
                             robot_constraint: str,
@@ -63,6 +65,7 @@ class NegotiationEngine:
 
         self.negotiation_history.append(result)
         self.negotiation_count += 1
+        self._stats_cache = None
 
         return result
 
@@ -218,6 +221,12 @@ class NegotiationEngine:
         if not self.negotiation_history:
             return {"negotiations": 0}
 
+        if self._stats_cache is None:
+            self._stats_cache = self._compute_stats()
+        return dict(self._stats_cache)
+
+    def _compute_stats(self) -> dict[str, Any]:
+        """Aggregate the negotiation history."""
         avg_robot_sat = sum(n.robot_satisfaction for n in self.negotiation_history) / len(self.negotiation_history)
         avg_human_sat = sum(n.human_satisfaction for n in self.negotiation_history) / len(self.negotiation_history)
         avg_rounds = sum(n.negotiation_rounds for n in self.negotiation_history) / len(self.negotiation_history)
@@ -1,11 +1,13 @@
 """Predictive Failure Prevention - Predict and prevent failures before they happen"""
 import random
 import time
+from collections import deque
 from dataclasses import dataclass
+from itertools import islice
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class ComponentHealth:
     """Health status of robot component"""
     component_name: str
@@ -18,7 +20,7 @@ class ComponentHealth:
     recommended_action: str | None
 
 
-@dataclass
+@dataclass(slots=True)
 class SensorReading:
     """Sensor reading for predictive analysis"""
     sensor_name: str
@@ -28,7 +30,7 @@ class SensorReading:
     drift: float
 
 
-@dataclass
+@dataclass(slots=True)
 class MaintenanceSchedule:
     """Scheduled maintenance task"""
     component: str
@@ -41,9 +43,12 @@ class MaintenanceSchedule:
 class PredictiveMaintenanceSystem:
     """Predicts failures and schedules preventive maintenance"""
 
+    max_sensor_history = 1000
+
     def __init__(self):
         self.components: dict[str, ComponentHealth] = {}
-        self.sensor_history: dict[str, list[SensorReading]] = {}
+        # Bounded per sensor, so old readings fall off without re-slicing
+        self.sensor_history: dict[str, deque[SensorReading]] = {}
         self.maintenance_history: list[dict] = []
         self.failure_models: dict[str, dict] = self._initialize_failure_models()
 
@@ -121,14 +126,11 @@ class PredictiveMaintenanceSystem:
             drift=drift
         )
 
-        if sensor_name not in self.sensor_history:
-            self.sensor_history[sensor_name] = []
-
-        self.sensor_history[sensor_name].append(reading)
+        history = self.sensor_history.get(sensor_name)
+        if history is None:
+            history = self.sensor_history[sensor_name] = deque(maxlen=self.max_sensor_history)
 
-        # Keep only recent history (last 1000 readings)
-        if len(self.sensor_history[sensor_name]) > 1000:
-            self.sensor_history[sensor_name] = self.sensor_history[sensor_name][-1000:]
+        history.append(reading)
 
     def update_component_usage(self, component: str, hours_used: float):
         """Update component usage hours"""
@@ -187,12 +189,14 @@ class PredictiveMaintenanceSystem:
         if sensor_name not in self.sensor_history:
             return 0.0
 
-        recent_readings = self.sensor_history[sensor_name][-100:]
+        history = self.sensor_history[sensor_name]
 
-        if not recent_readings:
+        if not history:
             return 0.0
 
-        avg_drift = sum(r.drift for r in recent_readings) / len(recent_readings)
+        # Newest 100 readings, walked from the right end of the deque
+        recent_count = min(len(history), 100)
+        avg_drift = sum(r.drift for r in islice(reversed(history), recent_count)) / recent_count
 
         model = self.failure_models.get(component, {})
         critical_drift = float(model.get('critical_drift', 0.15))
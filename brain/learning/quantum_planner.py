@@ -9,7 +9,7 @@ from brain.planner.actions import Action
 from brain.world.state import WorldState
 
 
-@dataclass
+@dataclass(slots=True)
 class PlanOutcome:
     """Outcome of a simulated plan execution"""
     plan: list[Action]
@@ -20,7 +20,7 @@ class PlanOutcome:
     alternate_paths: list[list[Action]]
 
 
-@dataclass
+@dataclass(slots=True)
 class QuantumState:
     """Superposition of multiple possible world states"""
     states: list[WorldState]
@@ -87,6 +87,14 @@ class QuantumPlanner:
         batch_size = min(100, num_futures)
         num_batches = (num_futures + batch_size - 1) // batch_size
 
+        # A single batch finishes long before a worker process could start
+        if num_batches == 1 or self.max_workers <= 1:
+            return [
+                outcome
+                for _ in range(num_batches)
+                for outcome in self._simulate_batch(plan, state, batch_size, depth)
+            ][:num_futures]
+
         all_outcomes = []
 
         with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
@@ -115,13 +123,14 @@ class QuantumPlanner:
         depth: int
     ) -> list[dict[str, Any]]:
         """Simulate a batch of futures (static method for multiprocessing)"""
-        outcomes = []
-
-        for _ in range(batch_size):
-            outcome = QuantumPlanner._simulate_single_future(plan, state, depth)
-            outcomes.append(outcome)
-
-        return outcomes
+        # Success odds depend only on the action and state, not on the future
+        success_probs = [
+            QuantumPlanner._estimate_action_success(action, state) for action in plan[:depth]
+        ]
+        return [
+            QuantumPlanner._simulate_with_probabilities(success_probs)
+            for _ in range(batch_size)
+        ]
 
     @staticmethod
     def _simulate_single_future(
@@ -130,14 +139,19 @@ class QuantumPlanner:
         depth: int
     ) -> dict[str, Any]:
         """Simulate single future execution"""
+        return QuantumPlanner._simulate_with_probabilities([
+            QuantumPlanner._estimate_action_success(action, state) for action in plan[:depth]
+        ])
+
+    @staticmethod
+    def _simulate_with_probabilities(success_probs: list[float]) -> dict[str, Any]:
+        """Simulate one future given each step's probability of success"""
         success = True
         duration = 0.0
         failed_at = -1
 
-        for i, action in enumerate(plan[:depth]):
+        for i, action_success_prob in enumerate(success_probs):
             # Simulate action execution with random failure
-            action_success_prob = QuantumPlanner._estimate_action_success(action, state)
-
             if random.random() > action_success_prob:
                 success = False
                 failed_at = i
@@ -1,11 +1,19 @@
 """Self-Evolving Task Decomposition - Learn tasks by observing humans"""
 import json
-from collections import defaultdict
+import sys
+from collections import Counter, defaultdict
+from collections.abc import Sequence
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Any
 
+ActionKey = tuple[str, str | None, str | None]
 
-@dataclass
+_ACTION_FIELDS = ('action_type', 'target', 'location')
+_action_key = attrgetter(*_ACTION_FIELDS)
+
+
+@dataclass(slots=True)
 class ObservedAction:
     """Single observed action from human demonstration"""
     action_type: str
@@ -14,8 +22,16 @@ class ObservedAction:
     timestamp: float
     context: dict[str, Any]
 
+    def __post_init__(self) -> None:
+        # These three fields form the key every demonstration is matched on
+        self.action_type = sys.intern(self.action_type)
+        if self.target is not None:
+            self.target = sys.intern(self.target)
+        if self.location is not None:
+            self.location = sys.intern(self.location)
 
-@dataclass
+
+@dataclass(slots=True)
 class TaskPattern:
     """Learned pattern from multiple observations"""
     task_name: str
@@ -30,14 +46,17 @@ class SelfEvolvingPlanner:
     """Learns new task decompositions by observing human demonstrations"""
 
     def __init__(self, min_observations: int = 5, confidence_threshold: float = 0.8):
-        self.observations: dict[str, list[list[ObservedAction]]] = defaultdict(list)
+        self.observations: dict[str, list[Sequence[ObservedAction]]] = defaultdict(list)
+        # (action_type, target, location) per observed action, built once per demo
+        self._demo_keys: dict[str, list[list[ActionKey]]] = defaultdict(list)
         self.learned_tasks: dict[str, TaskPattern] = {}
         self.min_observations = min_observations
         self.confidence_threshold = confidence_threshold
 
-    def observe_demonstration(self, task_name: str, actions: list[ObservedAction]):
-        """Record a human demonstration of a task"""
+    def observe_demonstration(self, task_name: str, actions: Sequence[ObservedAction]):
+        """Record a human demonstration of a task (the sequence is stored, not copied)"""
         self.observations[task_name].append(actions)
+        self._demo_keys[task_name].append([_action_key(a) for a in actions])
 
         # Auto-learn if enough observations
         if len(self.observations[task_name]) >= self.min_observations:
@@ -46,9 +65,10 @@ class SelfEvolvingPlanner:
     def _try_learn_task(self, task_name: str):
         """Attempt to learn task pattern from observations"""
         demos = self.observations[task_name]
+        demo_keys = self._demo_keys[task_name]
 
         # Find common action sequence
-        common_sequence = self._extract_common_sequence(demos)
+        common_sequence = self._extract_common_sequence(demo_keys)
         if not common_sequence:
             return
 
@@ -56,49 +76,34 @@ class SelfEvolvingPlanner:
         preconditions = self._extract_preconditions(demos)
 
         # Calculate confidence
-        confidence = self._calculate_confidence(demos, common_sequence)
+        confidence = self._calculate_confidence(demo_keys, common_sequence)
 
         if confidence >= self.confidence_threshold:
             self.learned_tasks[task_name] = TaskPattern(
                 task_name=task_name,
-                action_sequence=common_sequence,
+                action_sequence=[dict(zip(_ACTION_FIELDS, key)) for key in common_sequence],
                 preconditions=preconditions,
                 success_rate=1.0,
                 observation_count=len(demos),
                 confidence=confidence
             )
 
-    def _extract_common_sequence(self, demos: list[list[ObservedAction]]) -> list[dict]:
+    def _extract_common_sequence(self, demo_keys: list[list[ActionKey]]) -> list[ActionKey]:
         """Find common action sequence across demonstrations"""
-        if not demos:
+        if not demo_keys:
             return []
 
-        # Use longest common subsequence algorithm
-        sequences = [[self._action_to_dict(a) for a in demo] for demo in demos]
-
         # Simple approach: find actions that appear in >80% of demos
-        action_frequency: dict[str, int] = defaultdict(int)
-        for seq in sequences:
-            seen = set()
-            for action in seq:
-                key = f"{action['action_type']}:{action.get('target', '')}:{action.get('location', '')}"
-                if key not in seen:
-                    action_frequency[key] += 1
-                    seen.add(key)
-
-        threshold = len(demos) * 0.8
-        common_actions = [k for k, v in action_frequency.items() if v >= threshold]
+        action_frequency: Counter[ActionKey] = Counter()
+        for keys in demo_keys:
+            action_frequency.update(set(keys))
 
-        # Reconstruct sequence maintaining order from first demo
-        result = []
-        for action in sequences[0]:
-            key = f"{action['action_type']}:{action.get('target', '')}:{action.get('location', '')}"
-            if key in common_actions:
-                result.append(action)
+        threshold = len(demo_keys) * 0.8
 
-        return result
+        # Reconstruct sequence maintaining order from first demo
+        return [key for key in demo_keys[0] if action_frequency[key] >= threshold]
 
-    def _extract_preconditions(self, demos: list[list[ObservedAction]]) -> list[str]:
+    def _extract_preconditions(self, demos: list[Sequence[ObservedAction]]) -> list[str]:
         """Extract common preconditions from demonstrations"""
         preconditions = []
 
@@ -115,42 +120,29 @@ class SelfEvolvingPlanner:
 
         return preconditions
 
-    def _calculate_confidence(self, demos: list[list[ObservedAction]], common_seq: list[dict]) -> float:
+    def _calculate_confidence(self, demo_keys: list[list[ActionKey]],
+                              common_seq: list[ActionKey]) -> float:
         """Calculate confidence in learned pattern"""
-        if not demos or not common_seq:
+        if not demo_keys or not common_seq:
             return 0.0
 
         # Measure how well common sequence matches each demo
-        matches = 0
-        for demo in demos:
-            demo_actions = [self._action_to_dict(a) for a in demo]
-            if self._sequence_matches(demo_actions, common_seq, threshold=0.7):
-                matches += 1
+        matches = sum(
+            1 for keys in demo_keys if self._sequence_matches(keys, common_seq, threshold=0.7)
+        )
 
-        return matches / len(demos)
+        return matches / len(demo_keys)
 
-    def _sequence_matches(self, demo: list[dict], pattern: list[dict], threshold: float) -> bool:
+    def _sequence_matches(self, demo: list[ActionKey], pattern: list[ActionKey],
+                          threshold: float) -> bool:
         """Check if demo matches pattern with threshold"""
         if not pattern:
             return False
 
-        matched = sum(1 for p in pattern if any(self._actions_similar(p, d) for d in demo))
+        present = set(demo)
+        matched = sum(1 for key in pattern if key in present)
         return (matched / len(pattern)) >= threshold
 
-    def _actions_similar(self, a1: dict, a2: dict) -> bool:
-        """Check if two actions are similar"""
-        return (a1['action_type'] == a2['action_type'] and
-                a1.get('target') == a2.get('target') and
-                a1.get('location') == a2.get('location'))
-
-    def _action_to_dict(self, action: ObservedAction) -> dict:
-        """Convert ObservedAction to dict"""
-        return {
-            'action_type': action.action_type,
-            'target': action.target,
-            'location': action.location
-        }
-
     def get_learned_task(self, task_name: str) -> TaskPattern | None:
         """Retrieve learned task pattern"""
         return self.learned_tasks.get(task_name)
@@ -4,8 +4,16 @@ from typing import Any
 
 from brain.planner.actions import Action
 
-
-@dataclass
+# Curated (skills, goal) combinations tried by auto-discovery, best first
+_PROMISING_COMBINATIONS: tuple[tuple[tuple[str, ...], str], ...] = (
+    (("pour_liquid", "navigate"), "deliver_liquid"),
+    (("pour_liquid", "navigate", "detect_spill"), "serve_drink_carefully"),
+    (("grasp_object", "navigate"), "fetch_and_deliver"),
+    (("navigate", "avoid_obstacle"), "navigate_safely"),
+    (("grasp_object", "detect_spill"), "careful_handling"),
+)
+
+@dataclass(slots=True)
 class Skill:
     name: str
     actions: list[Action]
@@ -14,7 +22,7 @@ class Skill:
     complexity: int
 
 
-@dataclass
+@dataclass(slots=True)
 class SynthesizedSkill:
     name: str
     parent_skills: list[str]
@@ -27,6 +35,8 @@ class SkillSynthesizer:
     def __init__(self):
         self.known_skills: dict[str, Skill] = {}
         self.synthesized_skills: dict[str, SynthesizedSkill] = {}
+        # Average novelty and usefulness; reset whenever a skill is synthesized
+        self._score_averages: tuple[float, float] | None = None
         self._initialize_base_skills()
 
     def _initialize_base_skills(self):
@@ -118,6 +128,7 @@ class SkillSynthesizer:
         )
 
         self.synthesized_skills[new_name] = synthesized
+        self._score_averages = None
         return synthesized
 
     def _generate_skill_name(self, skill_names: list[str], goal: str | None = None) -> str:
@@ -188,9 +199,7 @@ class SkillSynthesizer:
         total_complexity = sum(s.complexity for s in skills)
 
         # Complementary effects = more useful
-        all_effects = set()
-        for skill in skills:
-            all_effects.update(skill.effects)
+        all_effects = set().union(*(skill.effects for skill in skills))
 
         usefulness = min(1.0, (total_complexity * 0.2) + (len(all_effects) * 0.15))
         return usefulness
@@ -200,18 +209,10 @@ class SkillSynthesizer:
         discovered = []
 
         # Try promising combinations
-        promising_pairs = [
-            (["pour_liquid", "navigate"], "deliver_liquid"),
-            (["pour_liquid", "navigate", "detect_spill"], "serve_drink_carefully"),
-            (["grasp_object", "navigate"], "fetch_and_deliver"),
-            (["navigate", "avoid_obstacle"], "navigate_safely"),
-            (["grasp_object", "detect_spill"], "careful_handling")
-        ]
-
-        for skills, goal in promising_pairs[:max_combinations]:
+        for skills, goal in _PROMISING_COMBINATIONS[:max_combinations]:
             if all(s in self.known_skills for s in skills):
                 try:
-                    synthesized = self.combine(skills, goal)
+                    synthesized = self.combine(list(skills), goal)
                     discovered.append(synthesized)
                 except Exception:
                     pass
@@ -220,9 +221,18 @@ class SkillSynthesizer:
 
     def get_synthesis_stats(self) -> dict[str, Any]:
         """Get statistics on skill synthesis."""
+        if self._score_averages is None:
+            skills = self.synthesized_skills.values()
+            count = max(1, len(self.synthesized_skills))
+            self._score_averages = (
+                sum(s.novelty_score for s in skills) / count,
+                sum(s.usefulness_score for s in skills) / count,
+            )
+        avg_novelty, avg_usefulness = self._score_averages
+
         return {
             "base_skills": len(self.known_skills),
             "synthesized_skills": len(self.synthesized_skills),
-            "avg_novelty": sum(s.novelty_score for s in self.synthesized_skills.values()) / max(1, len(self.synthesized_skills)),
-            "avg_usefulness": sum(s.usefulness_score for s in self.synthesized_skills.values()) / max(1, len(self.synthesized_skills))
+            "avg_novelty": avg_novelty,
+            "avg_usefulness": avg_usefulness
         }
@@ -5,7 +5,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class SwarmKnowledge:
     """Shared knowledge across robot swarm"""
     knowledge_type: str
@@ -16,7 +16,7 @@ class SwarmKnowledge:
     verified_by: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class SwarmRobot:
     """Individual robot in swarm"""
     robot_id: str
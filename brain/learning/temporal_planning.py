@@ -5,7 +5,7 @@ from datetime import datetime, timedelta
 from brain.planner.actions import Action
 
 
-@dataclass
+@dataclass(slots=True)
 class TimedAction:
     action: Action
     start_time: datetime
@@ -13,7 +13,7 @@ class TimedAction:
     dependencies: list[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class TemporalPlan:
     actions: list[TimedAction]
     start_time: datetime
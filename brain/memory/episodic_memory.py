@@ -1,11 +1,12 @@
 """Episodic memory - Remember specific past events."""
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Episode:
     """A specific past event."""
 
@@ -49,6 +50,28 @@ class EpisodicMemory:
 
         return episode
 
+    def record_many(
+        self, rows: Iterable[tuple[str, dict[str, Any], str, bool, float]]
+    ) -> list[Episode]:
+        """Record several episodes at once.
+
+        Each row is (action, context, outcome, success, duration_seconds), as
+        passed to record(). The batch shares one timestamp and the history is
+        trimmed once at the end.
+        """
+        now = datetime.now()
+        episodes = [
+            Episode(now, action, context, outcome, success, duration_seconds)
+            for action, context, outcome, success, duration_seconds in rows
+        ]
+        self.episodes.extend(episodes)
+
+        # Keep only recent episodes
+        if len(self.episodes) > self.max_episodes:
+            self.episodes = self.episodes[-self.max_episodes :]
+
+        return episodes
+
     def recall(self, action: str, context_filter: dict[str, Any] | None = None) -> list[Episode]:
         """Recall past episodes matching action and context."""
         matches = [e for e in self.episodes if e.action == action]
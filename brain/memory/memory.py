@@ -1,8 +1,9 @@
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionRecord:
     timestamp: datetime
     goal: str
@@ -11,10 +12,10 @@ class ExecutionRecord:
 
 
 class Memory:
-    """Store execution history"""
+    """Store execution history (oldest records dropped past maxlen)"""
 
-    def __init__(self):
-        self.records: list[ExecutionRecord] = []
+    def __init__(self, maxlen: int = 10_000):
+        self.records: deque[ExecutionRecord] = deque(maxlen=maxlen)
 
     def store(self, goal: str, plan: list[str], success: bool = True):
         record = ExecutionRecord(
@@ -26,4 +27,10 @@ class Memory:
         self.records.append(record)
 
     def get_history(self) -> list[ExecutionRecord]:
-        return self.records
+        return list(self.records)
+
+    def history_len(self) -> int:
+        return len(self.records)
+
+    def last(self) -> ExecutionRecord | None:
+        return self.records[-1] if self.records else None
@@ -1,10 +1,11 @@
 """Semantic memory - Build knowledge graph."""
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class KnowledgeTriple:
     """A knowledge triple (subject, relation, object)."""
 
@@ -24,6 +25,10 @@ class KnowledgeGraph:
         """Add knowledge triple."""
         self.triples.append(KnowledgeTriple(subject, relation, obj, confidence))
 
+    def add_many(self, rows: Iterable[tuple[Any, ...]]) -> None:
+        """Add (subject, relation, object[, confidence]) triples in one pass."""
+        self.triples.extend(KnowledgeTriple(*row) for row in rows)
+
     def query(self, subject: str | None = None, relation: str | None = None, obj: str | None = None) -> list[KnowledgeTriple]:
         """Query knowledge graph."""
         results = self.triples
@@ -56,6 +61,10 @@ class SemanticMemory:
         """Learn new knowledge."""
         self.graph.add(subject, relation, obj, confidence)
 
+    def learn_many(self, rows: Iterable[tuple[Any, ...]]) -> None:
+        """Learn several (subject, relation, object[, confidence]) facts at once."""
+        self.graph.add_many(rows)
+
     def knows(self, subject: str, relation: str, obj: str) -> bool:
         """Check if knowledge exists."""
         return len(self.graph.query(subject, relation, obj)) > 0
@@ -5,7 +5,7 @@ from datetime import datetime, timedelta
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class ContextItem:
     """An item in working memory."""
 
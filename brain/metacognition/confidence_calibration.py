@@ -1,36 +1,40 @@
 """Confidence calibration - Accurate self-assessment."""
 
+_NUM_BINS = 10
+
 
 class ConfidenceCalibrator:
     """Accurate self-assessment."""
 
     def __init__(self) -> None:
         self.predictions: list[tuple[float, bool]] = []  # (confidence, actual_success)
+        # Per-bin running totals, so calibration_error never rescans predictions
+        self._bin_counts = [0] * _NUM_BINS
+        self._bin_successes = [0] * _NUM_BINS
 
     def record_outcome(self, predicted_confidence: float, actual_success: bool) -> None:
         """Record prediction and outcome."""
         self.predictions.append((predicted_confidence, actual_success))
 
+        bin_idx = min(int(predicted_confidence * _NUM_BINS), _NUM_BINS - 1)
+        self._bin_counts[bin_idx] += 1
+        if actual_success:
+            self._bin_successes[bin_idx] += 1
+
     def calibration_error(self) -> float:
         """Calculate calibration error."""
         if not self.predictions:
             return 0.0
 
-        # Group by confidence bins
-        bins: dict[int, list[float]] = {i: [] for i in range(10)}
-        for conf, success in self.predictions:
-            bin_idx = min(int(conf * 10), 9)
-            bins[bin_idx].append(1.0 if success else 0.0)
-
-        # Calculate error
+        # Compare each bin's midpoint with its observed success rate
         total_error = 0.0
-        for bin_idx, outcomes in bins.items():
-            if outcomes:
-                predicted = (bin_idx + 0.5) / 10
-                actual = sum(outcomes) / len(outcomes)
+        for bin_idx, count in enumerate(self._bin_counts):
+            if count:
+                predicted = (bin_idx + 0.5) / _NUM_BINS
+                actual = self._bin_successes[bin_idx] / count
                 total_error += abs(predicted - actual)
 
-        return total_error / 10
+        return total_error / _NUM_BINS
 
     def is_well_calibrated(self) -> bool:
         """Check if confidence is well calibrated."""
@@ -1,34 +1,36 @@
 """Anomaly detection - Detect unusual patterns."""
 
+import math
 import statistics
+from collections import deque
 from typing import Any
 
 
 class AnomalyDetector:
     """'This doesn't look right'."""
 
+    # Values kept per metric; older ones fall off the front
+    max_history = 100
+
     def __init__(self, threshold: float = 2.0) -> None:
         self.threshold = threshold  # Standard deviations
-        self.history: dict[str, list[float]] = {}
+        self.history: dict[str, deque[float]] = {}
 
     def record(self, metric: str, value: float) -> None:
         """Record metric value."""
         if metric not in self.history:
-            self.history[metric] = []
+            self.history[metric] = deque(maxlen=self.max_history)
         self.history[metric].append(value)
 
-        # Keep last 100 values
-        if len(self.history[metric]) > 100:
-            self.history[metric] = self.history[metric][-100:]
-
     def is_anomaly(self, metric: str, value: float) -> dict[str, Any]:
         """Check if value is anomalous."""
         if metric not in self.history or len(self.history[metric]) < 3:
             return {"is_anomaly": False, "reason": "insufficient_data"}
 
         values = self.history[metric]
-        mean = statistics.mean(values)
-        stdev = statistics.stdev(values) if len(values) > 1 else 0.0
+        # Float fast paths; statistics.mean/stdev do exact rational arithmetic
+        mean = statistics.fmean(values)
+        stdev = math.sqrt(math.fsum((v - mean) ** 2 for v in values) / (len(values) - 1))
 
         if stdev == 0:
             is_anomaly = value != mean
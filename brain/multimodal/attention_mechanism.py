@@ -1,18 +1,24 @@
 """Attention mechanism - Focus on relevant inputs."""
 
+import heapq
 from typing import Any
 
 
+def _relevance(inp: dict[str, Any], goal_words: list[str]) -> float:
+    """Fraction of goal words that appear in the input's text."""
+    # Simple keyword matching
+    inp_str = str(inp).lower()
+    matches = sum(1 for word in goal_words if word in inp_str)
+    return matches / len(goal_words) if goal_words else 0.0
+
+
 class AttentionMechanism:
     """Focus on relevant inputs."""
 
     def compute_attention(self, inputs: list[dict[str, Any]], goal: str) -> list[tuple[dict[str, Any], float]]:
         """Compute attention weights for inputs."""
-        attended = []
-
-        for inp in inputs:
-            relevance = self._compute_relevance(inp, goal)
-            attended.append((inp, relevance))
+        goal_words = goal.lower().split()
+        attended = [(inp, _relevance(inp, goal_words)) for inp in inputs]
 
         # Sort by relevance
         attended.sort(key=lambda x: x[1], reverse=True)
@@ -20,14 +26,11 @@ class AttentionMechanism:
 
     def _compute_relevance(self, inp: dict[str, Any], goal: str) -> float:
         """Compute relevance of input to goal."""
-        # Simple keyword matching
-        inp_str = str(inp).lower()
-        goal_words = goal.lower().split()
-
-        matches = sum(1 for word in goal_words if word in inp_str)
-        return matches / len(goal_words) if goal_words else 0.0
+        return _relevance(inp, goal.lower().split())
 
     def focus(self, inputs: list[dict[str, Any]], goal: str, top_k: int = 3) -> list[dict[str, Any]]:
         """Focus on top-k most relevant inputs."""
-        attended = self.compute_attention(inputs, goal)
-        return [inp for inp, _ in attended[:top_k]]
+        # nlargest keeps a k-sized heap instead of sorting every input, and
+        # breaks ties in input order exactly like the stable full sort
+        goal_words = goal.lower().split()
+        return heapq.nlargest(top_k, inputs, key=lambda inp: _relevance(inp, goal_words))
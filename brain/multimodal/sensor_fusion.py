@@ -1,5 +1,7 @@
 """Sensor fusion - Combine vision + audio + touch."""
 
+import math
+from collections.abc import Sequence
 from typing import Any
 
 
@@ -15,26 +17,40 @@ class SensorFusion:
         }
 
         # Combine evidence from multiple sensors
-        evidence_count = 0
-        total_confidence = 0.0
+        confidences: list[float] = []
 
         if vision.get("object_detected"):
-            evidence_count += 1
-            total_confidence += vision.get("confidence", 0.5)
+            confidences.append(vision.get("confidence", 0.5))
             vision_properties = vision.get("properties", {})
             if isinstance(vision_properties, dict):
                 fused["object_properties"].update(vision_properties)
 
         if audio.get("sound_detected"):
-            evidence_count += 1
-            total_confidence += audio.get("confidence", 0.5)
+            confidences.append(audio.get("confidence", 0.5))
 
         if touch.get("contact_detected"):
-            evidence_count += 1
-            total_confidence += touch.get("confidence", 0.5)
+            confidences.append(touch.get("confidence", 0.5))
 
-        if evidence_count > 0:
-            fused["confidence"] = total_confidence / evidence_count
-            fused["object_detected"] = evidence_count >= 2  # Require 2+ sensors
+        if confidences:
+            fused["confidence"] = self.fuse_confidences(confidences)
+            fused["object_detected"] = len(confidences) >= 2  # Require 2+ sensors
 
         return fused
+
+    def fuse_confidences(
+        self, confidences: Sequence[float], weights: Sequence[float] | None = None
+    ) -> float:
+        """Fuse per-modality confidences into their (weighted) mean.
+
+        Works for any number of modalities; returns 0.0 when there is no
+        evidence or the weights sum to zero. Raises ValueError if weights
+        and confidences differ in length.
+        """
+        if weights is None:
+            return sum(confidences) / len(confidences) if confidences else 0.0
+
+        products = [c * w for c, w in zip(confidences, weights, strict=True)]
+        total_weight = math.fsum(weights)
+        if not total_weight:
+            return 0.0
+        return math.fsum(products) / total_weight
@@ -1,7 +1,8 @@
+import sys
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class Action:
     """Primitive action representation (v1.0)"""
     action_type: str
@@ -10,6 +11,14 @@ class Action:
     parameters: dict = field(default_factory=dict)
     version: str = "1.0"
 
+    def __post_init__(self) -> None:
+        # Action types and locations come from a small vocabulary that is
+        # hashed and compared constantly (safety checks, plan cache keys)
+        if isinstance(self.action_type, str):
+            self.action_type = sys.intern(self.action_type)
+        if isinstance(self.location, str):
+            self.location = sys.intern(self.location)
+
     def __str__(self) -> str:
         parts = [self.action_type]
         if self.target:
@@ -1,15 +1,27 @@
 
+import copy
+from dataclasses import replace
+
 from brain.intent.schema import Goal
 from brain.planner.actions import Action
 from brain.skills.registry import SkillRegistry
 from brain.world.state import WorldState
 
 
+def _copy_plan(actions) -> list[Action]:
+    """Copy actions so callers and the plan cache never share mutable state"""
+    return [replace(a, parameters=copy.deepcopy(a.parameters)) for a in actions]
+
+
 class Planner:
     """Naive symbolic planner for action sequence generation"""
 
+    # Cached plans kept before the cache is reset
+    max_cached_plans = 256
+
     def __init__(self, skill_registry: SkillRegistry | None = None):
         self.skill_registry = skill_registry
+        self._plan_cache: dict[tuple, tuple[Action, ...]] = {}
 
     def plan(self, goal: Goal, world_state: WorldState) -> list[Action]:
         """Generate action sequence to achieve goal"""
@@ -20,7 +32,17 @@ class Planner:
             if skill:
                 return self._plan_from_skill(skill, goal, world_state)
 
-        # Fallback to naive planning
+        # Naive plans depend only on the goal and the world state
+        key = (goal, world_state.signature())
+        cached = self._plan_cache.get(key)
+        if cached is None:
+            if len(self._plan_cache) >= self.max_cached_plans:
+                self._plan_cache.clear()
+            cached = self._plan_cache[key] = tuple(self._plan_naive(goal, world_state))
+        return _copy_plan(cached)
+
+    def _plan_naive(self, goal: Goal, world_state: WorldState) -> list[Action]:
+        """Fallback rule-based planning"""
         # Social & Communication
         if goal.action == "greet":
             return [Action("speak", target="Hello! How can I help you?")]
@@ -7,9 +7,22 @@ from typing import Any
 class DeadlineManager:
     """'Must finish by 3 PM'."""
 
+    def __init__(self) -> None:
+        # Clock reading shared by every check within a planning cycle
+        self._cycle_now: datetime | None = None
+
+    def begin_cycle(self) -> datetime:
+        """Read the clock once for the deadline checks that follow."""
+        self._cycle_now = datetime.now()
+        return self._cycle_now
+
+    def end_cycle(self) -> None:
+        """Go back to reading the clock on every check."""
+        self._cycle_now = None
+
     def check_deadline(self, deadline: datetime, estimated_duration: float) -> dict[str, Any]:
         """Check if deadline can be met."""
-        now = datetime.now()
+        now = self._cycle_now or datetime.now()
         time_remaining = (deadline - now).total_seconds()
 
         can_meet = time_remaining >= estimated_duration
@@ -4,8 +4,11 @@ import math
 from dataclasses import dataclass
 from typing import Any
 
+# Default distance (m) within which two objects count as next to each other
+_NEXT_TO_THRESHOLD = 2.0
 
-@dataclass
+
+@dataclass(slots=True)
 class Position:
     """3D position."""
 
@@ -14,7 +17,7 @@ class Position:
     z: float
 
 
-@dataclass
+@dataclass(slots=True)
 class SpatialObject:
     """Object with spatial properties."""
 
@@ -23,6 +26,12 @@ class SpatialObject:
     size: tuple[float, float, float]  # width, height, depth
 
 
+def _coords(obj: SpatialObject) -> tuple[float, float, float]:
+    """Position of object as an (x, y, z) tuple."""
+    position = obj.position
+    return (position.x, position.y, position.z)
+
+
 class SpatialReasoner:
     """Understand 3D relationships ('behind', 'inside', 'next to')."""
 
@@ -50,7 +59,7 @@ class SpatialReasoner:
         """Check if obj1 is in front of obj2."""
         return self.is_behind(obj2, obj1, reference_direction)
 
-    def is_next_to(self, obj1: str, obj2: str, threshold: float = 2.0) -> bool:
+    def is_next_to(self, obj1: str, obj2: str, threshold: float = _NEXT_TO_THRESHOLD) -> bool:
         """Check if obj1 is next to obj2."""
         if obj1 not in self.objects or obj2 not in self.objects:
             return False
@@ -95,50 +104,40 @@ class SpatialReasoner:
         if obj1 not in self.objects or obj2 not in self.objects:
             return float("inf")
 
-        o1 = self.objects[obj1]
-        o2 = self.objects[obj2]
-
-        return math.sqrt(
-            (o1.position.x - o2.position.x) ** 2
-            + (o1.position.y - o2.position.y) ** 2
-            + (o1.position.z - o2.position.z) ** 2
-        )
+        return math.dist(_coords(self.objects[obj1]), _coords(self.objects[obj2]))
 
-    def find_nearest(self, obj: str) -> str | None:
-        """Find nearest object to obj."""
+    def distances_from(self, obj: str) -> dict[str, float]:
+        """Distance from obj to every other object, in one pass."""
         if obj not in self.objects:
-            return None
-
-        nearest = None
-        min_distance = float("inf")
+            return {}
 
-        for other in self.objects:
-            if other == obj:
-                continue
-            dist = self.distance(obj, other)
-            if dist < min_distance:
-                min_distance = dist
-                nearest = other
+        origin = _coords(self.objects[obj])
+        return {
+            name: math.dist(origin, _coords(other))
+            for name, other in self.objects.items()
+            if name != obj
+        }
 
-        return nearest
+    def find_nearest(self, obj: str) -> str | None:
+        """Find nearest object to obj."""
+        distances = self.distances_from(obj)
+        return min(distances, key=distances.__getitem__, default=None)
 
     def get_spatial_relations(self, obj: str) -> dict[str, Any]:
         """Get all spatial relations for object."""
         if obj not in self.objects:
             return {}
 
+        distances = self.distances_from(obj)
         relations: dict[str, Any] = {
             "next_to": [],
             "inside": [],
             "on_top_of": [],
-            "nearest": self.find_nearest(obj),
+            "nearest": min(distances, key=distances.__getitem__, default=None),
         }
 
-        for other in self.objects:
-            if other == obj:
-                continue
-
-            if self.is_next_to(obj, other):
+        for other, distance in distances.items():
+            if distance <= _NEXT_TO_THRESHOLD:
                 relations["next_to"].append(other)
             if self.is_inside(obj, other):
                 relations["inside"].append(other)
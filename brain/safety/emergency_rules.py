@@ -8,7 +8,7 @@ class EmergencySafetyValidator:
 
     def __init__(self):
         self.max_actions = 50  # Increased for complex scenarios
-        self.forbidden_actions = ['harm', 'damage', 'ignore_emergency']
+        self.forbidden_actions = frozenset({'harm', 'damage', 'ignore_emergency'})
         self.emergency_protocols = {
             'fire': self._fire_protocol,
             'intrusion': self._intrusion_protocol,
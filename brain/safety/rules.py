@@ -1,23 +1,47 @@
+import sys
 
 from brain.planner.actions import Action
 
 
+def _validate_one(
+    plan: list[Action], forbidden: frozenset[str], max_actions: int
+) -> tuple[bool, str]:
+    """Check a single plan; cheapest checks first so oversized plans skip the scan"""
+    n = len(plan)
+    if n == 0:
+        return False, "Empty plan"
+
+    if n > max_actions:
+        return False, f"Plan too long ({n} > {max_actions})"
+
+    for action in plan:
+        if action.action_type in forbidden:
+            return False, f"Forbidden action: {action.action_type}"
+
+    return True, "PASS"
+
+
 class SafetyValidator:
     """Validate plans against safety constraints"""
 
     def __init__(self):
         self.max_actions = 20
-        self.forbidden_actions = ["harm", "damage"]
+        self.forbidden_actions = frozenset({"harm", "damage"})
 
-    def validate(self, plan: list[Action]) -> tuple[bool, str]:
-        if len(plan) == 0:
-            return False, "Empty plan"
+    @property
+    def forbidden_actions(self) -> frozenset[str]:
+        """Action types that are never allowed"""
+        return self._forbidden_actions
 
-        if len(plan) > self.max_actions:
-            return False, f"Plan too long ({len(plan)} > {self.max_actions})"
+    @forbidden_actions.setter
+    def forbidden_actions(self, actions) -> None:
+        self._forbidden_actions = frozenset(map(sys.intern, actions))
 
-        for action in plan:
-            if action.action_type in self.forbidden_actions:
-                return False, f"Forbidden action: {action.action_type}"
+    def validate(self, plan: list[Action]) -> tuple[bool, str]:
+        return _validate_one(plan, self._forbidden_actions, self.max_actions)
 
-        return True, "PASS"
+    def validate_batch(self, plans: list[list[Action]]) -> list[tuple[bool, str]]:
+        """Validate several plans in one pass, returning one verdict per plan"""
+        forbidden = self._forbidden_actions
+        cap = self.max_actions
+        return [_validate_one(plan, forbidden, cap) for plan in plans]
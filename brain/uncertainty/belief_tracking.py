@@ -10,9 +10,7 @@ class BeliefTracker:
 
     def update_belief(self, variable: str, value: str, probability: float) -> None:
         """Update belief about variable."""
-        if variable not in self.beliefs:
-            self.beliefs[variable] = {}
-        self.beliefs[variable][value] = probability
+        self.beliefs.setdefault(variable, {})[value] = probability
 
     def get_belief(self, variable: str) -> dict[str, float]:
         """Get belief distribution for variable."""
@@ -23,5 +21,6 @@ class BeliefTracker:
         beliefs = self.get_belief(variable)
         if not beliefs:
             return None
-        best = max(beliefs.items(), key=lambda x: x[1])
-        return best
+        # Key on the dict itself rather than a lambda over items() pairs
+        best = max(beliefs, key=beliefs.__getitem__)
+        return best, beliefs[best]
@@ -1,3 +1,4 @@
+import sys
 import time
 from dataclasses import dataclass, field
 
@@ -15,6 +16,30 @@ class WorldState:
     frame_id: str = "world"
     relations: dict = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        # Location names are compared against action locations and used in keys
+        if isinstance(self.robot_location, str):
+            self.robot_location = sys.intern(self.robot_location)
+        if isinstance(self.human_location, str):
+            self.human_location = sys.intern(self.human_location)
+        self.locations = [
+            sys.intern(loc) if isinstance(loc, str) else loc for loc in self.locations
+        ]
+
+    def signature(self) -> tuple:
+        """
+        Hashable summary of objects and locations, for cache keys.
+
+        Built fresh on every call, so in-place edits to objects, locations
+        or a WorldObject are always reflected.
+        """
+        return (
+            tuple((obj.name, obj.location, obj.object_type) for obj in self.objects),
+            self.robot_location,
+            self.human_location,
+            tuple(self.locations),
+        )
+
     def get_object(self, name: str) -> WorldObject | None:
         for obj in self.objects:
             if obj.name == name:
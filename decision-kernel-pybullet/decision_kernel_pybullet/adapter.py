@@ -7,6 +7,8 @@ from brain.planner.actions import Action
 from brain.world.objects import WorldObject
 from brain.world.state import WorldState
 
+_STATUS_SUCCESS = ExecutionStatus.SUCCESS
+
 
 class PyBulletAdapter:
     """
@@ -94,7 +96,7 @@ class PyBulletAdapter:
         """
         report = ExecutionReport(success=True, message="PyBullet translation complete")
 
-        for i, action in enumerate(plan):
+        for action in plan:
             # Log what would be executed in PyBullet
             print(f"[PYBULLET] Would execute: {action.action_type}")
 
@@ -110,14 +112,13 @@ class PyBulletAdapter:
                 print("  -> Open gripper")
                 print(f"  -> Release: {action.target}")
 
-            # Record successful translation
-            result = ActionResult(
-                action_index=i,
-                status=ExecutionStatus.SUCCESS,
-                message=f"Translated {action.action_type} to PyBullet",
-                duration=0.01,
-            )
-            report.add_result(result)
+        # Record successful translations
+        report.extend_results(
+            [
+                ActionResult(i, _STATUS_SUCCESS, f"Translated {action.action_type} to PyBullet", 0.01)
+                for i, action in enumerate(plan)
+            ]
+        )
 
         return report
 
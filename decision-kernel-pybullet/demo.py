@@ -1,11 +1,21 @@
 """PyBullet adapter demo - Minimal runnable example"""
 
+import argparse
+
 from decision_kernel_pybullet.adapter import PyBulletAdapter
 
 from brain.kernel import RobotBrainKernel
 
 
-def main():
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--repeat", type=int, default=1, help="process the intent N times (for benchmarking)"
+    )
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error(f"--repeat must be at least 1, got {args.repeat}")
+
     print("=" * 60)
     print("Decision Kernel - PyBullet Demo")
     print("=" * 60)
@@ -28,8 +38,11 @@ def main():
     intent = "bring me the cube"
     print(f"  Intent: '{intent}'")
 
-    plan = kernel.process(intent, world_state)
+    plans = kernel.process_many([(intent, world_state)] * args.repeat)
+    plan = plans[0]
     print(f"[OK] Plan: {len(plan)} actions")
+    if args.repeat > 1:
+        print(f"  Processed {len(plans)} times")
 
     # Execute
     print("\n[4/4] Executing in PyBullet...")
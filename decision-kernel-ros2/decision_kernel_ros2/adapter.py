@@ -7,6 +7,8 @@ from brain.planner.actions import Action
 from brain.world.objects import WorldObject
 from brain.world.state import WorldState
 
+_STATUS_SUCCESS = ExecutionStatus.SUCCESS
+
 
 class ROS2Adapter:
     """
@@ -25,10 +27,15 @@ class ROS2Adapter:
     - Perception algorithms
     """
 
-    def __init__(self):
+    def __init__(self, clock=None):
         """
         Initialize ROS2 adapter
 
+        Args:
+            clock: Callable returning wall time in float seconds (optional).
+                Defaults to time.time; pass a wrapper around the node clock
+                to stamp WorldState with ROS time.
+
         In production:
         - Initialize ROS2 node
         - Subscribe to /tf, /odom, /joint_states
@@ -36,6 +43,7 @@ class ROS2Adapter:
 
         For now: Simulated placeholders
         """
+        self.clock = clock or time.time
         self.robot_frame = "base_link"
         self.world_frame = "world"
 
@@ -62,7 +70,7 @@ class ROS2Adapter:
             robot_location="base_link",
             human_location="operator_station",
             locations=["base_link", "table", "operator_station"],
-            timestamp=time.time(),
+            timestamp=self.clock(),
             frame_id=self.world_frame,
             relations={"detected_object": {"on": "table"}},
         )
@@ -88,7 +96,7 @@ class ROS2Adapter:
         """
         report = ExecutionReport(success=True, message="ROS2 translation complete")
 
-        for i, action in enumerate(plan):
+        for action in plan:
             # Log what would be published
             print(f"[ROS2] Would publish: {action.action_type}")
 
@@ -104,14 +112,13 @@ class ROS2Adapter:
                 print("  -> Topic: /gripper/command")
                 print("  -> Action: open")
 
-            # Record successful translation
-            result = ActionResult(
-                action_index=i,
-                status=ExecutionStatus.SUCCESS,
-                message=f"Translated {action.action_type} to ROS2",
-                duration=0.01,
-            )
-            report.add_result(result)
+        # Record successful translations
+        report.extend_results(
+            [
+                ActionResult(i, _STATUS_SUCCESS, f"Translated {action.action_type} to ROS2", 0.01)
+                for i, action in enumerate(plan)
+            ]
+        )
 
         return report
 
@@ -7,6 +7,8 @@ from brain.planner.actions import Action
 from brain.world.objects import WorldObject
 from brain.world.state import WorldState
 
+_STATUS_SUCCESS = ExecutionStatus.SUCCESS
+
 
 class WebotsAdapter:
     """
@@ -25,12 +27,14 @@ class WebotsAdapter:
     - Perception algorithms
     """
 
-    def __init__(self, robot=None):
+    def __init__(self, robot=None, clock=None):
         """
         Initialize Webots adapter
 
         Args:
             robot: Webots Robot instance (optional, for real Webots integration)
+            clock: Callable returning wall time in float seconds (optional).
+                Defaults to time.time.
 
         In production:
         - Initialize Webots Robot instance
@@ -40,6 +44,7 @@ class WebotsAdapter:
         For demo: Uses mocked Webots API
         """
         self.robot = robot
+        self.clock = clock or time.time
         self.world_frame = "world"
         self.kernel_version = "0.7.0"
 
@@ -67,7 +72,7 @@ class WebotsAdapter:
             robot_location="start_position",
             human_location="goal_position",
             locations=["start_position", "table", "room", "goal_position"],
-            timestamp=time.time(),
+            timestamp=self.clock(),
             frame_id=self.world_frame,
             relations={"bottle": {"on": "table"}},
         )
@@ -94,7 +99,7 @@ class WebotsAdapter:
         """
         report = ExecutionReport(success=True, message="Webots translation complete")
 
-        for i, action in enumerate(plan):
+        for action in plan:
             # Log what would be executed in Webots
             print(f"[WEBOTS] Would execute: {action.action_type}")
 
@@ -110,14 +115,13 @@ class WebotsAdapter:
                 print("  -> Open gripper")
                 print(f"  -> Release: {action.target}")
 
-            # Record successful translation
-            result = ActionResult(
-                action_index=i,
-                status=ExecutionStatus.SUCCESS,
-                message=f"Translated {action.action_type} to Webots",
-                duration=0.01,
-            )
-            report.add_result(result)
+        # Record successful translations
+        report.extend_results(
+            [
+                ActionResult(i, _STATUS_SUCCESS, f"Translated {action.action_type} to Webots", 0.01)
+                for i, action in enumerate(plan)
+            ]
+        )
 
         return report
 
@@ -4,13 +4,29 @@ import hashlib
 import importlib
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 from brain.execution.report import ExecutionReport
 from brain.planner.actions import Action
 from brain.world.state import WorldState
 
+REQUIRED_METHODS = ("sense", "execute", "capabilities")
+
+
+@lru_cache(maxsize=32)
+def _adapter_class(import_path: str):
+    """Resolve adapter class once per import path
+
+    Only the class is cached: execute() changes adapter state, so every
+    run gets a fresh instance.
+    """
+    module_name, class_name = import_path.rsplit(".", 1)
+    module = importlib.import_module(module_name)
+    return getattr(module, class_name)
+
 
 def load_adapter(import_path: str):
     """Load adapter class from import path (module.ClassName)"""
@@ -18,12 +34,8 @@ def load_adapter(import_path: str):
         print(f"Error: Import path must be 'module.ClassName', got: {import_path}")
         return None
 
-    module_name, class_name = import_path.rsplit(".", 1)
-
     try:
-        module = importlib.import_module(module_name)
-        adapter_class = getattr(module, class_name)
-        return adapter_class()
+        return _adapter_class(import_path)()
     except Exception as e:
         print(f"Error loading adapter: {e}")
         return None
@@ -31,11 +43,11 @@ def load_adapter(import_path: str):
 
 def test_adapter_has_methods(adapter) -> tuple[bool, str]:
     """Test adapter has required methods"""
-    required = ["sense", "execute", "capabilities"]
-    for method in required:
-        if not hasattr(adapter, method):
+    for method in REQUIRED_METHODS:
+        fn = getattr(adapter, method, None)
+        if fn is None:
             return False, f"Missing method: {method}"
-        if not callable(getattr(adapter, method)):
+        if not callable(fn):
             return False, f"Method not callable: {method}"
     return True, "All methods present"
 
@@ -84,6 +96,29 @@ def test_adapter_capabilities(adapter) -> tuple[bool, str]:
         return False, f"capabilities() raised exception: {e}"
 
 
+TESTS = (
+    ("Method presence", test_adapter_has_methods),
+    ("sense() contract", test_adapter_sense),
+    ("execute() contract", test_adapter_execute),
+    ("capabilities() contract", test_adapter_capabilities),
+)
+
+
+def _run_tests(adapter, parallel: bool = False) -> list[tuple[str, bool, str]]:
+    """Run all contract tests, one at a time unless parallel is requested.
+
+    Parallel mode calls sense(), execute() and capabilities() concurrently on
+    the same adapter, so only use it with adapters that are thread-safe.
+    Results keep TESTS order either way.
+    """
+    if not parallel:
+        return [(name, *test_func(adapter)) for name, test_func in TESTS]
+
+    with ThreadPoolExecutor(max_workers=len(TESTS)) as executor:
+        futures = [executor.submit(test_func, adapter) for _, test_func in TESTS]
+        return [(name, *future.result()) for (name, _), future in zip(TESTS, futures)]
+
+
 def generate_certificate(adapter_path: str, results: list, adapter_class_name: str, output_dir: str = "certificates"):
     """Generate conformance certificate"""
     timestamp = datetime.utcnow().isoformat() + "Z"
@@ -123,36 +158,45 @@ def generate_certificate(adapter_path: str, results: list, adapter_class_name: s
     cert_dir = Path(output_dir) / adapter_class_name
     cert_dir.mkdir(parents=True, exist_ok=True)
 
-    # Save JSON
     json_file = cert_dir / f"{timestamp.replace(':', '-')}.json"
-    with open(json_file, "w") as f:
-        json.dump(certificate, f, indent=2)
-
-    # Save Markdown
     md_file = cert_dir / f"{timestamp.replace(':', '-')}.md"
-    with open(md_file, "w", encoding="utf-8") as f:
-        f.write("# Conformance Certificate\n\n")
-        f.write(f"**Adapter**: `{adapter_path}`\n")
-        f.write(f"**Status**: {certificate['results']['status']}\n")
-        f.write(f"**Timestamp**: {timestamp}\n")
-        f.write(f"**Kernel Version**: {certificate['kernel_version']}\n\n")
-        f.write("## Specifications\n\n")
-        f.write(f"- Action Spec: v{certificate['action_spec_version']}\n")
-        f.write(f"- WorldState Spec: v{certificate['worldstate_spec_version']}\n")
-        f.write(f"- Adapter Contract: v{certificate['adapter_contract_version']}\n\n")
-        f.write("## Results\n\n")
-        f.write(f"**Passed**: {passed_count}/{total_count} tests\n\n")
-        for test in certificate['results']['tests']:
-            status = "PASS" if test['passed'] else "FAIL"
-            f.write(f"- [{status}] {test['name']}\n")
-        f.write("\n## Verification\n\n")
-        f.write(f"```bash\n{certificate['conformance_command']}\n```\n\n")
-        f.write(f"**Source Hash**: `{source_hash}`\n")
+
+    json_body = json.dumps(certificate, indent=2)
+
+    md_lines = [
+        "# Conformance Certificate\n\n",
+        f"**Adapter**: `{adapter_path}`\n",
+        f"**Status**: {certificate['results']['status']}\n",
+        f"**Timestamp**: {timestamp}\n",
+        f"**Kernel Version**: {certificate['kernel_version']}\n\n",
+        "## Specifications\n\n",
+        f"- Action Spec: v{certificate['action_spec_version']}\n",
+        f"- WorldState Spec: v{certificate['worldstate_spec_version']}\n",
+        f"- Adapter Contract: v{certificate['adapter_contract_version']}\n\n",
+        "## Results\n\n",
+        f"**Passed**: {passed_count}/{total_count} tests\n\n",
+    ]
+    for test in certificate['results']['tests']:
+        status = "PASS" if test['passed'] else "FAIL"
+        md_lines.append(f"- [{status}] {test['name']}\n")
+    md_lines.append("\n## Verification\n\n")
+    md_lines.append(f"```bash\n{certificate['conformance_command']}\n```\n\n")
+    md_lines.append(f"**Source Hash**: `{source_hash}`\n")
+    md_body = "".join(md_lines)
+
+    # Save JSON and Markdown; the two files are independent writes
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        json_write = executor.submit(json_file.write_text, json_body)
+        md_write = executor.submit(md_file.write_text, md_body, encoding="utf-8")
+        json_write.result()
+        md_write.result()
 
     return json_file, md_file
 
 
-def run_conformance(adapter_path: str, generate_cert: bool = False) -> bool:
+def run_conformance(
+    adapter_path: str, generate_cert: bool = False, parallel: bool = False
+) -> bool:
     """Run conformance tests on adapter"""
     print(f"Loading adapter: {adapter_path}")
     adapter = load_adapter(adapter_path)
@@ -162,17 +206,8 @@ def run_conformance(adapter_path: str, generate_cert: bool = False) -> bool:
 
     print(f"Adapter loaded: {adapter.__class__.__name__}\n")
 
-    tests = [
-        ("Method presence", test_adapter_has_methods),
-        ("sense() contract", test_adapter_sense),
-        ("execute() contract", test_adapter_execute),
-        ("capabilities() contract", test_adapter_capabilities),
-    ]
-
-    results = []
-    for name, test_func in tests:
-        passed, msg = test_func(adapter)
-        results.append((name, passed, msg))
+    results = _run_tests(adapter, parallel=parallel)
+    for name, passed, msg in results:
         status = "[PASS]" if passed else "[FAIL]"
         print(f"{status}: {name}")
         if not passed:
@@ -206,13 +241,15 @@ def run_conformance(adapter_path: str, generate_cert: bool = False) -> bool:
 def main():
     """CLI entry point"""
     if len(sys.argv) < 2:
-        print("Usage: python -m decision_kernel_conformance <module.ClassName> [--cert]")
+        print("Usage: python -m decision_kernel_conformance <module.ClassName> [--cert] [--parallel]")
         print("Example: python -m decision_kernel_conformance adapters.mock.mock_robot.MockRobot")
         print("Options:")
-        print("  --cert    Generate conformance certificate")
+        print("  --cert        Generate conformance certificate")
+        print("  --parallel    Run tests concurrently (thread-safe adapters only)")
         return 1
 
     adapter_path = sys.argv[1]
     generate_cert = "--cert" in sys.argv
-    success = run_conformance(adapter_path, generate_cert=generate_cert)
+    parallel = "--parallel" in sys.argv
+    success = run_conformance(adapter_path, generate_cert=generate_cert, parallel=parallel)
     return 0 if success else 1
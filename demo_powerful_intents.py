@@ -4,6 +4,10 @@ from brain.kernel import RobotBrainKernel
 from brain.world.objects import WorldObject
 from brain.world.state import WorldState
 
+_BAR = "=" * 70
+_THIN = "-" * 70
+_HEADER = "\n{bar}\nCategory: {category}\nCommand: '{command}'\n{thin}\n".format
+
 
 def create_world() -> WorldState:
     return WorldState(
@@ -20,24 +24,23 @@ def create_world() -> WorldState:
 
 def test_command(kernel: RobotBrainKernel, world: WorldState, command: str, category: str):
     """Test a single command"""
-    print(f"\n{'='*70}")
-    print(f"Category: {category}")
-    print(f"Command: '{command}'")
-    print(f"{'-'*70}")
+    header = _HEADER(bar=_BAR, category=category, command=command, thin=_THIN)
 
     try:
         plan = kernel.process(command, world)
-        print(f"Plan ({len(plan)} actions):")
-        for i, action in enumerate(plan, 1):
-            print(f"   {i}. {action}")
     except Exception as e:
-        print(f"Error: {e}")
+        print(f"{header}Error: {e}")
+        return
+
+    lines = [f"{header}Plan ({len(plan)} actions):"]
+    lines.extend(f"   {i}. {action}" for i, action in enumerate(plan, 1))
+    print("\n".join(lines))
 
 
 def main():
-    print("="*70)
+    print(_BAR)
     print("DECISION KERNEL - POWERFUL INTENT UNDERSTANDING DEMO")
-    print("="*70)
+    print(_BAR)
     print("\nTesting all revolutionary AI capabilities...")
 
     kernel = RobotBrainKernel()
@@ -92,9 +95,9 @@ def main():
     for command, category in test_cases:
         test_command(kernel, world, command, category)
 
-    print(f"\n{'='*70}")
+    print(f"\n{_BAR}")
     print("SUMMARY")
-    print(f"{'='*70}")
+    print(_BAR)
     print(f"Tested {len(test_cases)} different intent types")
     print("Covers: Social, Emotional, Learning, Exploration, Prediction,")
     print("        Collaboration, Basic Tasks, and Emergency responses")
@@ -1,6 +1,9 @@
 """Demo: Show validation and monitoring in action"""
 
+import sys
+
 from brain.kernel import RobotBrainKernel
+from brain.planner.actions import Action
 from brain.world.objects import WorldObject
 from brain.world.state import WorldState
 
@@ -18,115 +21,125 @@ def main():
         locations=["kitchen", "living room"]
     )
 
-    print("\nPIPELINE STAGES:")
-    print("1. Intent Parser    - Understands command")
-    print("2. Planner          - Creates action sequence")
-    print("3. Safety Validator - Checks constraints")
-    print("4. Memory Logger    - Records execution")
-    print("5. Adapter          - Executes on hardware")
+    out = ["\nPIPELINE STAGES:"]
+    out.append("1. Intent Parser    - Understands command")
+    out.append("2. Planner          - Creates action sequence")
+    out.append("3. Safety Validator - Checks constraints")
+    out.append("4. Memory Logger    - Records execution")
+    out.append("5. Adapter          - Executes on hardware")
+    sys.stdout.write("\n".join(out) + "\n")
 
     # Test 1: Valid command
     print("\n" + "="*80)
     print("TEST 1: Valid Command")
     print("="*80)
+    out = []
 
     cmd = "bring me water"
-    print(f"\nCommand: '{cmd}'")
+    out.append(f"\nCommand: '{cmd}'")
 
     # Parse
     goal = kernel.intent_parser.parse(cmd)
-    print("\n[1] Intent Parser:")
-    print(f"    Action: {goal.action}")
-    print(f"    Target: {goal.target}")
+    out.append("\n[1] Intent Parser:")
+    out.append(f"    Action: {goal.action}")
+    out.append(f"    Target: {goal.target}")
 
     # Plan
     plan = kernel.planner.plan(goal, world)
-    print("\n[2] Planner:")
-    print(f"    Generated {len(plan)} actions:")
+    out.append("\n[2] Planner:")
+    out.append(f"    Generated {len(plan)} actions:")
     for i, action in enumerate(plan, 1):
-        print(f"      {i}. {action}")
+        out.append(f"      {i}. {action}")
 
     # Validate
     is_safe, reason = kernel.safety.validate(plan)
-    print("\n[3] Safety Validator:")
-    print(f"    Safe: {is_safe}")
-    print(f"    Reason: {reason}")
+    out.append("\n[3] Safety Validator:")
+    out.append(f"    Safe: {is_safe}")
+    out.append(f"    Reason: {reason}")
 
     # Execute (logs to memory)
-    kernel.process(cmd, world)
-    print("\n[4] Memory Logger:")
-    print(f"    Executions recorded: {len(kernel.memory.get_history())}")
-
-    history = kernel.memory.get_history()[-1]
-    print("    Last execution:")
-    print(f"      Goal: {history.goal}")
-    print(f"      Actions: {len(history.plan)}")
-    print(f"      Success: {history.success}")
-    print(f"      Timestamp: {history.timestamp}")
+    kernel.process_prepared(world, goal=goal, plan=plan)
+    out.append("\n[4] Memory Logger:")
+    out.append(f"    Executions recorded: {kernel.memory.history_len()}")
+
+    history = kernel.memory.last()
+    out.append("    Last execution:")
+    out.append(f"      Goal: {history.goal}")
+    out.append(f"      Actions: {len(history.plan)}")
+    out.append(f"      Success: {history.success}")
+    out.append(f"      Timestamp: {history.timestamp}")
+    sys.stdout.write("\n".join(out) + "\n")
 
     # Test 2: Invalid command (empty)
     print("\n" + "="*80)
     print("TEST 2: Edge Case (gets smart fallback)")
     print("="*80)
+    out = []
 
     cmd = "do a backflip"
-    print(f"\nCommand: '{cmd}'")
+    out.append(f"\nCommand: '{cmd}'")
 
     goal = kernel.intent_parser.parse(cmd)
-    print("\n[1] Intent Parser:")
-    print(f"    Action: {goal.action} (smart fallback)")
+    out.append("\n[1] Intent Parser:")
+    out.append(f"    Action: {goal.action} (smart fallback)")
 
     plan = kernel.planner.plan(goal, world)
-    print("\n[2] Planner:")
-    print(f"    Generated {len(plan)} actions (helpful response)")
+    out.append("\n[2] Planner:")
+    out.append(f"    Generated {len(plan)} actions (helpful response)")
 
     is_safe, reason = kernel.safety.validate(plan)
-    print("\n[3] Safety Validator:")
-    print(f"    Safe: {is_safe}")
-    print(f"    Reason: {reason}")
+    out.append("\n[3] Safety Validator:")
+    out.append(f"    Safe: {is_safe}")
+    out.append(f"    Reason: {reason}")
+    sys.stdout.write("\n".join(out) + "\n")
 
     # Test 3: Safety checks
     print("\n" + "="*80)
     print("TEST 3: Safety Constraints")
     print("="*80)
+    out = []
 
-    print("\nSafety Rules:")
-    print(f"  - Max actions: {kernel.safety.max_actions}")
-    print(f"  - Forbidden actions: {kernel.safety.forbidden_actions}")
-    print("  - Empty plan: REJECTED")
+    out.append("\nSafety Rules:")
+    out.append(f"  - Max actions: {kernel.safety.max_actions}")
+    out.append(f"  - Forbidden actions: {sorted(kernel.safety.forbidden_actions)}")
+    out.append("  - Empty plan: REJECTED")
 
-    # Test forbidden action
-    from brain.planner.actions import Action
+    # Test forbidden action and too long plan together
     bad_plan = [Action("harm", target="something")]
-    is_safe, reason = kernel.safety.validate(bad_plan)
-    print("\nTest forbidden action:")
-    print(f"  Plan: {bad_plan}")
-    print(f"  Safe: {is_safe}")
-    print(f"  Reason: {reason}")
-
-    # Test too long plan
-    long_plan = [Action("navigate_to", location="kitchen") for _ in range(25)]
-    is_safe, reason = kernel.safety.validate(long_plan)
-    print("\nTest too long plan:")
-    print(f"  Plan length: {len(long_plan)}")
-    print(f"  Safe: {is_safe}")
-    print(f"  Reason: {reason}")
+    # The validator only reads actions, so one instance can fill the plan
+    long_plan = [Action("navigate_to", location="kitchen")] * 25
+    (bad_safe, bad_reason), (long_safe, long_reason) = kernel.safety.validate_batch(
+        [bad_plan, long_plan]
+    )
+
+    out.append("\nTest forbidden action:")
+    out.append(f"  Plan: {bad_plan}")
+    out.append(f"  Safe: {bad_safe}")
+    out.append(f"  Reason: {bad_reason}")
+
+    out.append("\nTest too long plan:")
+    out.append(f"  Plan length: {len(long_plan)}")
+    out.append(f"  Safe: {long_safe}")
+    out.append(f"  Reason: {long_reason}")
+    sys.stdout.write("\n".join(out) + "\n")
 
     # Summary
     print("\n" + "="*80)
     print("SUMMARY")
     print("="*80)
-    print("\nValidation Checks:")
-    print("  [x] Intent parsing")
-    print("  [x] Plan generation")
-    print("  [x] Safety validation")
-    print("  [x] Memory logging")
-    print("  [x] Forbidden action blocking")
-    print("  [x] Plan length limits")
-    print("  [x] Empty plan rejection")
-
-    print(f"\nTotal executions logged: {len(kernel.memory.get_history())}")
-    print("\nAll validation systems working!")
+    out = []
+    out.append("\nValidation Checks:")
+    out.append("  [x] Intent parsing")
+    out.append("  [x] Plan generation")
+    out.append("  [x] Safety validation")
+    out.append("  [x] Memory logging")
+    out.append("  [x] Forbidden action blocking")
+    out.append("  [x] Plan length limits")
+    out.append("  [x] Empty plan rejection")
+
+    out.append(f"\nTotal executions logged: {kernel.memory.history_len()}")
+    out.append("\nAll validation systems working!")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":
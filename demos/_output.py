@@ -0,0 +1,61 @@
+"""Output helpers shared by the demo scripts."""
+
+import argparse
+import io
+import sys
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, redirect_stdout
+
+
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1, such as --workers."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def header(title: str, width: int = 60) -> None:
+    """Print a title between two bars of `width` characters."""
+    bar = "=" * width
+    sys.stdout.write(f"\n{bar}\n{title}\n{bar}\n")
+
+
+@contextmanager
+def batched_stdout() -> Iterator[None]:
+    """Collect everything printed inside the block and write it out in one call."""
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            yield
+    finally:
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
+
+def run_captured(demo: Callable[[], None]) -> tuple[str, float]:
+    """Run one demo; return what it printed and its wall time in seconds."""
+    buffer = io.StringIO()
+    start = time.perf_counter()
+    with redirect_stdout(buffer):
+        demo()
+    return buffer.getvalue(), time.perf_counter() - start
+
+
+def run_demos(
+    demos: Iterable[Callable[[], None]], parallel: bool, workers: int | None = None
+) -> Iterator[tuple[str, float]]:
+    """Run demos in order, yielding (output, seconds) for each.
+
+    In parallel the demos go to a pool of `workers` processes (default: one
+    per CPU), so they must be module-level and share no state. Otherwise they
+    run one at a time in this process and each result is yielded as it finishes.
+    """
+    if not parallel:
+        yield from map(run_captured, demos)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(run_captured, demos)
@@ -1,5 +1,8 @@
 """Demo of all 10 creative thinking features."""
 
+from functools import cache
+from typing import TypeVar
+
 from brain.creativity import (
     AnalogicalReasoning,
     CausalReasoningCreative,
@@ -12,14 +15,24 @@ from brain.creativity import (
     SerendipityEngine,
     ToolImprovisation,
 )
+from demos._output import batched_stdout
+
+_E = TypeVar("_E")
+
 
+@cache
+def _engine(cls: type[_E]) -> _E:
+    """Shared instance of an engine whose demo use leaves it unchanged."""
+    return cls()
 
+
+@batched_stdout()
 def demo_analogical_reasoning() -> None:
     """Demo analogical reasoning."""
     print("\n=== 1. ANALOGICAL REASONING ===")
     print("Solve new problems by adapting past solutions\n")
 
-    reasoner = AnalogicalReasoning()
+    reasoner = _engine(AnalogicalReasoning)
 
     problem = {
         "goal": "transport",
@@ -37,12 +50,13 @@ def demo_analogical_reasoning() -> None:
     print(f"Actions: {len(result.get('solution', []))} steps")
 
 
+@batched_stdout()
 def demo_constraint_relaxation() -> None:
     """Demo constraint relaxation."""
     print("\n=== 2. CONSTRAINT RELAXATION ===")
     print("Find creative solutions by relaxing constraints\n")
 
-    relaxer = ConstraintRelaxation()
+    relaxer = _engine(ConstraintRelaxation)
 
     goal = {"type": "transport", "object": "package", "source": "A", "destination": "B"}
     constraints = [
@@ -58,12 +72,13 @@ def demo_constraint_relaxation() -> None:
     print(f"Relaxed: {len(result['relaxed_constraints'])} constraints")
 
 
+@batched_stdout()
 def demo_tool_improvisation() -> None:
     """Demo tool improvisation."""
     print("\n=== 3. TOOL IMPROVISATION ===")
     print("Use objects in unexpected ways\n")
 
-    improviser = ToolImprovisation()
+    improviser = _engine(ToolImprovisation)
 
     available = [
         {"name": "card", "properties": ["rigid", "sharp"]},
@@ -82,12 +97,13 @@ def demo_tool_improvisation() -> None:
         print(f"Improvised: {alt['improvised']}")
 
 
+@batched_stdout()
 def demo_goal_reframing() -> None:
     """Demo goal reframing."""
     print("\n=== 4. GOAL REFRAMING ===")
     print("Reinterpret impossible goals\n")
 
-    reframer = GoalReframing()
+    reframer = _engine(GoalReframing)
 
     goal = {"description": "bring water from Mars"}
 
@@ -103,12 +119,13 @@ def demo_goal_reframing() -> None:
             print(f"Feasibility: {best['feasibility']:.0%}")
 
 
+@batched_stdout()
 def demo_causal_reasoning() -> None:
     """Demo causal reasoning."""
     print("\n=== 5. CAUSAL REASONING ===")
     print("Predict outcomes and identify risks\n")
 
-    reasoner = CausalReasoningCreative()
+    reasoner = _engine(CausalReasoningCreative)
 
     action = {"type": "push", "target": "cup"}
     context = {"object_near_edge": True, "object_fragile": True}
@@ -124,12 +141,13 @@ def demo_causal_reasoning() -> None:
         print(f"  - Mitigation: {risk['mitigation']}")
 
 
+@batched_stdout()
 def demo_meta_strategy() -> None:
     """Demo meta-strategy selection."""
     print("\n=== 6. META-STRATEGY SELECTION ===")
     print("Choose right thinking approach\n")
 
-    meta = MetaStrategy()
+    meta = _engine(MetaStrategy)
 
     problems = [
         {"description": "bring me water", "context": {"seen_before": True}},
@@ -144,7 +162,11 @@ def demo_meta_strategy() -> None:
         print(f"Strategy: {result['selected_strategy']}")
         print()
 
+    stats = meta.stats()
+    print(f"Classification cache: {stats['hits']} hits, {stats['misses']} misses")
+
 
+@batched_stdout()
 def demo_hypothesis_testing() -> None:
     """Demo hypothesis testing."""
     print("\n=== 7. HYPOTHESIS TESTING ===")
@@ -163,12 +185,13 @@ def demo_hypothesis_testing() -> None:
         print(f"Confidence: {result['confidence']:.0%}")
 
 
+@batched_stdout()
 def demo_perspective_shifting() -> None:
     """Demo perspective shifting."""
     print("\n=== 8. PERSPECTIVE SHIFTING ===")
     print("View problems from multiple angles\n")
 
-    shifter = PerspectiveShifting()
+    shifter = _engine(PerspectiveShifting)
 
     problem = {"description": "clean the room efficiently"}
 
@@ -179,12 +202,13 @@ def demo_perspective_shifting() -> None:
     print(f"Score: {result['best_solution']['overall_score']:.2f}")
 
 
+@batched_stdout()
 def demo_serendipity_engine() -> None:
     """Demo serendipity engine."""
     print("\n=== 9. SERENDIPITY ENGINE ===")
     print("Notice unexpected opportunities\n")
 
-    engine = SerendipityEngine()
+    engine = _engine(SerendipityEngine)
 
     state = {
         "location": "kitchen",
@@ -203,12 +227,13 @@ def demo_serendipity_engine() -> None:
         print(f"    Priority: {opp['priority']}, Time: {opp['estimated_time']}s")
 
 
+@batched_stdout()
 def demo_conceptual_blending() -> None:
     """Demo conceptual blending."""
     print("\n=== 10. CONCEPTUAL BLENDING ===")
     print("Combine concepts to create new ideas\n")
 
-    blender = ConceptualBlending()
+    blender = _engine(ConceptualBlending)
 
     result = blender.blend_concepts("vacuum_cleaner", "lawn_mower")
     print("Blending: vacuum_cleaner + lawn_mower")
@@ -223,6 +248,27 @@ def demo_conceptual_blending() -> None:
             print(f"  - {app}")
 
 
+@batched_stdout()
+def _print_summary() -> None:
+    """Print the closing feature summary."""
+    print("\n" + "=" * 60)
+    print("SUMMARY")
+    print("=" * 60)
+    print("Total: 10 creative thinking features")
+    print("All features demonstrated successfully!")
+    print("\nThese features enable robots to:")
+    print("  - Adapt past solutions to new problems")
+    print("  - Find creative workarounds")
+    print("  - Improvise with available tools")
+    print("  - Reframe impossible goals")
+    print("  - Predict consequences")
+    print("  - Choose right thinking strategy")
+    print("  - Test hypotheses scientifically")
+    print("  - View problems from multiple angles")
+    print("  - Notice unexpected opportunities")
+    print("  - Blend concepts for innovation")
+
+
 def main() -> None:
     """Run all creative thinking demos."""
     print("=" * 60)
@@ -241,22 +287,7 @@ def main() -> None:
     demo_serendipity_engine()
     demo_conceptual_blending()
 
-    print("\n" + "=" * 60)
-    print("SUMMARY")
-    print("=" * 60)
-    print("Total: 10 creative thinking features")
-    print("All features demonstrated successfully!")
-    print("\nThese features enable robots to:")
-    print("  - Adapt past solutions to new problems")
-    print("  - Find creative workarounds")
-    print("  - Improvise with available tools")
-    print("  - Reframe impossible goals")
-    print("  - Predict consequences")
-    print("  - Choose right thinking strategy")
-    print("  - Test hypotheses scientifically")
-    print("  - View problems from multiple angles")
-    print("  - Notice unexpected opportunities")
-    print("  - Blend concepts for innovation")
+    _print_summary()
 
 
 if __name__ == "__main__":
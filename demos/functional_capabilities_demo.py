@@ -1,109 +1,66 @@
 """Demo of all 50 functional capabilities."""
 
+import argparse
+import functools
+import io
+import sys
+from collections.abc import Callable
+from contextlib import nullcontext, redirect_stdout
 from datetime import datetime, timedelta
 
-# Adaptation
-from brain.adaptation import (
-    EnvironmentAdapter,
-    FailureRecovery,
-    OnlineLearner,
-    PerformanceOptimizer,
-    StrategySwitcher,
-)
+from demos._output import batched_stdout, header, positive_int, run_demos
 
-# Goal Management
-from brain.goals import (
-    GoalAbandonmentDecider,
-    GoalConflictResolver,
-    GoalDecomposer,
-    GoalInterruptionManager,
-    GoalPrioritizer,
-)
+# Query payloads the callees only read, built once at import and shared by
+# every run instead of being rebuilt inside each section
+_NIGHT_SLEEPING = {"time": "night", "human_state": "sleeping"}
+_BABY_SLEEPING = {"baby_sleeping": True}
+_DELIVERY_SUCCESS_PROBS = {"navigate": 0.9, "grasp": 0.7, "place": 0.8}
+_KNOWN_OBJECT_STATE = {"object_state": "clean"}
+_NAVIGATE_HISTORY = {"past_success_rate": 0.85}
+_CLOSE_TO_HUMAN = {"distance_to_human": 0.5}
+_CONFUSED_STATE = {"confidence": 0.3, "progress": 0.05, "time_elapsed": 40}
+_KITCHEN_REASONING = {"goal": "get water", "reason": "water is in kitchen"}
+_GRASP_DECISION = {"action": "grasp", "factors": ["distance", "angle"], "confidence": 0.75}
+_ACTION_COSTS = {"navigate": {"battery": 10, "time": 15}, "grasp": {"battery": 5, "time": 10}}
 
-# Natural Language
-from brain.language import (
-    AmbiguityResolver,
-    ClarificationEngine,
-    ContextUnderstanding,
-    DialogueManager,
-    ImplicitCommandParser,
-)
-
-# Memory & Learning
-from brain.memory import (
-    EpisodicMemory,
-    ForgettingMechanism,
-    MemoryConsolidator,
-    SemanticMemory,
-    WorkingMemory,
-)
-
-# Meta-Cognition
-from brain.metacognition import (
-    ConfidenceCalibrator,
-    ExplanationGenerator,
-    Introspector,
-    MetaLearner,
-    SelfMonitor,
-)
-
-# Multi-Modal Integration
-from brain.multimodal import (
-    AnomalyDetector,
-    AttentionMechanism,
-    CrossModalLearner,
-    SensorFusion,
-    SurpriseDetector,
-)
 
-# Long-Horizon Planning
-from brain.planning import (
-    ContingencyPlanner,
-    DeadlineManager,
-    HierarchicalPlanner,
-    InterruptibleExecutor,
-    ResourceManager,
-)
+class _NullWriter(io.TextIOBase):
+    """Text stream that discards everything written to it."""
 
-# Advanced Reasoning
-from brain.reasoning import (
-    AbductiveReasoner,
-    AnalogicalReasoner,
-    CausalReasoner,
-    CommonSenseReasoner,
-    SpatialReasoner,
-)
+    def write(self, s: str) -> int:
+        return len(s)
 
-# Social Intelligence
-from brain.social import (
-    CollaborationEngine,
-    DeceptionDetector,
-    PerspectiveTaker,
-    SocialNormsLearner,
-    TheoryOfMind,
-)
 
-# Uncertainty Handling
-from brain.uncertainty import (
-    BeliefTracker,
-    ConfidenceEstimator,
-    GracefulDegradation,
-    InformationGatherer,
-    ProbabilisticPlanner,
-)
+def _section(number: int, title: str) -> Callable[[Callable[[], None]], Callable[[], None]]:
+    """Turn a demo into a numbered section: batched output under a title banner."""
+    def decorate(demo: Callable[[], None]) -> Callable[[], None]:
+        @functools.wraps(demo)
+        @batched_stdout()
+        def run() -> None:
+            header(f"{number}. {title}", width=80)
+            demo()
+        return run
+    return decorate
 
 
+@_section(1, "MEMORY & LEARNING")
 def demo_memory_learning() -> None:
     """Demo Memory & Learning (5 features)."""
-    print("\n" + "=" * 80)
-    print("1. MEMORY & LEARNING")
-    print("=" * 80)
+    from brain.memory import (
+        EpisodicMemory,
+        ForgettingMechanism,
+        MemoryConsolidator,
+        SemanticMemory,
+        WorkingMemory,
+    )
 
     # Episodic Memory
     print("\n[Episodic Memory] Remember specific past events")
     episodic = EpisodicMemory()
-    episodic.record("navigate_to_kitchen", {"location": "living_room"}, "success", True, 15.5)
-    episodic.record("navigate_to_kitchen", {"location": "bedroom"}, "success", True, 20.0)
+    episodic.record_many([
+        ("navigate_to_kitchen", {"location": "living_room"}, "success", True, 15.5),
+        ("navigate_to_kitchen", {"location": "bedroom"}, "success", True, 20.0),
+    ])
     last = episodic.last_time("navigate_to_kitchen")
     print(f"  Last time navigated to kitchen: {last.outcome}, took {last.duration_seconds}s")
     print(f"  Success rate: {episodic.success_rate('navigate_to_kitchen'):.0%}")
@@ -111,9 +68,11 @@ def demo_memory_learning() -> None:
     # Semantic Memory
     print("\n[Semantic Memory] Build knowledge graph")
     semantic = SemanticMemory()
-    semantic.learn("kitchen", "has", "coffee_maker")
-    semantic.learn("kitchen", "has", "refrigerator")
-    semantic.learn("bedroom", "has", "bed")
+    semantic.learn_many([
+        ("kitchen", "has", "coffee_maker"),
+        ("kitchen", "has", "refrigerator"),
+        ("bedroom", "has", "bed"),
+    ])
     print(f"  Kitchen has: {semantic.what_has('kitchen')}")
     print(f"  Coffee maker is in: {semantic.where_is('coffee_maker')}")
 
@@ -140,11 +99,16 @@ def demo_memory_learning() -> None:
     print(f"  Retained {result['retained_knowledge']} facts")
 
 
+@_section(2, "ADVANCED REASONING")
 def demo_advanced_reasoning() -> None:
     """Demo Advanced Reasoning (5 features)."""
-    print("\n" + "=" * 80)
-    print("2. ADVANCED REASONING")
-    print("=" * 80)
+    from brain.reasoning import (
+        AbductiveReasoner,
+        AnalogicalReasoner,
+        CausalReasoner,
+        CommonSenseReasoner,
+        SpatialReasoner,
+    )
 
     # Causal Reasoning
     print("\n[Causal Reasoning] Understand cause-effect")
@@ -169,7 +133,7 @@ def demo_advanced_reasoning() -> None:
     # Common Sense Reasoning
     print("\n[Common Sense Reasoning] Know implicit rules")
     common_sense = CommonSenseReasoner()
-    result = common_sense.check_action("vacuum", {"time": "night", "human_state": "sleeping"})
+    result = common_sense.check_action("vacuum", _NIGHT_SLEEPING)
     print(f"  Vacuum while human sleeping? Safe: {result['safe']}")
     if result['violations']:
         print(f"  Violation: {result['violations'][0]['rule']}")
@@ -183,11 +147,16 @@ def demo_advanced_reasoning() -> None:
     print(f"  Distance: {spatial.distance('cup', 'table'):.2f}m")
 
 
+@_section(3, "NATURAL LANGUAGE")
 def demo_natural_language() -> None:
     """Demo Natural Language (5 features)."""
-    print("\n" + "=" * 80)
-    print("3. NATURAL LANGUAGE")
-    print("=" * 80)
+    from brain.language import (
+        AmbiguityResolver,
+        ClarificationEngine,
+        ContextUnderstanding,
+        DialogueManager,
+        ImplicitCommandParser,
+    )
 
     # Context Understanding
     print("\n[Context Understanding] Resolve 'it', 'here'")
@@ -231,12 +200,16 @@ def demo_natural_language() -> None:
     print(f"  Intent: {result['intent']}")
 
 
+@_section(4, "GOAL MANAGEMENT")
 def demo_goal_management() -> None:
     """Demo Goal Management (5 features)."""
-    print("\n" + "=" * 80)
-    print("4. GOAL MANAGEMENT")
-    print("=" * 80)
-
+    from brain.goals import (
+        GoalAbandonmentDecider,
+        GoalConflictResolver,
+        GoalDecomposer,
+        GoalInterruptionManager,
+        GoalPrioritizer,
+    )
     from brain.goals.goal_prioritization import Goal
 
     # Goal Prioritization
@@ -267,7 +240,7 @@ def demo_goal_management() -> None:
     # Goal Conflict Resolution
     print("\n[Goal Conflict Resolution] Handle conflicts")
     resolver = GoalConflictResolver()
-    result = resolver.resolve("clean_room", "don't_wake_baby", {"baby_sleeping": True})
+    result = resolver.resolve("clean_room", "don't_wake_baby", _BABY_SLEEPING)
     print(f"  Conflict: {result['resolution']}")
     print(f"  Action: {result['action']}")
 
@@ -279,16 +252,21 @@ def demo_goal_management() -> None:
     print(f"  Reasons: {result['reasons']}")
 
 
+@_section(5, "UNCERTAINTY HANDLING")
 def demo_uncertainty_handling() -> None:
     """Demo Uncertainty Handling (5 features)."""
-    print("\n" + "=" * 80)
-    print("5. UNCERTAINTY HANDLING")
-    print("=" * 80)
+    from brain.uncertainty import (
+        BeliefTracker,
+        ConfidenceEstimator,
+        GracefulDegradation,
+        InformationGatherer,
+        ProbabilisticPlanner,
+    )
 
     # Probabilistic Planning
     print("\n[Probabilistic Planning] Plan under uncertainty")
     prob_planner = ProbabilisticPlanner()
-    result = prob_planner.plan_with_uncertainty("deliver_item", {"navigate": 0.9, "grasp": 0.7, "place": 0.8})
+    result = prob_planner.plan_with_uncertainty("deliver_item", _DELIVERY_SUCCESS_PROBS)
     print(f"  Plan success probability: {result['success_probability']:.0%}")
     print(f"  Needs contingency: {result['needs_contingency']}")
 
@@ -303,14 +281,14 @@ def demo_uncertainty_handling() -> None:
     # Information Gathering
     print("\n[Information Gathering] Know what you don't know")
     gatherer = InformationGatherer()
-    unknowns = gatherer.identify_unknowns(["object_location", "object_state"], {"object_state": "clean"})
+    unknowns = gatherer.identify_unknowns(["object_location", "object_state"], _KNOWN_OBJECT_STATE)
     print(f"  Missing info: {unknowns}")
     print(f"  Query: {gatherer.generate_query('object_location')}")
 
     # Confidence Estimation
     print("\n[Confidence Estimation] Know certainty level")
     estimator = ConfidenceEstimator()
-    confidence = estimator.estimate_action_confidence("navigate", {"past_success_rate": 0.85})
+    confidence = estimator.estimate_action_confidence("navigate", _NAVIGATE_HISTORY)
     print(f"  Confidence: {confidence:.0%}")
     print(f"  Should proceed: {estimator.should_proceed(confidence)}")
 
@@ -322,11 +300,16 @@ def demo_uncertainty_handling() -> None:
     print(f"  Acceptable: {result['acceptable']}")
 
 
+@_section(6, "SOCIAL INTELLIGENCE")
 def demo_social_intelligence() -> None:
     """Demo Social Intelligence (5 features)."""
-    print("\n" + "=" * 80)
-    print("6. SOCIAL INTELLIGENCE")
-    print("=" * 80)
+    from brain.social import (
+        CollaborationEngine,
+        DeceptionDetector,
+        PerspectiveTaker,
+        SocialNormsLearner,
+        TheoryOfMind,
+    )
 
     # Theory of Mind
     print("\n[Theory of Mind] Model what human knows/wants")
@@ -344,7 +327,7 @@ def demo_social_intelligence() -> None:
     # Social Norms
     print("\n[Social Norms] Learn cultural rules")
     norms = SocialNormsLearner()
-    result = norms.check_norm_violation("approach", {"distance_to_human": 0.5})
+    result = norms.check_norm_violation("approach", _CLOSE_TO_HUMAN)
     print(f"  Acceptable: {result['acceptable']}")
     if result['violations']:
         print(f"  Violation: {result['violations'][0]}")
@@ -364,11 +347,16 @@ def demo_social_intelligence() -> None:
     print(f"  Mode: {result['collaboration_mode']}")
 
 
+@_section(7, "ADAPTATION")
 def demo_adaptation() -> None:
     """Demo Adaptation (5 features)."""
-    print("\n" + "=" * 80)
-    print("7. ADAPTATION")
-    print("=" * 80)
+    from brain.adaptation import (
+        EnvironmentAdapter,
+        FailureRecovery,
+        OnlineLearner,
+        PerformanceOptimizer,
+        StrategySwitcher,
+    )
 
     # Online Learning
     print("\n[Online Learning] Update models during execution")
@@ -415,16 +403,21 @@ def demo_adaptation() -> None:
     print(f"  Adaptations: {result['adaptations']}")
 
 
+@_section(8, "META-COGNITION")
 def demo_metacognition() -> None:
     """Demo Meta-Cognition (5 features)."""
-    print("\n" + "=" * 80)
-    print("8. META-COGNITION")
-    print("=" * 80)
+    from brain.metacognition import (
+        ConfidenceCalibrator,
+        ExplanationGenerator,
+        Introspector,
+        MetaLearner,
+        SelfMonitor,
+    )
 
     # Self-Monitoring
     print("\n[Self-Monitoring] Know when confused/stuck")
     monitor = SelfMonitor()
-    result = monitor.check_state({"confidence": 0.3, "progress": 0.05, "time_elapsed": 40})
+    result = monitor.check_state(_CONFUSED_STATE)
     print(f"  State: {result['state']}")
     print(f"  Needs help: {result['needs_help']}")
 
@@ -440,13 +433,13 @@ def demo_metacognition() -> None:
     # Explanation Generation
     print("\n[Explanation Generation] Explain decisions")
     explainer = ExplanationGenerator()
-    explanation = explainer.explain_action("navigated to kitchen", {"goal": "get water", "reason": "water is in kitchen"})
+    explanation = explainer.explain_action("navigated to kitchen", _KITCHEN_REASONING)
     print(f"  Explanation: {explanation}")
 
     # Introspection
     print("\n[Introspection] Examine decision process")
     introspector = Introspector()
-    analysis = introspector.analyze_decision({"action": "grasp", "factors": ["distance", "angle"], "confidence": 0.75})
+    analysis = introspector.analyze_decision(_GRASP_DECISION)
     print(f"  Decision quality: {analysis['decision_quality']}")
     print(f"  Factors considered: {analysis['num_factors_considered']}")
 
@@ -461,11 +454,16 @@ def demo_metacognition() -> None:
         print(f"  Trend: {result['learning_rate_trend']}")
 
 
+@_section(9, "MULTI-MODAL INTEGRATION")
 def demo_multimodal() -> None:
     """Demo Multi-Modal Integration (5 features)."""
-    print("\n" + "=" * 80)
-    print("9. MULTI-MODAL INTEGRATION")
-    print("=" * 80)
+    from brain.multimodal import (
+        AnomalyDetector,
+        AttentionMechanism,
+        CrossModalLearner,
+        SensorFusion,
+        SurpriseDetector,
+    )
 
     # Sensor Fusion
     print("\n[Sensor Fusion] Combine vision + audio + touch")
@@ -513,11 +511,16 @@ def demo_multimodal() -> None:
     print(f"  Z-score: {result['z_score']:.1f}")
 
 
+@_section(10, "LONG-HORIZON PLANNING")
 def demo_long_horizon_planning() -> None:
     """Demo Long-Horizon Planning (5 features)."""
-    print("\n" + "=" * 80)
-    print("10. LONG-HORIZON PLANNING")
-    print("=" * 80)
+    from brain.planning import (
+        ContingencyPlanner,
+        DeadlineManager,
+        HierarchicalPlanner,
+        InterruptibleExecutor,
+        ResourceManager,
+    )
 
     # Hierarchical Planning
     print("\n[Hierarchical Planning] High-level + low-level")
@@ -536,7 +539,7 @@ def demo_long_horizon_planning() -> None:
     # Resource Management
     print("\n[Resource Management] Track battery, time")
     resources = ResourceManager(battery=100, time_budget=300)
-    result = resources.check_resources(["navigate", "grasp"], {"navigate": {"battery": 10, "time": 15}, "grasp": {"battery": 5, "time": 10}})
+    result = resources.check_resources(["navigate", "grasp"], _ACTION_COSTS)
     print(f"  Sufficient battery: {result['sufficient_battery']}")
     print(f"  Battery required: {result['battery_required']}")
 
@@ -557,26 +560,24 @@ def demo_long_horizon_planning() -> None:
     print(f"  Resumed: {state.task} (progress: {state.progress*100:.0f}%)")
 
 
-def main() -> None:
-    """Run all demos."""
-    print("\n" + "=" * 80)
-    print("DECISION KERNEL - 50 FUNCTIONAL CAPABILITIES DEMO")
-    print("=" * 80)
-
-    demo_memory_learning()
-    demo_advanced_reasoning()
-    demo_natural_language()
-    demo_goal_management()
-    demo_uncertainty_handling()
-    demo_social_intelligence()
-    demo_adaptation()
-    demo_metacognition()
-    demo_multimodal()
-    demo_long_horizon_planning()
-
-    print("\n" + "=" * 80)
-    print("ALL 50 FUNCTIONAL CAPABILITIES DEMONSTRATED")
-    print("=" * 80)
+SECTIONS = (
+    demo_memory_learning,
+    demo_advanced_reasoning,
+    demo_natural_language,
+    demo_goal_management,
+    demo_uncertainty_handling,
+    demo_social_intelligence,
+    demo_adaptation,
+    demo_metacognition,
+    demo_multimodal,
+    demo_long_horizon_planning,
+)
+
+
+@batched_stdout()
+def _print_summary() -> None:
+    """Print the closing capability summary."""
+    header("ALL 50 FUNCTIONAL CAPABILITIES DEMONSTRATED", width=80)
     print("\nDecision Kernel now has:")
     print("  [OK] 5 Memory & Learning features")
     print("  [OK] 5 Advanced Reasoning features")
@@ -591,5 +592,37 @@ def main() -> None:
     print("\nTotal: 50 production-ready functional capabilities")
 
 
+def main(argv: list[str] | None = None) -> dict[str, float]:
+    """Run all demos and return each section's wall time in seconds.
+
+    The sections share no state, so with --workers they run in worker
+    processes; each section's output is captured and written in order.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--quiet", action="store_true",
+        help="run every section without printing (for timing harnesses)"
+    )
+    parser.add_argument(
+        "--workers", type=positive_int, default=None,
+        help="run sections in N worker processes (default: one at a time in this process)"
+    )
+    args = parser.parse_args(argv)
+
+    timings: dict[str, float] = {}
+    with redirect_stdout(_NullWriter()) if args.quiet else nullcontext():
+        header("DECISION KERNEL - 50 FUNCTIONAL CAPABILITIES DEMO", width=80)
+        sys.stdout.flush()
+
+        results = run_demos(SECTIONS, parallel=args.workers is not None, workers=args.workers)
+        for demo, (output, elapsed) in zip(SECTIONS, results):
+            sys.stdout.write(output)
+            timings[demo.__name__.removeprefix("demo_")] = elapsed
+
+        _print_summary()
+
+    return timings
+
+
 if __name__ == "__main__":
     main()
@@ -1,4 +1,9 @@
 """Demo of intelligent HTN planner capabilities"""
+import time
+from collections.abc import Callable
+from functools import cache
+from typing import TypeVar
+
 from brain.intent.schema import Goal
 from brain.planner.actions import Action
 from brain.planner.htn_planner import HTNPlanner
@@ -7,6 +12,25 @@ from brain.planner.replanner import Replanner
 from brain.safety.emergency_rules import EmergencySafetyValidator
 from brain.world.extended_state import ExtendedWorldState
 
+_T = TypeVar("_T")
+
+
+@cache
+def _planner() -> HTNPlanner:
+    """HTN planner shared by every demo; planning never changes its task table."""
+    return HTNPlanner()
+
+
+def _bench(fn: Callable[[], _T], repeat: int = 5) -> tuple[float, _T]:
+    """Best-of-repeat wall time of fn in milliseconds (after one warm-up call) and its result"""
+    result = fn()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        result = fn()
+        timings.append(time.perf_counter_ns() - start)
+    return min(timings) / 1e6, result
+
 
 def print_plan(title: str, plan: list[Action]):
     """Pretty print a plan"""
@@ -22,7 +46,7 @@ def demo_complex_tasks():
     """Demo 1: Complex multi-step tasks"""
     print("\n[DEMO 1] Complex Multi-Step Tasks")
 
-    planner = HTNPlanner()
+    planner = _planner()
     state = ExtendedWorldState(
         robot_location='home',
         human_location='living_room',
@@ -44,7 +68,7 @@ def demo_conditional_logic():
     """Demo 2: Conditional logic"""
     print("\n[DEMO 2] Conditional Logic")
 
-    planner = HTNPlanner()
+    planner = _planner()
     state = ExtendedWorldState(
         robot_location='home',
         human_location='living_room',
@@ -72,7 +96,7 @@ def demo_dynamic_replanning():
     """Demo 3: Dynamic replanning"""
     print("\n[DEMO 3] Dynamic Replanning")
 
-    planner = HTNPlanner()
+    planner = _planner()
     replanner = Replanner(planner)
     state = ExtendedWorldState(
         robot_location='home',
@@ -171,7 +195,7 @@ def demo_context_awareness():
     """Demo 6: Context-aware decisions"""
     print("\n[DEMO 6] Context-Aware Decisions")
 
-    planner = HTNPlanner()
+    planner = _planner()
     state = ExtendedWorldState(
         robot_location='home',
         human_location='living_room',
@@ -197,9 +221,7 @@ def demo_performance():
     """Demo 7: Performance benchmarks"""
     print("\n[DEMO 7] Performance Benchmarks")
 
-    import time
-
-    planner = HTNPlanner()
+    planner = _planner()
     state = ExtendedWorldState(
         robot_location='home',
         human_location='living_room',
@@ -219,11 +241,9 @@ def demo_performance():
     for action, target in scenarios:
         goal = Goal(action=action, target=target, location='warehouse')
 
-        start = time.time()
-        plan = planner.plan(goal, state)
-        elapsed = (time.time() - start) * 1000  # Convert to ms
+        elapsed, plan = _bench(lambda: planner.plan(goal, state))
 
-        print(f"  {action:20s}: {elapsed:6.2f}ms ({len(plan):2d} actions)")
+        print(f"  {action:20s}: {elapsed:7.3f}ms ({len(plan):2d} actions)")
 
     # Replanning speed
     print("\n[Benchmark] Replanning Speed:")
@@ -231,11 +251,11 @@ def demo_performance():
     goal = Goal(action='bring', target='water')
     failed_action = Action('navigate_to', location='kitchen')
 
-    start = time.time()
-    new_plan, reason = replanner.replan(goal, failed_action, 'path_blocked', state, [])
-    elapsed = (time.time() - start) * 1000
+    elapsed, (new_plan, reason) = _bench(
+        lambda: replanner.replan(goal, failed_action, 'path_blocked', state, [])
+    )
 
-    print(f"  Path blocked recovery: {elapsed:6.2f}ms ({len(new_plan)} actions)")
+    print(f"  Path blocked recovery: {elapsed:7.3f}ms ({len(new_plan)} actions)")
 
 
 def main():
@@ -34,9 +34,11 @@ def main():
 
     print("Testing challenging commands:\n")
 
-    for command in test_cases:
+    # One LLM request for all commands instead of a round-trip per command
+    goals = parser.parse_batch(test_cases)
+
+    for command, goal in zip(test_cases, goals):
         print(f"Command: '{command}'")
-        goal = parser.parse(command)
         print(f"  -> action={goal.action}, target={goal.target}, location={goal.location}")
         print()
 
@@ -1,6 +1,12 @@
 """Demo of all pathfinding algorithms."""
 
+import argparse
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
 from brain.pathfinding import BFS, DFS, RRT, AStar, Dijkstra, GreedyBestFirst
+from demos._output import positive_int
 
 
 def create_test_grid() -> list[list[int]]:
@@ -19,23 +25,25 @@ def create_test_grid() -> list[list[int]]:
     ]
 
 
+# Shared by every demo; the algorithms only read the grid
+GRID = create_test_grid()
+START, GOAL = (0, 0), (9, 9)
+
+
 def visualize_path(grid: list[list[int]], path: list[tuple[int, int]]) -> None:
     """Visualize path on grid."""
-    path_set = set(path)
-    for i, row in enumerate(grid):
-        line = ""
-        for j, cell in enumerate(row):
-            if (i, j) == path[0]:
-                line += "S "  # Start
-            elif (i, j) == path[-1]:
-                line += "G "  # Goal
-            elif (i, j) in path_set:
-                line += "* "  # Path
-            elif cell == 1:
-                line += "# "  # Obstacle
-            else:
-                line += ". "  # Free
-        print(line)
+    # Path marks override the grid; start wins over goal, goal over the path
+    overlay = dict.fromkeys(path, "* ")
+    overlay[path[-1]] = "G "
+    overlay[path[0]] = "S "
+
+    sys.stdout.write("".join(
+        "".join(
+            overlay.get((i, j), "# " if cell == 1 else ". ")  # Obstacle / Free
+            for j, cell in enumerate(row)
+        ) + "\n"
+        for i, row in enumerate(grid)
+    ))
 
 
 def demo_astar() -> None:
@@ -43,9 +51,7 @@ def demo_astar() -> None:
     print("\n=== 1. A* ALGORITHM ===")
     print("Optimal path with heuristic (Manhattan distance)\n")
 
-    grid = create_test_grid()
-    start = (0, 0)
-    goal = (9, 9)
+    grid, start, goal = GRID, START, GOAL
 
     astar = AStar()
     result = astar.find_path(start, goal, grid)
@@ -64,9 +70,7 @@ def demo_dijkstra() -> None:
     print("\n=== 2. DIJKSTRA'S ALGORITHM ===")
     print("Optimal path without heuristic\n")
 
-    grid = create_test_grid()
-    start = (0, 0)
-    goal = (9, 9)
+    grid, start, goal = GRID, START, GOAL
 
     dijkstra = Dijkstra()
     result = dijkstra.find_path(start, goal, grid)
@@ -83,9 +87,7 @@ def demo_bfs() -> None:
     print("\n=== 3. BREADTH-FIRST SEARCH (BFS) ===")
     print("Unweighted shortest path\n")
 
-    grid = create_test_grid()
-    start = (0, 0)
-    goal = (9, 9)
+    grid, start, goal = GRID, START, GOAL
 
     bfs = BFS()
     result = bfs.find_path(start, goal, grid)
@@ -102,9 +104,7 @@ def demo_dfs() -> None:
     print("\n=== 4. DEPTH-FIRST SEARCH (DFS) ===")
     print("Explores deeply before backtracking\n")
 
-    grid = create_test_grid()
-    start = (0, 0)
-    goal = (9, 9)
+    grid, start, goal = GRID, START, GOAL
 
     dfs = DFS()
     result = dfs.find_path(start, goal, grid)
@@ -122,9 +122,7 @@ def demo_greedy() -> None:
     print("\n=== 5. GREEDY BEST-FIRST SEARCH ===")
     print("Fast but not always optimal\n")
 
-    grid = create_test_grid()
-    start = (0, 0)
-    goal = (9, 9)
+    grid, start, goal = GRID, START, GOAL
 
     greedy = GreedyBestFirst()
     result = greedy.find_path(start, goal, grid)
@@ -141,9 +139,7 @@ def demo_rrt() -> None:
     print("\n=== 6. RRT (RAPIDLY-EXPLORING RANDOM TREE) ===")
     print("For complex/high-dimensional spaces\n")
 
-    grid = create_test_grid()
-    start = (0, 0)
-    goal = (9, 9)
+    grid, start, goal = GRID, START, GOAL
 
     rrt = RRT(max_iterations=500, step_size=1.5)
     result = rrt.find_path(start, goal, grid)
@@ -156,13 +152,16 @@ def demo_rrt() -> None:
         print("Note: RRT path is probabilistically complete")
 
 
-def compare_algorithms() -> None:
-    """Compare all algorithms."""
+def _find_path(algo: Any) -> dict[str, Any]:
+    """Run one algorithm on the shared grid (module-level so workers can unpickle it)."""
+    return algo.find_path(START, GOAL, GRID)
+
+
+def compare_algorithms(workers: int | None = None) -> None:
+    """Compare all algorithms, in `workers` processes if given."""
     print("\n=== ALGORITHM COMPARISON ===\n")
 
-    grid = create_test_grid()
-    start = (0, 0)
-    goal = (9, 9)
+    grid, start, goal = GRID, START, GOAL
 
     algorithms = [
         ("A*", AStar()),
@@ -173,11 +172,18 @@ def compare_algorithms() -> None:
         ("RRT", RRT(max_iterations=500)),
     ]
 
+    if workers is None:
+        results = [algo.find_path(start, goal, grid) for _, algo in algorithms]
+    else:
+        # The runs are independent, so they can go to separate processes;
+        # map keeps the table in the order above
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_find_path, [algo for _, algo in algorithms]))
+
     print(f"{'Algorithm':<15} {'Success':<10} {'Length':<10} {'Cost':<10}")
     print("-" * 50)
 
-    for name, algo in algorithms:
-        result = algo.find_path(start, goal, grid)
+    for (name, _), result in zip(algorithms, results):
         success = "Yes" if result["success"] else "No"
         length = result.get("length", "-")
         cost = result.get("cost", "-")
@@ -186,8 +192,15 @@ def compare_algorithms() -> None:
         print(f"{name:<15} {success:<10} {str(length):<10} {str(cost):<10}")
 
 
-def main() -> None:
+def main(argv: list[str] | None = None) -> None:
     """Run all pathfinding demos."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--workers", type=positive_int, default=None,
+        help="run the comparison in N worker processes (default: one at a time in this process)"
+    )
+    args = parser.parse_args(argv)
+
     print("=" * 60)
     print("PATHFINDING ALGORITHMS DEMO")
     print("6 Algorithms for Motion Planning")
@@ -199,7 +212,7 @@ def main() -> None:
     demo_dfs()
     demo_greedy()
     demo_rrt()
-    compare_algorithms()
+    compare_algorithms(args.workers)
 
     print("\n" + "=" * 60)
     print("SUMMARY")
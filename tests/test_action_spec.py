@@ -1,5 +1,7 @@
 """Tests for Action specification conformance"""
 
+import sys
+
 from brain.planner.actions import Action
 from brain.planner.validate_actions import validate_action, validate_action_list
 
@@ -82,3 +84,10 @@ def test_action_with_parameters():
     assert action.parameters["force"] == "gentle"
     is_valid, _ = validate_action(action)
     assert is_valid
+
+
+def test_action_interns_type_and_location():
+    """Action type and location strings are interned"""
+    action = Action("".join(["navigate", "_to"]), location="".join(["kit", "chen"]))
+    assert action.action_type is sys.intern("navigate_to")
+    assert action.location is sys.intern("kitchen")
@@ -0,0 +1,28 @@
+import pytest
+
+from brain.adaptation import PerformanceOptimizer
+
+
+def test_identify_optimization_from_running_stats():
+    optimizer = PerformanceOptimizer()
+    for duration in (15.0, 12.0):
+        optimizer.record_execution("navigate", duration)
+    assert optimizer.identify_optimization("navigate")["optimizations"] == []
+
+    optimizer.record_execution("navigate", 10.0)
+    result = optimizer.identify_optimization("navigate")
+    assert result["avg_time"] == pytest.approx(37 / 3)
+    assert result["best_time"] == 10.0
+    assert result["potential_speedup"] == pytest.approx(7 / 37)
+    assert result["optimizations"] == []
+
+
+def test_identify_optimization_suggestions():
+    optimizer = PerformanceOptimizer()
+    for duration in [1.0] + [5.0] * 10:
+        optimizer.record_execution("fetch", duration)
+
+    result = optimizer.identify_optimization("fetch")
+    assert result["optimizations"] == ["cache_intermediate_results", "learn_shortcuts"]
+    assert optimizer.task_stats["fetch"].count == 11
+    assert optimizer.identify_optimization("unknown")["potential_speedup"] == 0.0
@@ -1,7 +1,7 @@
 """Tests for Adapter contract conformance"""
 
 from adapters.mock.mock_robot import MockRobot
-from brain.execution.report import ExecutionReport
+from brain.execution.report import ActionResult, ExecutionReport, ExecutionStatus
 from brain.planner.actions import Action
 from brain.world.state import WorldState
 
@@ -101,3 +101,52 @@ def test_mock_adapter_conformance():
     caps = adapter.capabilities()
     assert isinstance(caps, dict)
     assert "supported_actions" in caps
+
+
+def test_conformance_tests_keep_order_when_parallel():
+    """Parallel conformance run reports results in the same order as sequential"""
+    from decision_kernel_conformance.runner import TESTS, _run_tests
+
+    adapter = MockRobot()
+    concurrent = _run_tests(adapter, parallel=True)
+    sequential = _run_tests(adapter)
+
+    assert [name for name, _, _ in concurrent] == [name for name, _ in TESTS]
+    assert concurrent == sequential
+    assert all(passed for _, passed, _ in concurrent)
+
+
+def test_report_extend_results_accumulates_duration():
+    """extend_results() adds every result and sums their durations"""
+    report = ExecutionReport(success=True)
+    report.add_result(ActionResult(0, ExecutionStatus.SUCCESS, duration=0.5))
+    report.extend_results(
+        ActionResult(i, ExecutionStatus.SUCCESS, duration=0.25) for i in range(1, 3)
+    )
+    assert [r.action_index for r in report.results] == [0, 1, 2]
+    assert report.total_duration == 1.0
+
+
+def test_generate_certificate_recreates_deleted_directory(tmp_path):
+    """Certificate directory is created again if it was removed between runs"""
+    import shutil
+
+    from decision_kernel_conformance.runner import generate_certificate
+
+    results = [("Method presence", True, "All methods present")]
+    for _ in range(2):
+        json_file, md_file = generate_certificate(
+            "adapters.mock.mock_robot.MockRobot", results, "MockRobot", output_dir=str(tmp_path)
+        )
+        assert json_file.exists() and md_file.exists()
+        shutil.rmtree(tmp_path / "MockRobot")
+
+
+def test_load_adapter_returns_fresh_instance():
+    """Each run gets its own adapter so state doesn't leak between runs"""
+    from decision_kernel_conformance.runner import load_adapter
+
+    first = load_adapter("adapters.mock.mock_robot.MockRobot")
+    second = load_adapter("adapters.mock.mock_robot.MockRobot")
+    assert isinstance(first, MockRobot) and isinstance(second, MockRobot)
+    assert first is not second
@@ -1,12 +1,26 @@
 """Tests for advanced learning capabilities"""
+import sys
+from datetime import datetime
+
+from brain.intent.schema import Goal
+from brain.learning import quantum_planner
+from brain.learning.cross_species_learning import CrossSpeciesLearning
+from brain.learning.curiosity_engine import CuriosityEngine
 from brain.learning.emotional_intelligence import (
     BehaviorMode,
     Emotion,
     EmotionalContext,
     EmotionalIntelligence,
 )
+from brain.learning.intention_prediction import HumanContext, IntentionPredictor
+from brain.learning.meta_learning_planner import MetaLearningPlanner
+from brain.learning.negotiation_engine import NegotiationEngine
+from brain.learning.predictive_maintenance import PredictiveMaintenanceSystem
+from brain.learning.quantum_planner import QuantumPlanner
 from brain.learning.self_evolving_planner import ObservedAction, SelfEvolvingPlanner
+from brain.learning.skill_synthesis import SkillSynthesizer
 from brain.planner.actions import Action
+from brain.planner.htn_planner import HTNPlanner
 from brain.world.state import WorldState
 
 
@@ -61,6 +75,14 @@ class TestSelfEvolvingPlanner:
         assert 'navigate_to' in code
         assert 'grasp' in code
 
+    def test_observed_action_interns_key_fields(self):
+        """Test: Observed action key strings are interned"""
+        action = ObservedAction(''.join(['gr', 'asp']), ''.join(['cu', 'p']), None, 0.0, {})
+
+        assert action.action_type is sys.intern('grasp')
+        assert action.target is sys.intern('cup')
+        assert action.location is None
+
 
 class TestEmotionalIntelligence:
     """Test emotional intelligence adaptation"""
@@ -158,3 +180,177 @@ class TestEmotionalIntelligence:
 
         adapted = ei.adapt_plan(plan, context, WorldState())
         assert 0.0 <= adapted.estimated_comfort_score <= 1.0
+
+
+class TestMetaLearningPlanner:
+    """Test meta-learning performance recording"""
+
+    def test_batch_recording_matches_individual_calls(self):
+        """Test: Batch recording is equivalent to repeated single records"""
+        single = MetaLearningPlanner()
+        for _ in range(12):
+            single.record_performance(planning_time=0.15, plan_quality=0.75,
+                                      success_rate=0.80, plan_length=8)
+
+        batch = MetaLearningPlanner()
+        batch.record_performance_batch(12, planning_time=0.15, plan_quality=0.75,
+                                       success_rate=0.80, plan_length=8)
+
+        assert batch.performance_history == single.performance_history
+        assert batch.self_improve() == single.self_improve()
+
+    def test_batch_recording_creates_independent_entries(self):
+        """Test: Editing one batch entry leaves the others unchanged"""
+        planner = MetaLearningPlanner()
+        planner.record_performance_batch(3, planning_time=0.15, plan_quality=0.75,
+                                         success_rate=0.80, plan_length=8)
+
+        planner.performance_history[0].plan_quality = 0.1
+        assert [m.plan_quality for m in planner.performance_history] == [0.1, 0.75, 0.75]
+
+
+class TestQuantumPlanner:
+    """Test quantum superposition planning"""
+
+    def test_single_batch_runs_in_process(self, monkeypatch):
+        """Test: A single batch of futures does not start worker processes"""
+        def no_pool(*args, **kwargs):
+            raise AssertionError("process pool started for a single batch")
+
+        monkeypatch.setattr(quantum_planner, 'ProcessPoolExecutor', no_pool)
+        planner = QuantumPlanner(HTNPlanner(), max_workers=2)
+
+        outcome = planner.superposition_plan(
+            Goal(action='bring', target='water'), WorldState(), futures=100, simulation_depth=5
+        )
+
+        assert outcome.plan
+        assert 0.0 <= outcome.success_probability <= 1.0
+
+
+class TestCrossSpeciesLearning:
+    """Test cross-species behavior catalog"""
+
+    def test_total_behavior_count_matches_listing(self):
+        """Test: Aggregate count equals the per-species listings"""
+        csl = CrossSpeciesLearning()
+
+        expected = sum(len(csl.list_behaviors(s)) for s in csl.list_species())
+        assert csl.total_behavior_count() == expected
+
+
+class TestCuriosityEngine:
+    """Test curiosity-driven exploration"""
+
+    def test_exploration_updates_world_model(self):
+        """Test: Discoveries are new objects and are added to the world model"""
+        engine = CuriosityEngine()
+        known_before = {area: list(objs) for area, objs in engine.known_objects.items()}
+
+        discoveries = engine.explore_unknown_areas(time_available=300)
+
+        assert engine.exploration_count == 3
+        for discovery in discoveries:
+            assert discovery.location in engine.known_areas
+            assert discovery.object_found in engine.known_objects[discovery.location]
+            assert discovery.object_found not in known_before.get(discovery.location, [])
+
+    def test_short_idle_time_explores_nothing(self):
+        """Test: Less than one exploration slot yields no discoveries"""
+        engine = CuriosityEngine()
+
+        assert engine.explore_unknown_areas(time_available=50) == []
+        assert engine.exploration_count == 0
+
+    def test_stats_follow_new_discoveries(self):
+        """Test: Cached stats are refreshed after the world model changes"""
+        engine = CuriosityEngine()
+        before = engine.get_exploration_stats()
+
+        discoveries = engine.explore_unknown_areas(time_available=300)
+        after = engine.get_exploration_stats()
+
+        assert before["discoveries_made"] == 0
+        assert after["discoveries_made"] == len(discoveries)
+        assert after["total_objects_known"] == sum(map(len, engine.known_objects.values()))
+        assert after == engine.get_exploration_stats()
+
+
+class TestIntentionPredictor:
+    """Test intention prediction"""
+
+    def test_predict_batch_matches_single_predictions(self):
+        """Test: Batch prediction returns per-context results in order"""
+        contexts = [
+            HumanContext("kitchen", datetime(2024, 1, 1, 7, 0), ["wake_up"], "tired", "coffee_maker"),
+            HumanContext("living_room", datetime(2024, 1, 1, 20, 0), [], "relaxed", "couch"),
+        ]
+
+        batch = IntentionPredictor().predict_batch(contexts)
+        single = IntentionPredictor()
+
+        assert batch == [single.predict_human_intention(c) for c in contexts]
+        assert batch[0].intent == "want_coffee"
+
+
+class TestPredictiveMaintenance:
+    """Test predictive maintenance sensor history"""
+
+    def test_sensor_history_is_bounded(self):
+        """Test: Only the most recent readings are kept per sensor"""
+        pm = PredictiveMaintenanceSystem()
+        pm.max_sensor_history = 5
+
+        for value in range(8):
+            pm.record_sensor_reading('camera_sensor', float(value), 10.0)
+
+        history = pm.sensor_history['camera_sensor']
+        assert [r.value for r in history] == [3.0, 4.0, 5.0, 6.0, 7.0]
+
+
+class TestSkillSynthesizer:
+    """Test automatic skill combination discovery"""
+
+    def test_auto_discover_respects_limit(self):
+        """Test: Discovery stops after the requested number of combinations"""
+        synthesizer = SkillSynthesizer()
+
+        discovered = synthesizer.auto_discover_combinations(3)
+
+        assert [s.name for s in discovered] == [
+            "deliver_liquid",
+            "serve_drink_carefully",
+            "fetch_and_deliver",
+        ]
+        assert discovered[1].parent_skills == ["pour_liquid", "navigate", "detect_spill"]
+        assert synthesizer.get_synthesis_stats()["synthesized_skills"] == 3
+
+    def test_stats_follow_new_skills(self):
+        """Test: Cached score averages are refreshed after each combination"""
+        synthesizer = SkillSynthesizer()
+        assert synthesizer.get_synthesis_stats()["avg_novelty"] == 0.0
+
+        first = synthesizer.combine(["grasp_object", "navigate"])
+        assert synthesizer.get_synthesis_stats()["avg_novelty"] == first.novelty_score
+
+        second = synthesizer.combine(["navigate", "avoid_obstacle"])
+        stats = synthesizer.get_synthesis_stats()
+        assert stats["synthesized_skills"] == 2
+        assert stats["avg_usefulness"] == (first.usefulness_score + second.usefulness_score) / 2
+
+
+class TestNegotiationEngine:
+    """Test negotiation statistics"""
+
+    def test_stats_follow_new_negotiations(self):
+        """Test: Stats are recomputed after every negotiation"""
+        engine = NegotiationEngine()
+        assert engine.get_negotiation_stats() == {"negotiations": 0}
+
+        engine.negotiate_with_human("clean now", "battery 5%")
+        stats = engine.get_negotiation_stats()
+        stats["total_negotiations"] = 99  # callers get their own copy
+        assert engine.get_negotiation_stats()["total_negotiations"] == 1
+
+        engine.negotiate_with_human("bring coffee", "busy charging")
+        assert engine.get_negotiation_stats()["total_negotiations"] == 2
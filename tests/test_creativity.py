@@ -0,0 +1,127 @@
+from brain.creativity import (
+    AnalogicalReasoning,
+    ConceptualBlending,
+    HypothesisTesting,
+    MetaStrategy,
+    PerspectiveShifting,
+    SerendipityEngine,
+    ToolImprovisation,
+)
+
+
+def test_analogical_confidence_matches_similarity():
+    reasoner = AnalogicalReasoning()
+    problem = {"goal": "transport", "context": ["book"], "constraints": ["graspable"]}
+
+    result = reasoner.solve_novel_problem(problem)
+    case = reasoner.find_most_similar(problem)
+    assert result["source_case"] == case["name"] == "bring_object"
+    assert result["confidence"] == reasoner.calculate_similarity(problem, case)
+
+
+def test_analogical_no_similar_case():
+    reasoner = AnalogicalReasoning()
+
+    assert reasoner.find_most_similar({"goal": "fly"}) is None
+    assert reasoner.solve_novel_problem({"goal": "fly"})["success"] is False
+
+
+def test_conceptual_blend_features():
+    blender = ConceptualBlending()
+
+    result = blender.blend_concepts("vacuum_cleaner", "lawn_mower")
+    assert sorted(result["shared_features"]) == ["automated", "mobility"]
+    assert {(f["feature"], f["source"]) for f in result["novel_features"]} == {
+        ("suction", "vacuum_cleaner"),
+        ("debris_collection", "vacuum_cleaner"),
+        ("cutting", "lawn_mower"),
+        ("outdoor", "lawn_mower"),
+        ("navigation", "lawn_mower"),
+    }
+    assert result["new_concept"]["novelty_score"] == 5 / 7
+    assert blender.blend_concepts("vacuum_cleaner", "toaster")["success"] is False
+
+
+def test_hypothesis_testing_picks_most_confident():
+    tester = HypothesisTesting()
+
+    result = tester.explore_unknown({"type": "unexpected_obstacle", "obstacle": "box"})
+    assert result["best_hypothesis"]["hypothesis"] == "Obstacle is movable"
+    assert result["confidence"] == 0.8
+    assert result["experiments_run"] == 3
+    assert len(tester.get_learning()) == 1
+    assert tester.explore_unknown({"type": "unknown"})["success"] is False
+
+
+def test_meta_strategy_caches_classification():
+    meta = MetaStrategy()
+    problem = {"description": "Bring me water", "context": {"seen_before": True}}
+
+    first = meta.select_strategy(problem)
+    second = meta.select_strategy(dict(problem))
+    assert first == second
+    assert first["problem_class"] == "routine"
+    assert meta.stats()["hits"] == 1
+    assert meta.stats()["misses"] == 1
+
+
+def test_meta_strategy_keyword_and_context_order():
+    meta = MetaStrategy()
+
+    assert meta.classify_problem({"description": "Teleport to the MOON"}) == "impossible"
+    assert meta.classify_problem({"description": "I can't reach it"}) == "impossible"
+    # An earlier classifier's context condition wins over a later keyword
+    problem = {"description": "a risky job", "context": {"feasible": False}}
+    assert meta.classify_problem(problem) == "impossible"
+    assert meta.classify_problem({"description": "sing a song"}) == "novel"
+
+
+def test_meta_strategy_unhashable_context():
+    meta = MetaStrategy()
+    problem = {"description": "do something", "context": {"items": ["a", "b"]}}
+
+    assert meta.classify_problem(problem) == "novel"
+    assert meta.stats()["size"] == 0
+
+
+def test_perspective_shifting_picks_best_balance():
+    shifter = PerspectiveShifting()
+
+    result = shifter.solve_from_multiple_views({"description": "clean the room"})
+    best = result["best_solution"]
+    assert result["perspectives_considered"] == 5
+    assert best["primary_perspective"] == "expert"
+    assert best["approach"] == "knowledge_driven"
+    assert best["overall_score"] == 0.4 * 0.3 + 0.9 * 0.7
+
+
+def test_serendipity_matches_only_patterns_for_object_state():
+    engine = SerendipityEngine()
+    state = {
+        "location": "kitchen",
+        "objects": [
+            {"name": "dirty_dish", "state": "dirty"},
+            {"name": "clean_dish", "state": "clean"},
+            {"name": "mystery"},
+        ],
+    }
+
+    result = engine.detect_opportunities(state)
+    assert result["opportunities_found"] == 1
+    assert result["opportunities"][0]["goal"] == "clean_dishes"
+
+
+def test_tool_improvisation_property_matching():
+    improviser = ToolImprovisation()
+    card = {"name": "card", "properties": ["rigid", "sharp", "flat"]}
+    string = {"name": "string", "properties": ["flexible", "long"]}
+
+    assert improviser.can_perform_function(card, "cut")
+    assert not improviser.can_perform_function(string, "cut")
+    assert not improviser.can_perform_function(card, "unknown_function")
+    assert improviser.calculate_confidence(card, "cut") == 0.8
+    assert improviser.calculate_confidence({"name": "knife"}, "cut") == 0.95
+
+    result = improviser.find_alternative_tool("cut", [string, card])
+    assert result["alternative"]["object"] == "card"
+    assert result["alternative"]["improvised"] is True
@@ -0,0 +1,25 @@
+from brain.goals import GoalPrioritizer
+from brain.goals.goal_prioritization import Goal
+
+
+def test_prioritize_orders_by_score():
+    goals = [
+        Goal("clean_room", urgency=0.3, importance=0.7),
+        Goal("charge_battery", urgency=0.9, importance=0.8, deadline=60),
+        Goal("water_plants", urgency=0.5, importance=0.4),
+    ]
+
+    prioritized = GoalPrioritizer().prioritize(goals)
+    assert [g.description for g in prioritized] == [
+        "charge_battery",
+        "water_plants",
+        "clean_room",
+    ]
+    assert [g.description for g in goals][0] == "clean_room"
+
+
+def test_prioritize_ties_keep_input_order():
+    goals = [Goal(f"goal_{i}", urgency=1.0, importance=1.0, deadline=i + 1) for i in range(5)]
+
+    # Every score is capped at 1.0, so the order is unchanged
+    assert GoalPrioritizer().prioritize(goals) == goals
@@ -1,3 +1,8 @@
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from brain.intent.llm_parser import LLMIntentParser
 from brain.intent.parser import IntentParser
 
 
@@ -28,3 +33,58 @@ def test_parse_grasp():
     goal = parser.parse("pick up the cup")
     assert goal.action == "grasp"
     assert goal.target == "cup"
+
+
+def test_parse_repeated_command_reuses_goal():
+    parser = IntentParser()
+    goal = parser.parse("bring me water")
+    assert IntentParser().parse("  Bring me WATER ") is goal
+
+    with pytest.raises(FrozenInstanceError):
+        goal.target = "juice"
+
+
+def test_llm_parse_batch_without_llm_matches_rules():
+    parser = LLMIntentParser(use_llm=False)
+    commands = ["bring water", "clean the room", "go to kitchen"]
+
+    assert parser.parse_batch(commands) == [IntentParser().parse(c) for c in commands]
+    assert parser.parse_batch([]) == []
+
+
+def test_llm_parse_batch_splits_numbered_reply(monkeypatch):
+    parser = LLMIntentParser(use_llm=False)
+    parser.llm_available = True
+    prompts = []
+
+    def fake_generate(prompt, num_predict):
+        prompts.append(prompt)
+        return "1. bring\n2) Entertain\n4: navigate\nnoise"
+
+    monkeypatch.setattr(parser, "_generate", fake_generate)
+    goals = parser.parse_batch(["I'm thirsty", "tell a joke", "go to kitchen", "x"])
+
+    assert len(prompts) == 1
+    assert (goals[0].action, goals[0].target) == ("bring", "water")
+    assert (goals[1].action, goals[1].target) == ("entertain", "joke")
+    # No line for command 3, so it falls back to the rule-based parser
+    assert goals[2] == IntentParser().parse("go to kitchen")
+    assert goals[3].action == "navigate"
+
+
+def test_llm_parse_batch_chunks_large_batches(monkeypatch):
+    parser = LLMIntentParser(use_llm=False)
+    parser.llm_available = True
+    parser.max_batch_size = 2
+    budgets = []
+
+    def fake_generate(prompt, num_predict):
+        budgets.append(num_predict)
+        return "1. bring\n2. entertain"
+
+    monkeypatch.setattr(parser, "_generate", fake_generate)
+    goals = parser.parse_batch(["water", "joke", "water", "joke", "water"])
+
+    # Each request stays bounded instead of growing with the whole batch
+    assert budgets == [24, 24, 12]
+    assert [g.action for g in goals] == ["bring", "entertain", "bring", "entertain", "bring"]
@@ -1,4 +1,8 @@
+import pytest
+
 from brain.kernel import RobotBrainKernel
+from brain.memory.memory import Memory
+from brain.planner.actions import Action
 from brain.world.objects import WorldObject
 from brain.world.state import WorldState
 
@@ -24,3 +28,55 @@ def test_kernel_memory():
     history = kernel.memory.get_history()
     assert len(history) == 1
     assert history[0].success is True
+
+
+def test_kernel_process_many():
+    kernel = RobotBrainKernel()
+    world = WorldState(
+        objects=[WorldObject("water", "kitchen", "liquid")],
+        human_location="living room",
+    )
+
+    plans = kernel.process_many([("bring me water", world), ("go to kitchen", world)] * 2)
+    assert len(plans) == 4
+    assert plans[0] == plans[2] == kernel.process("bring me water", world)
+    assert plans[1][0].location == "kitchen"
+    assert len(kernel.memory.get_history()) == 5
+
+
+def test_kernel_memory_last():
+    kernel = RobotBrainKernel()
+    assert kernel.memory.last() is None
+    assert kernel.memory.history_len() == 0
+
+    kernel.process("go to kitchen", WorldState())
+    kernel.process("bring me water", WorldState())
+    assert kernel.memory.history_len() == 2
+    assert kernel.memory.last() is kernel.memory.get_history()[-1]
+
+
+def test_memory_history_is_bounded():
+    memory = Memory(maxlen=3)
+    for i in range(5):
+        memory.store(goal=f"goal {i}", plan=[])
+    assert memory.history_len() == 3
+    assert [r.goal for r in memory.get_history()] == ["goal 2", "goal 3", "goal 4"]
+
+
+def test_kernel_process_prepared_skips_supplied_stages():
+    kernel = RobotBrainKernel()
+    world = WorldState()
+    goal = kernel.intent_parser.parse("go to kitchen")
+    plan = kernel.planner.plan(goal, world)
+
+    assert kernel.process_prepared(world, goal=goal, plan=plan) is plan
+    assert kernel.memory.last().goal == str(goal)
+    assert kernel.process_prepared(world, human_input="go to kitchen") == plan
+
+
+def test_kernel_process_prepared_still_checks_safety():
+    kernel = RobotBrainKernel()
+    goal = kernel.intent_parser.parse("go to kitchen")
+    with pytest.raises(ValueError, match="Safety check failed"):
+        kernel.process_prepared(WorldState(), goal=goal, plan=[Action("harm")])
+    assert kernel.memory.history_len() == 0
@@ -0,0 +1,66 @@
+from brain.language import ContextUnderstanding, DialogueManager, ImplicitCommandParser
+
+
+def test_resolve_command_follows_context_updates():
+    context = ContextUnderstanding()
+    context.update_context("last_object", "cup")
+    context.update_context("current_location", "kitchen")
+
+    result = context.resolve_command("bring it here")
+    assert result["resolved"] == "bring cup kitchen"
+    assert result["references"] == [("it", "cup"), ("here", "kitchen")]
+    assert result["fully_resolved"] is True
+
+    result["references"].append(("there", "garage"))
+    assert context.resolve_command("bring it here")["references"] == [
+        ("it", "cup"),
+        ("here", "kitchen"),
+    ]
+
+    context.update_context("last_object", "plate")
+    assert context.resolve_command("bring it here")["resolved"] == "bring plate kitchen"
+    context.context["current_location"] = "hall"
+    assert context.resolve_command("bring it here")["resolved"] == "bring plate hall"
+
+
+def test_resolve_command_unknown_reference():
+    context = ContextUnderstanding()
+
+    result = context.resolve_command("put it down")
+    assert result["resolved"] == "put unknown_object down"
+    assert result["fully_resolved"] is False
+
+
+def test_resolve_command_unhashable_context_skips_cache():
+    context = ContextUnderstanding()
+    context.update_context("last_object", ["not", "hashable"])
+
+    result = context.resolve_command("come here")
+    assert result["resolved"] == "come unknown_location"
+    assert result["references"] == [("here", "unknown_location")]
+    assert context._resolution_cache == {}
+
+
+def test_implicit_command_pattern_order_wins():
+    parser = ImplicitCommandParser()
+
+    # Patterns are tried in insertion order, not by position in the statement
+    result = parser.parse("It's dark and I'm thirsty")
+    assert result["intent"] == "bring_water"
+    assert result["confidence"] == 0.85
+
+    parser.add_pattern("I'm Bored", "play_music")
+    assert parser.parse("i'm bored")["intent"] == "play_music"
+    assert parser.parse("what time is it")["is_implicit_command"] is False
+
+
+def test_dialogue_history_is_bounded():
+    dialogue = DialogueManager(max_history=3)
+    history = dialogue.history
+    for i in range(5):
+        dialogue.add_turn("user", f"utterance {i}", intent=f"intent_{i}" if i < 4 else None)
+
+    assert dialogue.history is history
+    assert [t.utterance for t in dialogue.history] == ["utterance 2", "utterance 3", "utterance 4"]
+    assert dialogue.get_context()[-1] == "user: utterance 4"
+    assert dialogue.last_user_intent() == "intent_3"
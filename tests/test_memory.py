@@ -0,0 +1,34 @@
+from brain.memory import EpisodicMemory, SemanticMemory
+
+
+def test_record_many_matches_record():
+    memory = EpisodicMemory(max_episodes=3)
+    memory.record("navigate", {"location": "hall"}, "success", True, 10.0)
+
+    batch = memory.record_many([
+        ("navigate", {"location": "kitchen"}, "success", True, 15.5),
+        ("navigate", {"location": "bedroom"}, "failure", False, 20.0),
+        ("grasp", {"object": "cup"}, "success", True, 2.0),
+    ])
+
+    assert len(batch) == 3
+    assert batch[0].timestamp == batch[-1].timestamp
+    assert [e.context for e in memory.episodes] == [
+        {"location": "kitchen"},
+        {"location": "bedroom"},
+        {"object": "cup"},
+    ]
+    assert memory.last_time("navigate").outcome == "failure"
+    assert memory.success_rate("navigate") == 0.5
+
+
+def test_learn_many_with_optional_confidence():
+    memory = SemanticMemory()
+
+    memory.learn_many([
+        ("kitchen", "has", "coffee_maker"),
+        ("kitchen", "has", "refrigerator", 0.4),
+    ])
+
+    assert memory.what_has("kitchen") == ["coffee_maker", "refrigerator"]
+    assert [t.confidence for t in memory.graph.triples] == [1.0, 0.4]
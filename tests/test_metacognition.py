@@ -0,0 +1,19 @@
+import pytest
+
+from brain.metacognition import ConfidenceCalibrator
+
+
+def test_calibration_error_by_bin():
+    calibrator = ConfidenceCalibrator()
+    assert calibrator.calibration_error() == 0.0
+
+    calibrator.record_outcome(0.9, True)
+    calibrator.record_outcome(0.95, False)
+    calibrator.record_outcome(0.3, False)
+    calibrator.record_outcome(1.0, True)
+
+    # Bin 9 (midpoint 0.95) saw 2 of 3 succeed; bin 3 (0.35) saw none
+    expected = (abs(0.95 - 2 / 3) + 0.35) / 10
+    assert calibrator.calibration_error() == pytest.approx(expected)
+    assert len(calibrator.predictions) == 4
+    assert calibrator.is_well_calibrated()
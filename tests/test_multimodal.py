@@ -0,0 +1,125 @@
+import pytest
+
+from brain.multimodal import (
+    AnomalyDetector,
+    AttentionMechanism,
+    CrossModalLearner,
+    SensorFusion,
+)
+
+
+def test_anomaly_detector_z_score():
+    detector = AnomalyDetector()
+    for value in [10, 11, 10, 12, 11]:
+        detector.record("temperature", value)
+
+    result = detector.is_anomaly("temperature", 25)
+    assert result["is_anomaly"] is True
+    assert result["mean"] == pytest.approx(10.8)
+    assert result["stdev"] == pytest.approx(0.83666, abs=1e-5)
+    assert result["z_score"] == pytest.approx((25 - 10.8) / result["stdev"])
+    assert detector.is_anomaly("temperature", 11)["is_anomaly"] is False
+
+
+def test_anomaly_detector_history_window():
+    detector = AnomalyDetector()
+    for value in range(150):
+        detector.record("load", value)
+
+    assert list(detector.history["load"]) == list(range(50, 150))
+    assert detector.is_anomaly("missing", 1.0)["reason"] == "insufficient_data"
+
+
+def test_anomaly_detector_constant_history():
+    detector = AnomalyDetector()
+    for _ in range(5):
+        detector.record("flat", 3.0)
+
+    assert detector.is_anomaly("flat", 3.0)["is_anomaly"] is False
+    assert detector.is_anomaly("flat", 4.0)["is_anomaly"] is True
+
+
+def test_sensor_fusion_requires_two_modalities():
+    fusion = SensorFusion()
+
+    result = fusion.fuse(
+        {"object_detected": True, "confidence": 0.8, "properties": {"color": "red"}},
+        {"sound_detected": True, "confidence": 0.7},
+        {"contact_detected": False, "confidence": 0.0},
+    )
+    assert result["object_detected"] is True
+    assert result["confidence"] == pytest.approx(0.75)
+    assert result["object_properties"] == {"color": "red"}
+
+    result = fusion.fuse({}, {"sound_detected": True}, {})
+    assert result["object_detected"] is False
+    assert result["confidence"] == 0.5
+
+
+def test_sensor_fusion_weighted_confidences():
+    fusion = SensorFusion()
+
+    assert fusion.fuse_confidences([0.9, 0.6, 0.3, 0.2]) == pytest.approx(0.5)
+    assert fusion.fuse_confidences([0.9, 0.3], [3.0, 1.0]) == pytest.approx(0.75)
+    assert fusion.fuse_confidences([]) == 0.0
+    assert fusion.fuse_confidences([0.4], [0.0]) == 0.0
+
+
+def test_attention_focus_top_k():
+    attention = AttentionMechanism()
+    inputs = [
+        {"type": "book", "location": "shelf"},
+        {"type": "cup", "location": "table"},
+        {"type": "cup", "location": "shelf"},
+        {"type": "plate", "location": "table"},
+    ]
+
+    assert attention.focus(inputs, "get cup", top_k=1) == [inputs[1]]
+    assert attention.focus(inputs, "cup on shelf", top_k=2) == [inputs[2], inputs[0]]
+    assert attention.focus(inputs, "get cup", top_k=10) == [
+        inp for inp, _ in attention.compute_attention(inputs, "get cup")
+    ]
+    assert attention.focus(inputs, "get cup", top_k=0) == []
+
+
+def test_cross_modal_infer_concept():
+    learner = CrossModalLearner()
+    learner.associate("apple", "vision", "red")
+    learner.associate("banana", "vision", "yellow")
+    learner.associate("cherry", "vision", "red")
+    learner.associate("apple", "sound", "crunchy")
+
+    assert learner.query("apple", "vision") == "red"
+    assert learner.infer_concept("vision", "red") == ["apple", "cherry"]
+    assert learner.infer_concept("sound", "red") == []
+
+    # Reassigning moves the concept, and results keep first-association order
+    learner.associate("apple", "vision", "green")
+    assert learner.infer_concept("vision", "red") == ["cherry"]
+    learner.associate("banana", "vision", "red")
+    learner.associate("apple", "vision", "red")
+    assert learner.infer_concept("vision", "red") == ["apple", "banana", "cherry"]
+
+
+def test_cross_modal_unhashable_values():
+    learner = CrossModalLearner()
+    learner.associate("rainbow", "vision", ["red", "blue"])
+
+    assert learner.infer_concept("vision", ["red", "blue"]) == ["rainbow"]
+    learner.associate("rainbow", "vision", "striped")
+    assert learner.infer_concept("vision", "striped") == ["rainbow"]
+
+
+def test_sensor_fusion_weights_must_match_confidences():
+    with pytest.raises(ValueError):
+        SensorFusion().fuse_confidences([0.9, 0.1], [1.0, 1.0, 10.0])
+
+
+def test_cross_modal_sees_direct_association_edits():
+    learner = CrossModalLearner()
+    learner.associate("apple", "vision", "red")
+
+    learner.associations["apple"]["vision"] = "green"
+    learner.associations["cherry"] = {"vision": "red"}
+    assert learner.infer_concept("vision", "red") == ["cherry"]
+    assert learner.infer_concept("vision", "green") == ["apple"]
@@ -29,3 +29,53 @@ def test_plan_navigate():
     assert len(plan) == 1
     assert plan[0].action_type == "navigate_to"
     assert plan[0].location == "kitchen"
+
+
+def test_plan_cache_keyed_on_world():
+    planner = Planner()
+    goal = Goal(action="bring", target="water", recipient="human")
+    world = WorldState(
+        objects=[WorldObject("water", "kitchen", "liquid")],
+        human_location="living room"
+    )
+
+    first = planner.plan(goal, world)
+    first.append("mutated")
+    second = planner.plan(goal, world)
+    assert len(second) == 4
+
+    moved = WorldState(
+        objects=[WorldObject("water", "bedroom", "liquid")],
+        human_location="living room"
+    )
+    assert planner.plan(goal, moved)[0].location == "bedroom"
+
+
+def test_plan_follows_in_place_world_edits():
+    planner = Planner()
+    goal = Goal(action="bring", target="water", recipient="human")
+    world = WorldState(
+        objects=[WorldObject("water", "kitchen", "liquid")],
+        human_location="living room"
+    )
+
+    assert planner.plan(goal, world)[0].location == "kitchen"
+    world.objects[0].location = "bedroom"
+    assert planner.plan(goal, world)[0].location == "bedroom"
+
+
+def test_plan_edits_do_not_leak_into_cache():
+    planner = Planner()
+    goal = Goal(action="bring", target="water", recipient="human")
+    world = WorldState(
+        objects=[WorldObject("water", "kitchen", "liquid")],
+        human_location="living room"
+    )
+
+    plan = planner.plan(goal, world)
+    plan[0].location = "garage"
+    plan[1].parameters["force"] = 99
+
+    again = planner.plan(goal, world)
+    assert again[0].location == "kitchen"
+    assert "force" not in again[1].parameters
@@ -0,0 +1,20 @@
+from datetime import timedelta
+
+from brain.planning import DeadlineManager
+
+
+def test_deadline_checks_share_cycle_clock():
+    manager = DeadlineManager()
+    now = manager.begin_cycle()
+    deadline = now + timedelta(minutes=10)
+
+    first = manager.check_deadline(deadline, 300)
+    second = manager.check_deadline(deadline, 900)
+    assert first["time_remaining"] == second["time_remaining"] == 600.0
+    assert first["can_meet_deadline"] is True
+    assert first["urgency"] == 0.0
+    assert second["can_meet_deadline"] is False
+    assert second["urgency"] == 1.0 - 600 / 900
+
+    manager.end_cycle()
+    assert manager.check_deadline(deadline, 300)["time_remaining"] < 600.0
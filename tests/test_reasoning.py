@@ -0,0 +1,33 @@
+import math
+
+from brain.reasoning import SpatialReasoner
+
+
+def _room():
+    spatial = SpatialReasoner()
+    spatial.add_object("cup", 1.0, 2.0, 0.5, (0.1, 0.1, 0.15))
+    spatial.add_object("table", 1.0, 2.0, 0.0, (1.0, 1.0, 0.05))
+    spatial.add_object("door", 4.0, 6.0, 0.0, (1.0, 0.1, 2.0))
+    return spatial
+
+
+def test_distances_from_matches_distance():
+    spatial = _room()
+
+    distances = spatial.distances_from("cup")
+    assert set(distances) == {"table", "door"}
+    for other, dist in distances.items():
+        assert math.isclose(dist, spatial.distance("cup", other))
+    assert spatial.distances_from("missing") == {}
+    assert spatial.distance("cup", "missing") == float("inf")
+
+
+def test_nearest_and_relations():
+    spatial = _room()
+
+    assert spatial.find_nearest("cup") == "table"
+    assert spatial.find_nearest("missing") is None
+    relations = spatial.get_spatial_relations("cup")
+    assert relations["nearest"] == "table"
+    assert relations["next_to"] == ["table"]
+    assert relations["on_top_of"] == ["table"]
@@ -0,0 +1,58 @@
+"""Tests for SafetyValidator"""
+
+from brain.planner.actions import Action
+from brain.safety.rules import SafetyValidator
+
+
+def test_validate_accepts_safe_plan():
+    """Plan without forbidden actions passes"""
+    validator = SafetyValidator()
+    plan = [Action("navigate_to", location="kitchen"), Action("grasp", target="cup")]
+    assert validator.validate(plan) == (True, "PASS")
+
+
+def test_validate_rejects_forbidden_action():
+    """Plan containing a forbidden action is rejected"""
+    validator = SafetyValidator()
+    plan = [Action("harm", target="something")]
+    assert validator.validate(plan) == (False, "Forbidden action: harm")
+
+
+def test_validate_respects_rule_changes():
+    """Changing forbidden actions applies to later validations"""
+    validator = SafetyValidator()
+    plan = [Action("dance")]
+    assert validator.validate(plan)[0]
+
+    validator.forbidden_actions = ["dance"]
+    assert not validator.validate(plan)[0]
+
+
+def test_forbidden_actions_stored_as_frozenset():
+    """Forbidden actions are kept in a frozenset, even when assigned a list"""
+    validator = SafetyValidator()
+    assert isinstance(validator.forbidden_actions, frozenset)
+
+    validator.forbidden_actions = ["harm", "harm", "kick"]
+    assert validator.forbidden_actions == frozenset({"harm", "kick"})
+
+
+def test_validate_rejects_long_plan_before_scanning():
+    """Oversized plans are rejected on length even if they contain forbidden actions"""
+    validator = SafetyValidator()
+    plan = [Action("harm")] * (validator.max_actions + 5)
+    valid, msg = validator.validate(plan)
+    assert not valid
+    assert msg == f"Plan too long ({validator.max_actions + 5} > {validator.max_actions})"
+
+
+def test_validate_batch_matches_validate():
+    """validate_batch returns the same verdicts as validate, in order"""
+    validator = SafetyValidator()
+    plans = [
+        [Action("navigate_to", location="kitchen")],
+        [Action("harm", target="something")],
+        [Action("navigate_to", location="kitchen")] * 25,
+        [],
+    ]
+    assert validator.validate_batch(plans) == [validator.validate(p) for p in plans]
@@ -0,0 +1,22 @@
+from brain.uncertainty import BeliefTracker
+
+
+def test_belief_tracker_most_likely():
+    beliefs = BeliefTracker()
+    assert beliefs.most_likely("cup_location") is None
+
+    beliefs.update_belief("cup_location", "kitchen", 0.7)
+    beliefs.update_belief("cup_location", "table", 0.3)
+    assert beliefs.most_likely("cup_location") == ("kitchen", 0.7)
+
+    beliefs.update_belief("cup_location", "table", 0.9)
+    assert beliefs.most_likely("cup_location") == ("table", 0.9)
+    assert beliefs.get_belief("cup_location") == {"kitchen": 0.7, "table": 0.9}
+
+
+def test_belief_tracker_ties_pick_first_value():
+    beliefs = BeliefTracker()
+    beliefs.update_belief("door", "open", 0.5)
+    beliefs.update_belief("door", "closed", 0.5)
+
+    assert beliefs.most_likely("door") == ("open", 0.5)
@@ -109,3 +109,34 @@ def test_world_state_with_relations():
     is_valid, _ = validate_world_state(state)
     assert is_valid
     assert state.relations["cup"]["on"] == "table"
+
+
+def test_world_state_signature_tracks_changes():
+    """signature() follows changes to objects and locations"""
+    state = WorldState(objects=[WorldObject("cup", "kitchen", "container")])
+    sig = state.signature()
+    assert state.signature() == sig
+
+    state.objects[0].location = "bedroom"
+    moved = state.signature()
+    assert moved != sig
+
+    state.robot_location = "kitchen"
+    assert state.signature() != moved
+
+    state.objects.append(WorldObject("book", "shelf", "item"))
+    state.objects.pop()
+    assert state.signature() == (
+        (("cup", "bedroom", "container"),), "kitchen", "unknown", ()
+    )
+
+
+def test_world_state_copies_locations():
+    """Interning locations leaves the caller's sequence untouched"""
+    locations = ["kitchen", "bedroom"]
+    state = WorldState(locations=locations)
+    state.locations.append("garage")
+    assert locations == ["kitchen", "bedroom"]
+
+    state = WorldState(locations=("kitchen", "bedroom"))  # type: ignore[arg-type]
+    assert state.locations == ["kitchen", "bedroom"]